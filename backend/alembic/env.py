@@ -7,7 +7,7 @@ from app.core.config import settings
 from app.core.database import Base
 
 # Import all models so Alembic can detect them
-from app.models import Board, Card, List, User  # noqa: F401
+from app.models import Activity, Board, Card, IdempotencyKey, List, User  # noqa: F401
 
 # Alembic Config object
 config = context.config
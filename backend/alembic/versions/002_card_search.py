@@ -0,0 +1,95 @@
+"""card_search
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+Full-text search over card titles and descriptions.
+PostgreSQL: generated tsvector column + GIN index.
+SQLite: external-content FTS5 table kept in sync by triggers.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            """
+            ALTER TABLE cards ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            ) STORED
+            """
+        )
+        op.execute(
+            'CREATE INDEX ix_cards_search_vector ON cards USING gin (search_vector)'
+        )
+        return
+
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE cards_fts USING fts5(
+            title, description, content='cards', content_rowid='rowid'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_ai AFTER INSERT ON cards
+        WHEN new.deleted_at IS NULL BEGIN
+            INSERT INTO cards_fts(rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_ad AFTER DELETE ON cards
+        WHEN old.deleted_at IS NULL BEGIN
+            INSERT INTO cards_fts(cards_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_au
+        AFTER UPDATE OF title, description, deleted_at ON cards BEGIN
+            INSERT INTO cards_fts(cards_fts, rowid, title, description)
+            SELECT 'delete', old.rowid, old.title, old.description
+            WHERE old.deleted_at IS NULL;
+            INSERT INTO cards_fts(rowid, title, description)
+            SELECT new.rowid, new.title, new.description
+            WHERE new.deleted_at IS NULL;
+        END
+        """
+    )
+    # Index existing live cards
+    op.execute(
+        """
+        INSERT INTO cards_fts(rowid, title, description)
+        SELECT rowid, title, description FROM cards WHERE deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_cards_search_vector')
+        op.execute('ALTER TABLE cards DROP COLUMN IF EXISTS search_vector')
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS cards_fts_au')
+    op.execute('DROP TRIGGER IF EXISTS cards_fts_ad')
+    op.execute('DROP TRIGGER IF EXISTS cards_fts_ai')
+    op.execute('DROP TABLE IF EXISTS cards_fts')
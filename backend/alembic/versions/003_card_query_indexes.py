@@ -0,0 +1,50 @@
+"""card_query_indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+Partial composite indexes for the filtered card query API
+(GET /api/v1/cards). All cover live cards only and end with the
+(created_at, id) keyset order where applicable.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LIVE = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_cards_board_created', 'cards', ['board_id', 'created_at', 'id'],
+        postgresql_where=_LIVE, sqlite_where=_LIVE,
+    )
+    op.create_index(
+        'ix_cards_list_created', 'cards', ['list_id', 'created_at', 'id'],
+        postgresql_where=_LIVE, sqlite_where=_LIVE,
+    )
+    op.create_index(
+        'ix_cards_board_updated', 'cards', ['board_id', 'updated_at'],
+        postgresql_where=_LIVE, sqlite_where=_LIVE,
+    )
+    op.create_index(
+        'ix_cards_board_title', 'cards', ['board_id', 'title'],
+        postgresql_ops={'title': 'text_pattern_ops'},
+        postgresql_where=_LIVE, sqlite_where=_LIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cards_board_title', table_name='cards')
+    op.drop_index('ix_cards_board_updated', table_name='cards')
+    op.drop_index('ix_cards_list_created', table_name='cards')
+    op.drop_index('ix_cards_board_created', table_name='cards')
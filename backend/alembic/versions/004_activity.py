@@ -0,0 +1,43 @@
+"""activity
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+Append-only activity log written in batches by the activity buffer.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'activity',
+        sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('board_id', sa.Uuid(), nullable=False),
+        sa.Column('actor_id', sa.Uuid(), nullable=False),
+        sa.Column('action', sa.String(50), nullable=False),
+        sa.Column('entity_id', sa.Uuid(), nullable=True),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['board_id'], ['boards.id']),
+        sa.ForeignKeyConstraint(['actor_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_activity_board_created', 'activity', ['board_id', 'created_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_activity_board_created', table_name='activity')
+    op.drop_table('activity')
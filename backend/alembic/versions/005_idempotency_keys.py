@@ -0,0 +1,41 @@
+"""idempotency keys
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+Stored responses for the database-backed idempotency store
+(IDEMPOTENCY_BACKEND=database).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('scope', sa.String(300), nullable=False),
+        sa.Column('fingerprint', sa.String(64), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('headers', sa.JSON(), nullable=True),
+        sa.Column('body', sa.LargeBinary(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('scope'),
+    )
+    op.create_index(
+        'ix_idempotency_keys_created_at', 'idempotency_keys', ['created_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_idempotency_keys_created_at', table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,66 @@
+"""uuid7 defaults
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+Time-ordered UUIDv7 server defaults for primary keys. The application
+generates ids itself (app.core.ids.uuid7); the server default covers rows
+inserted directly in SQL, e.g. INSERT ... SELECT in board duplication.
+Existing v4 ids are left as they are.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'boards', 'lists', 'cards', 'activity')
+
+
+def upgrade() -> None:
+    # 48-bit Unix milliseconds over the first bytes of a random v4 UUID,
+    # then the version nibble set to 7 (bits 52 and 53)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(
+                                    floor(
+                                        extract(epoch FROM clock_timestamp()) * 1000
+                                    )::bigint
+                                )
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    for table in TABLES:
+        op.alter_column(
+            table, 'id', server_default=sa.text('uuid_generate_v7()')
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    op.execute('DROP FUNCTION IF EXISTS uuid_generate_v7()')
@@ -0,0 +1,130 @@
+"""partition cards
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+Optional: converts `cards` into a table hash-partitioned on `board_id`.
+Runs only on PostgreSQL and only when requested:
+
+    alembic -x partition_cards=true upgrade head
+    alembic -x partition_cards=true -x card_partitions=32 upgrade head
+
+Without the flag this revision is a no-op. The conversion copies every row,
+so run it in a maintenance window. Unique constraints on a partitioned table
+must contain the partition key, hence:
+
+- primary key (id) becomes (id, board_id);
+- uq_card_list_rank (list_id, rank) becomes (board_id, list_id, rank), which
+  is equivalent because a list belongs to exactly one board.
+
+The ORM maps (id, board_id) as the card identity and all card queries in
+card_service/board_service filter on board_id, so they prune to one partition.
+Downgrade converts back only if the table is partitioned.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEFAULT_PARTITIONS = 16
+# Stored columns (search_vector is generated and recomputed on insert)
+COLUMNS = (
+    'id, list_id, board_id, title, description, rank, '
+    'created_at, updated_at, deleted_at'
+)
+_LIVE = sa.text('deleted_at IS NULL')
+
+
+def _is_partitioned() -> bool:
+    bind = op.get_bind()
+    return bool(
+        bind.execute(
+            sa.text(
+                "SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('cards')"
+            )
+        ).scalar()
+    )
+
+
+def _create_indexes() -> None:
+    """Secondary indexes from 001-003; on a partitioned table each cascades to every partition."""
+    op.create_index('ix_cards_list_id', 'cards', ['list_id'])
+    op.create_index('ix_cards_board_id', 'cards', ['board_id'])
+    op.execute(
+        'CREATE INDEX ix_cards_search_vector ON cards USING gin (search_vector)'
+    )
+    op.create_index(
+        'ix_cards_board_created', 'cards', ['board_id', 'created_at', 'id'],
+        postgresql_where=_LIVE,
+    )
+    op.create_index(
+        'ix_cards_list_created', 'cards', ['list_id', 'created_at', 'id'],
+        postgresql_where=_LIVE,
+    )
+    op.create_index(
+        'ix_cards_board_updated', 'cards', ['board_id', 'updated_at'],
+        postgresql_where=_LIVE,
+    )
+    op.create_index(
+        'ix_cards_board_title', 'cards', ['board_id', 'title'],
+        postgresql_ops={'title': 'text_pattern_ops'},
+        postgresql_where=_LIVE,
+    )
+
+
+def _copy_into(create_sql: str, *after_create: str) -> None:
+    """Build `cards_new`, copy all rows, and swap it in for `cards`."""
+    op.execute(create_sql)
+    for statement in after_create:
+        op.execute(statement)
+    op.execute(f'INSERT INTO cards_new ({COLUMNS}) SELECT {COLUMNS} FROM cards')
+    op.execute('DROP TABLE cards')
+    op.execute('ALTER TABLE cards_new RENAME TO cards')
+    op.create_foreign_key(None, 'cards', 'lists', ['list_id'], ['id'])
+    op.create_foreign_key(None, 'cards', 'boards', ['board_id'], ['id'])
+
+
+def upgrade() -> None:
+    args = context.get_x_argument(as_dictionary=True)
+    if args.get('partition_cards', '').lower() not in ('1', 'true', 'yes'):
+        return
+    if op.get_bind().dialect.name != 'postgresql' or _is_partitioned():
+        return
+    partitions = int(args.get('card_partitions', DEFAULT_PARTITIONS))
+
+    _copy_into(
+        'CREATE TABLE cards_new (LIKE cards INCLUDING DEFAULTS INCLUDING GENERATED) '
+        'PARTITION BY HASH (board_id)',
+        *(
+            f'CREATE TABLE cards_p{i:02d} PARTITION OF cards_new '
+            f'FOR VALUES WITH (MODULUS {partitions}, REMAINDER {i})'
+            for i in range(partitions)
+        ),
+    )
+    op.create_primary_key('cards_pkey', 'cards', ['id', 'board_id'])
+    op.create_unique_constraint(
+        'uq_card_list_rank', 'cards', ['board_id', 'list_id', 'rank']
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql' or not _is_partitioned():
+        return
+
+    # Dropping the partitioned parent drops its partitions
+    _copy_into(
+        'CREATE TABLE cards_new (LIKE cards INCLUDING DEFAULTS INCLUDING GENERATED)'
+    )
+    op.create_primary_key('cards_pkey', 'cards', ['id'])
+    op.create_unique_constraint('uq_card_list_rank', 'cards', ['list_id', 'rank'])
+    _create_indexes()
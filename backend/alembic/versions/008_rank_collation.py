@@ -0,0 +1,44 @@
+"""rank collation
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+Byte-order ("C") collation for lists.rank and cards.rank on PostgreSQL, so
+ORDER BY rank, the rank unique constraints and range predicates agree with
+the bytewise string comparisons in LexoRank and avoid locale-aware
+comparison. Changing the collation rebuilds uq_list_board_rank and
+uq_card_list_rank (on every partition if cards is partitioned).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _set_rank_type(rank_type: sa.String) -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in ('lists', 'cards'):
+        op.alter_column(
+            table,
+            'rank',
+            type_=rank_type,
+            existing_type=sa.String(255),
+            existing_nullable=False,
+        )
+
+
+def upgrade() -> None:
+    _set_rank_type(sa.String(255, collation='C'))
+
+
+def downgrade() -> None:
+    _set_rank_type(sa.String(255))
@@ -0,0 +1,42 @@
+"""list card counts and WIP limits
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+Adds lists.card_count (live cards in the list, maintained by the card
+services) and the optional lists.wip_limit, then backfills the counts with
+one set-based UPDATE. The same UPDATE is available afterwards as
+`python -m scripts.repair_card_counts`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'lists',
+        sa.Column('card_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column('lists', sa.Column('wip_limit', sa.Integer(), nullable=True))
+    op.execute(
+        'UPDATE lists SET card_count = ('
+        'SELECT count(*) FROM cards '
+        'WHERE cards.board_id = lists.board_id '
+        'AND cards.list_id = lists.id '
+        'AND cards.deleted_at IS NULL)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('lists', 'wip_limit')
+    op.drop_column('lists', 'card_count')
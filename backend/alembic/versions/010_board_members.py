@@ -0,0 +1,47 @@
+"""board members
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+Board sharing: one row per (user, board) with a role ("viewer", "editor"
+or "owner"). The primary key leads with user_id, which is the lookup every
+access check makes. Every existing board's owner becomes an owner member.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'board_members',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('board_id', sa.Uuid(), nullable=False),
+        sa.Column('role', sa.String(20), nullable=False),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True),
+            server_default=sa.text('now()'), nullable=False,
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['board_id'], ['boards.id']),
+        sa.PrimaryKeyConstraint('user_id', 'board_id'),
+    )
+    op.create_index('ix_board_members_board_id', 'board_members', ['board_id'])
+    op.execute(
+        "INSERT INTO board_members (user_id, board_id, role, created_at) "
+        "SELECT owner_id, id, 'owner', created_at FROM boards"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_board_members_board_id', table_name='board_members')
+    op.drop_table('board_members')
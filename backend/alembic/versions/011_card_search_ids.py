@@ -0,0 +1,146 @@
+"""card search ids
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+SQLite only: re-key the FTS5 card index on a stable id. The external-content
+table from 002 used the implicit rowid of `cards`, whose primary key is a
+UUID; VACUUM may renumber such rowids and silently detach the index. The
+index now stores its own content, and its rowid is the INTEGER PRIMARY KEY
+of `cards_fts_ids`, which maps it to the card id. PostgreSQL is unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_index() -> None:
+    op.execute('DROP TRIGGER IF EXISTS cards_fts_au')
+    op.execute('DROP TRIGGER IF EXISTS cards_fts_ad')
+    op.execute('DROP TRIGGER IF EXISTS cards_fts_ai')
+    op.execute('DROP TABLE IF EXISTS cards_fts')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _drop_index()
+    op.execute(
+        """
+        CREATE TABLE cards_fts_ids (
+            id INTEGER PRIMARY KEY,
+            card_id CHAR(32) NOT NULL UNIQUE
+        )
+        """
+    )
+    op.execute('CREATE VIRTUAL TABLE cards_fts USING fts5(title, description)')
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_ai AFTER INSERT ON cards
+        WHEN new.deleted_at IS NULL BEGIN
+            INSERT INTO cards_fts_ids(card_id) VALUES (new.id);
+            INSERT INTO cards_fts(rowid, title, description)
+            VALUES (last_insert_rowid(), new.title, new.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_ad AFTER DELETE ON cards
+        WHEN old.deleted_at IS NULL BEGIN
+            DELETE FROM cards_fts WHERE rowid =
+                (SELECT id FROM cards_fts_ids WHERE card_id = old.id);
+            DELETE FROM cards_fts_ids WHERE card_id = old.id;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_au
+        AFTER UPDATE OF title, description, deleted_at ON cards BEGIN
+            DELETE FROM cards_fts WHERE rowid =
+                (SELECT id FROM cards_fts_ids WHERE card_id = old.id);
+            DELETE FROM cards_fts_ids WHERE card_id = old.id;
+            INSERT INTO cards_fts_ids(card_id)
+            SELECT new.id WHERE new.deleted_at IS NULL;
+            INSERT INTO cards_fts(rowid, title, description)
+            SELECT last_insert_rowid(), new.title, new.description
+            WHERE new.deleted_at IS NULL;
+        END
+        """
+    )
+    # Index existing live cards
+    op.execute(
+        """
+        INSERT INTO cards_fts_ids(card_id)
+        SELECT id FROM cards WHERE deleted_at IS NULL
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO cards_fts(rowid, title, description)
+        SELECT ids.id, cards.title, cards.description
+        FROM cards_fts_ids AS ids JOIN cards ON cards.id = ids.card_id
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    _drop_index()
+    op.execute('DROP TABLE IF EXISTS cards_fts_ids')
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE cards_fts USING fts5(
+            title, description, content='cards', content_rowid='rowid'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_ai AFTER INSERT ON cards
+        WHEN new.deleted_at IS NULL BEGIN
+            INSERT INTO cards_fts(rowid, title, description)
+            VALUES (new.rowid, new.title, new.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_ad AFTER DELETE ON cards
+        WHEN old.deleted_at IS NULL BEGIN
+            INSERT INTO cards_fts(cards_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER cards_fts_au
+        AFTER UPDATE OF title, description, deleted_at ON cards BEGIN
+            INSERT INTO cards_fts(cards_fts, rowid, title, description)
+            SELECT 'delete', old.rowid, old.title, old.description
+            WHERE old.deleted_at IS NULL;
+            INSERT INTO cards_fts(rowid, title, description)
+            SELECT new.rowid, new.title, new.description
+            WHERE new.deleted_at IS NULL;
+        END
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO cards_fts(rowid, title, description)
+        SELECT rowid, title, description FROM cards WHERE deleted_at IS NULL
+        """
+    )
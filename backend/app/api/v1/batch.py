@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.deps import CurrentUser
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.services import batch_service
+
+router = APIRouter(prefix="/api/v1/batch", tags=["batch"])
+
+
+@router.post("/", response_model=BatchResponse)
+async def execute_batch(
+    data: BatchRequest,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Run list/card operations in order in one transaction (all or nothing)."""
+    return await batch_service.execute_batch(db, data.operations, current_user.id)
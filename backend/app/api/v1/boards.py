@@ -1,12 +1,24 @@
 import uuid
+from typing import Literal
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import CurrentUser
-from app.schemas.board import BoardCreate, BoardDetailOut, BoardOut, BoardUpdate
-from app.services import board_service
+from app.core.fields import all_fields, parse_fields, project
+from app.core.formats import render
+from app.schemas.activity import ActivityPage
+from app.schemas.board import (
+    BoardCreate,
+    BoardDetailOut,
+    BoardDuplicate,
+    BoardOut,
+    BoardSummaryOut,
+    BoardUpdate,
+)
+from app.services import activity_service, board_service, export_service
 
 router = APIRouter(prefix="/api/v1/boards", tags=["boards"])
 
@@ -30,14 +42,86 @@ async def create_board(
     return await board_service.create_board(db, data, current_user.id)
 
 
+@router.post(
+    "/import", response_model=BoardOut, status_code=status.HTTP_201_CREATED
+)
+async def import_board(
+    request: Request,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Create a board from an NDJSON export, parsed and inserted in batches."""
+    return await export_service.import_board(db, request.stream(), current_user.id)
+
+
 @router.get("/{board_id}", response_model=BoardDetailOut)
 async def get_board_detail(
+    board_id: uuid.UUID,
+    request: Request,
+    current_user: CurrentUser,
+    mode: Literal["full", "summary"] = "full",
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get board with all active lists and cards (3 queries, no N+1).
+
+    `mode=summary` leaves out card descriptions (`BoardSummaryOut`); fetch
+    them per card with `GET /api/v1/cards/{id}`. `fields` picks a subset,
+    e.g. `fields=id,lists.id,lists.cards.title`, and `Accept:
+    application/msgpack` returns MessagePack.
+    """
+    schema = BoardSummaryOut if mode == "summary" else BoardDetailOut
+    tree = parse_fields(fields, schema) or all_fields(schema)
+    board = await board_service.get_board_detail(
+        db, board_id, current_user.id, fields=tree
+    )
+    return render(request, project(board, tree))
+
+
+@router.get("/{board_id}/export")
+async def export_board(
+    board_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream the board as NDJSON: board, then lists, then cards."""
+    board = await board_service.get_board(db, board_id, current_user.id)
+    return StreamingResponse(
+        export_service.stream_board_export(board),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/{board_id}/activity", response_model=ActivityPage)
+async def get_board_activity(
+    board_id: uuid.UUID,
+    current_user: CurrentUser,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Audit trail of card and list changes on the board, newest first."""
+    return await activity_service.get_activity(
+        db, board_id, current_user.id, limit, cursor
+    )
+
+
+@router.post(
+    "/{board_id}/duplicate",
+    response_model=BoardDetailOut,
+    status_code=status.HTTP_201_CREATED,
+)
+async def duplicate_board(
     board_id: uuid.UUID,
     current_user: CurrentUser,
     db: AsyncSession = Depends(get_db),
+    data: BoardDuplicate | None = None,
 ):
-    """Get board with all active lists and cards (single query, no N+1)."""
-    return await board_service.get_board_detail(db, board_id, current_user.id)
+    """Copy a board with its active lists and cards in one transaction."""
+    return await board_service.duplicate_board(
+        db, board_id, current_user.id, data or BoardDuplicate()
+    )
 
 
 @router.patch("/{board_id}", response_model=BoardOut)
@@ -1,17 +1,46 @@
 import uuid
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import CurrentUser
+from app.core.fields import all_fields, parse_fields, project
+from app.core.formats import render
 from app.schemas.board import CardOut
-from app.schemas.card import CardCreate, CardMove, CardUpdate
+from app.schemas.card import CardBulkMove, CardCreate, CardMove, CardPage, CardUpdate
 from app.services import card_service
 
 router = APIRouter(prefix="/api/v1/cards", tags=["cards"])
 
 
+@router.get("/", response_model=CardPage)
+async def query_cards(
+    current_user: CurrentUser,
+    board_id: uuid.UUID | None = None,
+    list_id: uuid.UUID | None = None,
+    created_after: datetime | None = None,
+    updated_after: datetime | None = None,
+    title_prefix: str | None = Query(None, max_length=500),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Filter cards on your boards with keyset pagination (slim projection)."""
+    return await card_service.query_cards(
+        db,
+        current_user.id,
+        board_id=board_id,
+        list_id=list_id,
+        created_after=created_after,
+        updated_after=updated_after,
+        title_prefix=title_prefix,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
 @router.post("/", response_model=CardOut, status_code=status.HTTP_201_CREATED)
 async def create_card(
     data: CardCreate,
@@ -22,15 +51,45 @@ async def create_card(
     return await card_service.create_card(db, data, current_user.id)
 
 
+@router.post("/move", response_model=list[CardOut])
+async def move_cards(
+    data: CardBulkMove,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Move several cards, across lists or boards, into one list in one transaction."""
+    return await card_service.move_cards(db, data, current_user.id)
+
+
+@router.get("/{card_id}", response_model=CardOut)
+async def get_card(
+    card_id: uuid.UUID,
+    request: Request,
+    current_user: CurrentUser,
+    board_id: uuid.UUID,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get one card with its description (`fields` and MessagePack as for boards)."""
+    tree = parse_fields(fields, CardOut) or all_fields(CardOut)
+    card = await card_service.get_card(
+        db, card_id, current_user.id, board_id=board_id, fields=tree
+    )
+    return render(request, project(card, tree))
+
+
 @router.patch("/{card_id}", response_model=CardOut)
 async def update_card(
     card_id: uuid.UUID,
     data: CardUpdate,
     current_user: CurrentUser,
+    board_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Update a card's title and/or description."""
-    return await card_service.update_card(db, card_id, current_user.id, data)
+    return await card_service.update_card(
+        db, card_id, current_user.id, data, board_id=board_id
+    )
 
 
 @router.post("/{card_id}/move", response_model=CardOut)
@@ -38,17 +97,23 @@ async def move_card(
     card_id: uuid.UUID,
     data: CardMove,
     current_user: CurrentUser,
+    board_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Move a card to a new position with concurrency-safe locking."""
-    return await card_service.move_card(db, card_id, data, current_user.id)
+    return await card_service.move_card(
+        db, card_id, data, current_user.id, board_id=board_id
+    )
 
 
 @router.delete("/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_card(
     card_id: uuid.UUID,
     current_user: CurrentUser,
+    board_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Soft delete a card."""
-    await card_service.soft_delete_card(db, card_id, current_user.id)
+    await card_service.soft_delete_card(
+        db, card_id, current_user.id, board_id=board_id
+    )
@@ -0,0 +1,108 @@
+import json
+import logging
+import uuid
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    WebSocketException,
+    status,
+)
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import EDITOR
+from app.core.database import get_db
+from app.core.deps import StreamUser
+from app.schemas.board import CardOut
+from app.schemas.command import Command, CommandAck
+from app.services import board_service, command_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/boards", tags=["commands"])
+
+
+@router.websocket("/{board_id}/commands")
+async def board_commands_socket(
+    websocket: WebSocket,
+    board_id: uuid.UUID,
+    current_user: StreamUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Persistent mutation channel for one board. Pass the JWT as `?token=`.
+
+    Authentication and the board check happen once per connection. Commands
+    are executed in the order received, so clients may pipeline them without
+    waiting; each gets an acknowledgement carrying its `seq`.
+    """
+    try:
+        await board_service.get_board(db, board_id, current_user.id, EDITOR)
+    except HTTPException:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+    await db.close()
+
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            ack = await _handle(db, board_id, message, current_user.id)
+            await websocket.send_text(ack.model_dump_json())
+    except WebSocketDisconnect:
+        pass
+
+
+async def _handle(
+    db: AsyncSession, board_id: uuid.UUID, message: str, owner_id: uuid.UUID
+) -> CommandAck:
+    """Execute one raw command and build its acknowledgement."""
+    try:
+        command = Command.model_validate_json(message)
+    except ValidationError as exc:
+        return _rejected(_raw_seq(message), exc)
+
+    try:
+        card = await command_service.execute_command(db, board_id, command, owner_id)
+        return CommandAck(seq=command.seq, ok=True, result=CardOut.model_validate(card))
+    except ValidationError as exc:
+        return _rejected(command.seq, exc)
+    except HTTPException as exc:
+        return CommandAck(
+            seq=command.seq, ok=False, status=exc.status_code, detail=exc.detail
+        )
+    except Exception:
+        # Fail this command only; the socket and the commands queued behind
+        # it carry on
+        logger.exception("Command %s on board %s failed", command.op, board_id)
+        await db.rollback()
+        return CommandAck(
+            seq=command.seq,
+            ok=False,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+    finally:
+        # Return the connection to the pool between commands
+        await db.close()
+
+
+def _rejected(seq: int, exc: ValidationError) -> CommandAck:
+    return CommandAck(
+        seq=seq,
+        ok=False,
+        status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=exc.errors()[0]["msg"],
+    )
+
+
+def _raw_seq(message: str) -> int:
+    """Best-effort seq for acknowledging a command that failed validation."""
+    try:
+        seq = json.loads(message).get("seq")
+    except (ValueError, AttributeError):
+        return 0
+    return seq if isinstance(seq, int) else 0
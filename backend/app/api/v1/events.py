@@ -0,0 +1,119 @@
+import asyncio
+import json
+import uuid
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketException,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.deps import StreamUser
+from app.core.events import Subscription, hub
+from app.services import board_service
+
+router = APIRouter(prefix="/api/v1/boards", tags=["events"])
+
+PING = {"type": "ping"}
+
+
+async def _next_event(subscription: Subscription) -> dict:
+    """Wait for the next event, returning a ping when the heartbeat interval elapses."""
+    try:
+        return await asyncio.wait_for(
+            subscription.get(), timeout=settings.EVENT_HEARTBEAT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        return PING
+
+
+def _ends_stream(event: dict) -> bool:
+    """Whether the board was deleted, alone or inside a coalesced batch."""
+    if event["type"] == "batch":
+        return any(inner["type"] == "board.deleted" for inner in event["events"])
+    return event["type"] == "board.deleted"
+
+
+@router.websocket("/{board_id}/events")
+async def board_events_socket(
+    websocket: WebSocket,
+    board_id: uuid.UUID,
+    current_user: StreamUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Push board events over a WebSocket. Pass the JWT as `?token=`."""
+    try:
+        await board_service.get_board(db, board_id, current_user.id)
+    except HTTPException:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+    # Release the pooled connection — the socket may stay open for hours
+    await db.close()
+    # Subscribe before accepting so no event after the access check is missed
+    subscription = hub.subscribe(board_id)
+
+    async def send_events():
+        while True:
+            event = await _next_event(subscription)
+            await websocket.send_json(event)
+            if _ends_stream(event):
+                return
+
+    async def wait_for_disconnect():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+    tasks: set[asyncio.Task] = set()
+    try:
+        await websocket.accept()
+        tasks = {
+            asyncio.create_task(send_events()),
+            asyncio.create_task(wait_for_disconnect()),
+        }
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
+
+
+@router.get("/{board_id}/events")
+async def board_events_stream(
+    board_id: uuid.UUID,
+    request: Request,
+    current_user: StreamUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Server-Sent Events fallback for clients that cannot open a WebSocket."""
+    await board_service.get_board(db, board_id, current_user.id)
+    await db.close()
+    # Subscribe before responding so no event after the access check is missed
+    subscription = hub.subscribe(board_id)
+
+    async def stream(subscription: Subscription):
+        try:
+            while not await request.is_disconnected():
+                event = await _next_event(subscription)
+                if event is PING:
+                    yield b": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+                if _ends_stream(event):
+                    return
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,12 +1,14 @@
 import uuid
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import CurrentUser
+from app.core.fields import all_fields, parse_fields, project
+from app.core.formats import render
 from app.schemas.board import ListOut
-from app.schemas.list import ListCreate, ListUpdate
+from app.schemas.list import ListCreate, ListMove, ListUpdate
 from app.services import list_service
 
 router = APIRouter(prefix="/api/v1/lists", tags=["lists"])
@@ -22,6 +24,20 @@ async def create_list(
     return await list_service.create_list(db, data, current_user.id)
 
 
+@router.get("/{list_id}", response_model=ListOut)
+async def get_list(
+    list_id: uuid.UUID,
+    request: Request,
+    current_user: CurrentUser,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a list with its cards (`fields` and MessagePack as for boards)."""
+    tree = parse_fields(fields, ListOut) or all_fields(ListOut)
+    lst = await list_service.get_list(db, list_id, current_user.id, fields=tree)
+    return render(request, project(lst, tree))
+
+
 @router.patch("/{list_id}", response_model=ListOut)
 async def update_list(
     list_id: uuid.UUID,
@@ -29,10 +45,21 @@ async def update_list(
     current_user: CurrentUser,
     db: AsyncSession = Depends(get_db),
 ):
-    """Update a list's title."""
+    """Update a list's title and/or WIP limit."""
     return await list_service.update_list(db, list_id, current_user.id, data)
 
 
+@router.post("/{list_id}/move", response_model=ListOut)
+async def move_list(
+    list_id: uuid.UUID,
+    data: ListMove,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Move a list to a new position on its board (one row updated)."""
+    return await list_service.move_list(db, list_id, data, current_user.id)
+
+
 @router.delete("/{list_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_list(
     list_id: uuid.UUID,
@@ -0,0 +1,45 @@
+import uuid
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.deps import CurrentUser
+from app.schemas.member import MemberCreate, MemberOut
+from app.services import member_service
+
+router = APIRouter(prefix="/api/v1/boards", tags=["members"])
+
+
+@router.get("/{board_id}/members", response_model=list[MemberOut])
+async def get_members(
+    board_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """List the users a board is shared with and their roles."""
+    return await member_service.get_members(db, board_id, current_user.id)
+
+
+@router.put("/{board_id}/members", response_model=MemberOut)
+async def add_member(
+    board_id: uuid.UUID,
+    data: MemberCreate,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Share a board with a user by email, or change their role (owners only)."""
+    return await member_service.add_member(db, board_id, current_user.id, data)
+
+
+@router.delete(
+    "/{board_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+async def remove_member(
+    board_id: uuid.UUID,
+    user_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: AsyncSession = Depends(get_db),
+):
+    """Remove a user from a board (owners only)."""
+    await member_service.remove_member(db, board_id, current_user.id, user_id)
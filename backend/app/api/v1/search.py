@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.deps import CurrentUser
+from app.schemas.search import SearchResults
+from app.services import search_service
+
+router = APIRouter(prefix="/api/v1/search", tags=["search"])
+
+
+@router.get("/", response_model=SearchResults)
+async def search_cards(
+    current_user: CurrentUser,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ranked full-text search over card titles and descriptions on your boards."""
+    return await search_service.search_cards(db, current_user.id, q, limit, offset)
@@ -0,0 +1,103 @@
+"""
+Board access checks through `board_members`.
+
+Each session carries one `BoardAccess` per user. The first check loads all
+of that user's memberships on live boards with a single range scan of the
+(user_id, board_id) primary key; every later check in the request is a dict
+lookup, however many boards, lists or cards it touches. Long-lived sessions
+(the WebSocket command channel) reload after `ACCESS_CACHE_TTL_SECONDS`, so
+a revoked membership takes effect without reconnecting.
+
+A user without a membership gets the caller's 404 (e.g. "Card not found"),
+so other users' ids are not revealed; a member whose role is too low for
+the operation gets 403.
+"""
+import time
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.board import Board
+from app.models.board_member import BoardMember
+
+VIEWER = "viewer"
+EDITOR = "editor"
+OWNER = "owner"
+ROLES = (VIEWER, EDITOR, OWNER)
+_LEVELS = {role: level for level, role in enumerate(ROLES)}
+
+
+def check_role(
+    role: str | None, required: str, detail: str = "Board not found"
+) -> None:
+    """Raise 404 (`detail`) without a membership, 403 if `role` is below `required`."""
+    if role is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    if _LEVELS[role] < _LEVELS[required]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Requires the {required} role on this board",
+        )
+
+
+class BoardAccess:
+    """One user's board roles, cached for the lifetime of a session."""
+
+    def __init__(self, db: AsyncSession, user_id: uuid.UUID, ttl: float):
+        self.db = db
+        self.user_id = user_id
+        self.ttl = ttl
+        self.loads = 0
+        self._roles: dict[uuid.UUID, str] | None = None
+        self._loaded_at = 0.0
+
+    async def roles(self) -> dict[uuid.UUID, str]:
+        """Role per live board the user is a member of."""
+        if self._roles is None or time.monotonic() - self._loaded_at > self.ttl:
+            result = await self.db.execute(
+                select(BoardMember.board_id, BoardMember.role)
+                .join(Board, Board.id == BoardMember.board_id)
+                .where(
+                    BoardMember.user_id == self.user_id,
+                    Board.deleted_at.is_(None),
+                )
+            )
+            self._roles = dict(result.tuples().all())
+            self._loaded_at = time.monotonic()
+            self.loads += 1
+        return self._roles
+
+    async def role(self, board_id: uuid.UUID) -> str | None:
+        return (await self.roles()).get(board_id)
+
+    async def require(
+        self,
+        board_id: uuid.UUID,
+        role: str = VIEWER,
+        detail: str = "Board not found",
+    ) -> None:
+        check_role(await self.role(board_id), role, detail)
+
+    def grant(self, board_id: uuid.UUID, role: str) -> None:
+        """Record a membership created in this session."""
+        if self._roles is not None:
+            self._roles[board_id] = role
+
+    def revoke(self, board_id: uuid.UUID) -> None:
+        """Forget a board deleted or left in this session."""
+        if self._roles is not None:
+            self._roles.pop(board_id, None)
+
+
+def board_access(db: AsyncSession, user_id: uuid.UUID) -> BoardAccess:
+    """The session's resolver for `user_id`, created on first use."""
+    resolvers = db.info.setdefault("board_access", {})
+    access = resolvers.get(user_id)
+    if access is None:
+        access = resolvers[user_id] = BoardAccess(
+            db, user_id, settings.ACCESS_CACHE_TTL_SECONDS
+        )
+    return access
@@ -0,0 +1,118 @@
+"""
+Write-behind buffer for the activity log.
+
+Services record activity after commit without touching the database; the
+buffer collects entries in memory and writes them with one multi-row INSERT
+every `ACTIVITY_FLUSH_INTERVAL_MS` or as soon as `ACTIVITY_FLUSH_MAX_EVENTS`
+entries are pending, whichever comes first. Pending entries are flushed on
+shutdown and before the activity endpoint reads.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.ids import uuid7
+from app.models.activity import Activity
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityBuffer:
+    """Collects activity rows in memory and inserts them in batches."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_ms: int,
+        max_events: int,
+    ):
+        self._session_factory = session_factory
+        self._interval = interval_ms / 1000
+        self._max_events = max_events
+        # Entries beyond this are dropped (and logged) if the database is down
+        self._max_pending = max_events * 50
+        self._pending: list[dict] = []
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def record(
+        self,
+        board_id: uuid.UUID,
+        actor_id: uuid.UUID,
+        action: str,
+        entity_id: uuid.UUID | None = None,
+        data: dict | None = None,
+    ) -> None:
+        """Buffer one entry. Never blocks and never touches the database."""
+        self._pending.append(
+            {
+                "id": uuid7(),
+                "board_id": board_id,
+                "actor_id": actor_id,
+                "action": action,
+                "entity_id": entity_id,
+                "data": data or {},
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+        if len(self._pending) >= self._max_events:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """Write all pending entries in one multi-row INSERT; returns the count."""
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                async with self._session_factory() as session:
+                    await session.execute(insert(Activity), batch)
+                    await session.commit()
+            except Exception:
+                logger.exception("Failed to write %d activity entries", len(batch))
+                # Put the batch back for the next attempt, within the cap
+                self._pending = (batch + self._pending)[-self._max_pending:]
+                return 0
+            return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
+
+
+activity_buffer = ActivityBuffer(
+    async_session,
+    interval_ms=settings.ACTIVITY_FLUSH_INTERVAL_MS,
+    max_events=settings.ACTIVITY_FLUSH_MAX_EVENTS,
+)
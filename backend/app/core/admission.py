@@ -0,0 +1,121 @@
+"""
+Admission control based on database session queueing delay.
+
+`get_db` checks a connection out of the pool up front and reports how long
+it waited. Delays are summarised per interval as in CoDel: if even the
+fastest checkout of the last interval waited longer than
+`LOAD_SHED_TARGET_MS`, the pool has a standing queue and the controller is
+overloaded until an interval completes under target again.
+
+While overloaded, low-priority requests (API reads such as board list
+refreshes) are rejected with 503 before they reach the pool, leaving the
+connections to writes. Health, readiness and metrics never touch the pool
+and are always admitted.
+"""
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Never shed: liveness, readiness and in-process counters
+PRIORITY_PATHS = frozenset({"/health", "/ready", "/metrics"})
+
+
+class AdmissionController:
+    """Tracks checkout delay per interval and decides whether to shed."""
+
+    def __init__(self, target_ms: float, interval_ms: float):
+        self.target = target_ms / 1000
+        self.interval = interval_ms / 1000
+        self.last_delay = 0.0
+        self.shed = 0
+        self._overloaded = False
+        self._last_sample = 0.0
+        self._window_start: float | None = None
+        self._window_min: float | None = None
+
+    def is_overloaded(self, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        # Without fresh samples (e.g. only shed reads arriving) stop shedding
+        return self._overloaded and now - self._last_sample < self.interval
+
+    def record(self, delay: float, now: float | None = None) -> None:
+        """Report one pool checkout that waited `delay` seconds."""
+        now = time.monotonic() if now is None else now
+        self.last_delay = delay
+        self._last_sample = now
+        if self._window_start is None:
+            self._window_start = now
+        elif now - self._window_start >= self.interval:
+            self._overloaded = (
+                self._window_min is not None and self._window_min > self.target
+            )
+            self._window_start = now
+            self._window_min = None
+        if self._window_min is None or delay < self._window_min:
+            self._window_min = delay
+        if delay <= self.target:
+            # One fast checkout is enough to show the queue has drained
+            self._overloaded = False
+
+    def admit(self, method: str, path: str, now: float | None = None) -> bool:
+        if not is_low_priority(method, path) or not self.is_overloaded(now):
+            return True
+        self.shed += 1
+        return False
+
+
+def is_low_priority(method: str, path: str) -> bool:
+    """Reads against the API may be shed; writes and probes may not."""
+    return (
+        method in ("GET", "HEAD")
+        and path.startswith("/api/")
+        and path not in PRIORITY_PATHS
+    )
+
+
+def pool_status(engine) -> dict:
+    """Checked-out and idle connections for pools that report them."""
+    pool = engine.pool
+    status = {}
+    for name in ("size", "checkedout", "checkedin", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+    return status
+
+
+class AdmissionMiddleware:
+    """ASGI middleware answering 503 for low-priority requests under pressure."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController | None = None,
+        enabled: bool | None = None,
+    ):
+        self.app = app
+        self.controller = controller or admission
+        self.enabled = settings.LOAD_SHED_ENABLED if enabled is None else enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            self.enabled
+            and scope["type"] == "http"
+            and not self.controller.admit(scope["method"], scope["path"])
+        ):
+            await JSONResponse(
+                {"detail": "Service overloaded, retry shortly"},
+                status_code=503,
+                headers={"Retry-After": "1"},
+            )(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+admission = AdmissionController(
+    target_ms=settings.LOAD_SHED_TARGET_MS,
+    interval_ms=settings.LOAD_SHED_INTERVAL_MS,
+)
@@ -0,0 +1,250 @@
+"""
+Pluggable brokers that carry board events between processes.
+
+Every broker coalesces events per board per event-loop tick: a service that
+publishes 200 events after one commit produces a single message per board,
+and repeated events for the same entity within the tick collapse to the last
+one. The in-memory backend delivers straight to the local hub (SQLite, tests,
+single worker). The Postgres backend sends the batch with NOTIFY and every
+worker — including the sender — delivers it to its own subscribers on LISTEN.
+If its LISTEN connection drops it reconnects, then tells every local
+subscriber to resync, since notifications sent in the gap are gone.
+"""
+import abc
+import asyncio
+import json
+import logging
+import uuid
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[uuid.UUID, list[dict]], None]
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD = 7900
+# How often an idle LISTEN connection is pinged, and how long a ping may take
+HEALTH_CHECK_SECONDS = 30.0
+HEALTH_CHECK_TIMEOUT = 5.0
+# Seconds between reconnection attempts; the last delay repeats
+RECONNECT_DELAYS = (0.5, 1.0, 2.0, 5.0)
+
+
+class EventBroker(abc.ABC):
+    """Base broker: coalesces events per board and hands batches to `_send`."""
+
+    def __init__(self, deliver: Deliver):
+        self._deliver = deliver
+        self._pending: dict[uuid.UUID, dict[tuple, dict]] = {}
+        self._flush_scheduled = False
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        self.flush()
+
+    def publish(self, board_id: uuid.UUID, event: dict) -> None:
+        """Queue an event; it is sent with the rest of this tick's batch."""
+        events = self._pending.setdefault(board_id, {})
+        key = (event["type"], event.get("id"))
+        # Re-insert so the surviving event takes its latest position
+        events.pop(key, None)
+        events[key] = event
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        for board_id, events in pending.items():
+            self._send(board_id, list(events.values()))
+
+    @abc.abstractmethod
+    def _send(self, board_id: uuid.UUID, events: list[dict]) -> None:
+        """Hand one board's coalesced batch to every worker's hub."""
+
+
+class InMemoryBroker(EventBroker):
+    """Single-process broker: batches go directly to the local hub."""
+
+    def _send(self, board_id: uuid.UUID, events: list[dict]) -> None:
+        self._deliver(board_id, events)
+
+
+class PostgresBroker(EventBroker):
+    """
+    Cross-process broker using LISTEN/NOTIFY.
+
+    Holds one pooled asyncpg connection for the lifetime of the app; it both
+    listens and issues NOTIFY. A watchdog replaces the connection when asyncpg
+    reports it terminated, a NOTIFY fails or a periodic ping goes unanswered,
+    and then calls `resync`. Until `start()` has run, and while reconnecting,
+    batches are delivered locally so this worker's subscribers still get them.
+    """
+
+    CHANNEL = "taskflow_board_events"
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        engine: AsyncEngine,
+        resync: Callable[[], None] = lambda: None,
+    ):
+        super().__init__(deliver)
+        self._engine = engine
+        self._resync = resync
+        self._conn: AsyncConnection | None = None
+        self._driver_conn = None
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+        self._lost = asyncio.Event()
+        self._watchdog: asyncio.Task | None = None
+        self.reconnects = 0
+
+    async def start(self) -> None:
+        await self._connect()
+        self._watchdog = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            try:
+                await self._watchdog
+            except asyncio.CancelledError:
+                pass
+            self._watchdog = None
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._driver_conn is not None:
+            self._driver_conn.remove_termination_listener(self._on_terminated)
+            try:
+                await self._driver_conn.remove_listener(self.CHANNEL, self._on_notify)
+            except Exception:
+                await self._disconnect(invalidate=True)
+                return
+        await self._disconnect()
+
+    async def _connect(self) -> None:
+        self._lost.clear()
+        conn = await self._engine.connect()
+        try:
+            raw = await conn.get_raw_connection()
+            driver_conn = raw.driver_connection
+            await driver_conn.add_listener(self.CHANNEL, self._on_notify)
+            driver_conn.add_termination_listener(self._on_terminated)
+        except BaseException:
+            await conn.invalidate()
+            raise
+        self._conn, self._driver_conn = conn, driver_conn
+
+    async def _disconnect(self, invalidate: bool = False) -> None:
+        conn, self._conn, self._driver_conn = self._conn, None, None
+        if conn is None:
+            return
+        try:
+            # A dead connection must not go back to the pool
+            await (conn.invalidate() if invalidate else conn.close())
+        except Exception:
+            logger.warning("Error closing the board event connection", exc_info=True)
+
+    def _on_terminated(self, connection) -> None:
+        if connection is self._driver_conn:
+            self._lost.set()
+
+    async def _watch(self) -> None:
+        """Reconnect whenever the LISTEN connection is lost or stops answering."""
+        while True:
+            try:
+                await asyncio.wait_for(self._lost.wait(), HEALTH_CHECK_SECONDS)
+            except asyncio.TimeoutError:
+                if await self._ping():
+                    continue
+            await self._reconnect()
+
+    async def _ping(self) -> bool:
+        try:
+            async with self._lock:
+                await asyncio.wait_for(
+                    self._driver_conn.execute("SELECT 1"), HEALTH_CHECK_TIMEOUT
+                )
+        except Exception:
+            logger.warning("Board event connection failed its health check")
+            return False
+        return True
+
+    async def _reconnect(self) -> None:
+        logger.warning("Board event connection lost, reconnecting")
+        await self._disconnect(invalidate=True)
+        attempt = 0
+        while True:
+            try:
+                await self._connect()
+                break
+            except Exception:
+                delay = RECONNECT_DELAYS[min(attempt, len(RECONNECT_DELAYS) - 1)]
+                logger.exception(
+                    "Failed to reconnect board events, retrying in %ss", delay
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+        self.reconnects += 1
+        # Notifications sent while disconnected are lost: clients must refetch
+        self._resync()
+
+    def _send(self, board_id: uuid.UUID, events: list[dict]) -> None:
+        if self._driver_conn is None:
+            self._deliver(board_id, events)
+            return
+        payload = json.dumps({"board_id": str(board_id), "events": events})
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD:
+            # Too large for one notification — tell subscribers to refetch
+            payload = json.dumps(
+                {
+                    "board_id": str(board_id),
+                    "events": [{"type": "resync", "board_id": str(board_id)}],
+                }
+            )
+        task = asyncio.create_task(self._notify(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _notify(self, payload: str) -> None:
+        # asyncpg connections do not allow concurrent queries
+        async with self._lock:
+            driver_conn = self._driver_conn
+            if driver_conn is None:
+                return  # reconnecting; subscribers resync once it is back
+            try:
+                await driver_conn.execute(
+                    "SELECT pg_notify($1, $2)", self.CHANNEL, payload
+                )
+            except Exception:
+                logger.exception("Failed to publish board events")
+                # Let the watchdog check the connection
+                if driver_conn is self._driver_conn:
+                    self._lost.set()
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        message = json.loads(payload)
+        self._deliver(uuid.UUID(message["board_id"]), message["events"])
+
+
+def create_broker(
+    name: str,
+    engine: AsyncEngine,
+    deliver: Deliver,
+    resync: Callable[[], None] = lambda: None,
+) -> EventBroker:
+    """Build the configured broker; "auto" picks Postgres when running on asyncpg."""
+    if name == "auto":
+        name = "postgres" if engine.dialect.driver == "asyncpg" else "memory"
+    if name == "postgres":
+        return PostgresBroker(deliver, engine, resync)
+    if name == "memory":
+        return InMemoryBroker(deliver)
+    raise ValueError(f"Unknown EVENT_BROKER: {name!r}")
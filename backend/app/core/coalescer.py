@@ -0,0 +1,234 @@
+"""
+Opt-in write coalescing for rapid card title/description edits.
+
+With `CARD_UPDATE_COALESCE_MS` > 0, the first PATCH of a card within the
+window does the usual ownership SELECT and stages the change in memory; later
+PATCHes from the same user inside the window are merged into the staged
+change without loading the card (the user's role is still checked, usually
+from the session's cached memberships). The merged change is written with one
+UPDATE when the window closes, or earlier whenever something reads or
+otherwise mutates that card (board detail, queries, moves, deletes), and on
+shutdown. `writes_saved` counts the PATCHes that did not need their own write.
+
+A write that fails is staged again and retried with exponential backoff
+(`RETRY_DELAYS`); a flush forced by a read re-raises the error so the read
+fails instead of serving stale data. Once the retries are used up the change
+is dropped, counted in `writes_failed` and the board gets a "resync" event so
+clients refetch the card they were shown as saved.
+"""
+import asyncio
+import dataclasses
+import logging
+import uuid
+from collections.abc import Collection
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.events import publish_event
+from app.models.card import Card
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before each retry of a failed write
+RETRY_DELAYS = (0.5, 2.0, 8.0)
+
+
+@dataclasses.dataclass
+class PendingCardWrite:
+    """Staged card state; exposes the same attributes `CardOut` reads."""
+    id: uuid.UUID
+    board_id: uuid.UUID
+    list_id: uuid.UUID
+    title: str
+    description: str | None
+    rank: str
+    created_at: datetime
+    owner_id: uuid.UUID
+    changes: dict = dataclasses.field(default_factory=dict)
+    attempts: int = 0
+    timer: asyncio.TimerHandle | None = dataclasses.field(default=None, repr=False)
+
+    def apply(self, changes: dict) -> None:
+        self.changes.update(changes)
+        for field, value in changes.items():
+            setattr(self, field, value)
+
+
+class CardWriteCoalescer:
+    """Merges card updates per card inside a time window and writes them once."""
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], window_ms: int
+    ):
+        self._session_factory = session_factory
+        self.window_ms = window_ms
+        self._pending: dict[uuid.UUID, PendingCardWrite] = {}
+        self._inflight: dict[uuid.UUID, asyncio.Task] = {}
+        self._timer_tasks: set[asyncio.Task] = set()
+        self.writes = 0
+        self.writes_saved = 0
+        self.writes_failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_ms > 0
+
+    def staged(
+        self, card_id: uuid.UUID, owner_id: uuid.UUID
+    ) -> PendingCardWrite | None:
+        """The card's staged write by this user, for access checks before `merge`."""
+        pending = self._pending.get(card_id)
+        if pending is None or pending.owner_id != owner_id:
+            return None
+        return pending
+
+    def merge(
+        self, card_id: uuid.UUID, owner_id: uuid.UUID, changes: dict
+    ) -> PendingCardWrite | None:
+        """Merge into a staged write by the same user; None if there is none."""
+        pending = self.staged(card_id, owner_id)
+        if pending is None:
+            return None
+        pending.apply(changes)
+        self.writes_saved += 1
+        return dataclasses.replace(pending, changes=dict(pending.changes), timer=None)
+
+    def stage(self, card: Card, owner_id: uuid.UUID, changes: dict) -> PendingCardWrite:
+        """Stage a freshly loaded, ownership-checked card and start its window."""
+        pending = PendingCardWrite(
+            id=card.id,
+            board_id=card.board_id,
+            list_id=card.list_id,
+            title=card.title,
+            description=card.description,
+            rank=card.rank,
+            created_at=card.created_at,
+            owner_id=owner_id,
+        )
+        pending.apply(changes)
+        pending.timer = asyncio.get_running_loop().call_later(
+            self.window_ms / 1000, self._on_window_closed, card.id
+        )
+        self._pending[card.id] = pending
+        return dataclasses.replace(pending, changes=dict(pending.changes), timer=None)
+
+    def _on_window_closed(self, card_id: uuid.UUID) -> None:
+        task = asyncio.get_running_loop().create_task(
+            self._flush_in_background(card_id)
+        )
+        self._timer_tasks.add(task)
+        task.add_done_callback(self._timer_tasks.discard)
+
+    async def _flush_in_background(self, card_id: uuid.UUID) -> None:
+        try:
+            await self.flush_card(card_id)
+        except Exception:
+            pass  # logged and rescheduled (or given up) by _write
+
+    async def flush_card(self, card_id: uuid.UUID) -> None:
+        """
+        Write the card's staged change now, or wait for an in-flight write.
+
+        Raises if the write fails; the change stays staged for a retry.
+        """
+        pending = self._pending.pop(card_id, None)
+        if pending is None:
+            inflight = self._inflight.get(card_id)
+            if inflight is not None:
+                await asyncio.shield(inflight)
+            return
+
+        if pending.timer is not None:
+            pending.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._write(pending))
+        self._inflight[card_id] = task
+        try:
+            await asyncio.shield(task)
+        finally:
+            if self._inflight.get(card_id) is task:
+                del self._inflight[card_id]
+
+    async def flush_board(self, board_id: uuid.UUID) -> None:
+        await self.flush_boards({board_id})
+
+    async def flush_boards(self, board_ids: Collection[uuid.UUID]) -> None:
+        """Write the staged changes of every card on these boards."""
+        for card_id in [c for c, p in self._pending.items() if p.board_id in board_ids]:
+            await self.flush_card(card_id)
+
+    async def flush_all(self) -> None:
+        for card_id in list(self._pending):
+            await self.flush_card(card_id)
+
+    async def stop(self) -> None:
+        """Write everything still staged, retrying without delay; on shutdown."""
+        if self._timer_tasks:
+            await asyncio.gather(*self._timer_tasks, return_exceptions=True)
+        # Every failure uses up an attempt, so this ends once retries run out
+        while self._pending:
+            for card_id in list(self._pending):
+                try:
+                    await self.flush_card(card_id)
+                except Exception:
+                    pass
+
+    async def _write(self, pending: PendingCardWrite) -> None:
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    update(Card)
+                    .where(
+                        Card.board_id == pending.board_id,
+                        Card.id == pending.id,
+                        Card.deleted_at.is_(None),
+                    )
+                    .values(**pending.changes)
+                )
+                await session.commit()
+        except Exception:
+            self._retry_later(pending)
+            raise
+        self.writes += 1
+        publish_event(
+            pending.board_id,
+            "card.updated",
+            actor_id=pending.owner_id,
+            id=pending.id,
+            title=pending.title,
+            description=pending.description,
+        )
+
+    def _retry_later(self, pending: PendingCardWrite) -> None:
+        """Stage a failed write again with backoff, or give up and resync."""
+        pending.attempts += 1
+        if pending.attempts > len(RETRY_DELAYS):
+            logger.exception(
+                "Dropping coalesced update for card %s after %d attempts",
+                pending.id,
+                pending.attempts,
+            )
+            self.writes_failed += 1
+            publish_event(pending.board_id, "resync")
+            return
+        logger.exception(
+            "Failed to write coalesced update for card %s, retrying", pending.id
+        )
+        staged = self._pending.get(pending.id)
+        if staged is not None:
+            # A newer edit was staged meanwhile; keep it on top of this one
+            for field, value in pending.changes.items():
+                if field not in staged.changes:
+                    setattr(staged, field, value)
+            staged.changes = {**pending.changes, **staged.changes}
+            return
+        pending.timer = asyncio.get_running_loop().call_later(
+            RETRY_DELAYS[pending.attempts - 1], self._on_window_closed, pending.id
+        )
+        self._pending[pending.id] = pending
+
+
+card_writes = CardWriteCoalescer(async_session, settings.CARD_UPDATE_COALESCE_MS)
@@ -0,0 +1,262 @@
+"""
+Response compression negotiated from `Accept-Encoding`.
+
+Encodings are tried in the order of `COMPRESSION_ENCODINGS` (zstd, br, gzip
+by default); zstd and br are used only when the `zstandard` and `brotli`
+packages are installed, gzip always is. Levels default to the fast end
+(`python -m benchmarks.compression` shows the bytes/CPU trade-off per level):
+board payloads are repetitive UUIDs and ranks that compress well even at
+low levels, and higher levels mostly add latency.
+
+- Bodies under `COMPRESSION_MIN_SIZE` and non-text types are sent as-is, as
+  are responses that already have a `Content-Encoding`, 204/304 responses
+  and `text/event-stream` (each event must reach the client immediately).
+  Those ruled out by their headers are forwarded as soon as the response
+  starts, so an event stream's headers are not held back until its first
+  event.
+- Streaming responses (the NDJSON export) are compressed chunk by chunk
+  without buffering the whole body; the compressor is flushed every
+  `STREAM_FLUSH_BYTES` of input so the client keeps receiving data.
+- A strong `ETag` is weakened (`W/"..."`) on compressed responses, since the
+  bytes differ from the identity representation; `Vary: Accept-Encoding` is
+  added so caches keep the encodings apart.
+
+The middleware wraps the whole stack, so stored idempotent replies are kept
+uncompressed and re-encoded for each retry's `Accept-Encoding`.
+"""
+import importlib.util
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Uncompressed input between forced flushes of a streamed response
+STREAM_FLUSH_BYTES = 64 * 1024
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/msgpack",
+    "application/javascript",
+    "application/xml",
+)
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+class GzipStream:
+    def __init__(self, level: int):
+        # wbits 31: deflate with a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliStream:
+    def __init__(self, level: int):
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdStream:
+    def __init__(self, level: int):
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+STREAMS = {"gzip": GzipStream, "br": BrotliStream, "zstd": ZstdStream}
+# Optional packages behind the non-stdlib encodings
+REQUIRES = {"br": "brotli", "zstd": "zstandard"}
+LEVELS = {
+    "gzip": settings.COMPRESSION_GZIP_LEVEL,
+    "br": settings.COMPRESSION_BROTLI_QUALITY,
+    "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+}
+
+
+def available_encodings(preference: str) -> list[str]:
+    """The encodings in `preference` (comma-separated) that can be used here."""
+    encodings = []
+    for name in (part.strip() for part in preference.split(",")):
+        module = REQUIRES.get(name)
+        if name in STREAMS and (module is None or importlib.util.find_spec(module)):
+            encodings.append(name)
+    return encodings
+
+
+def negotiate(accept_encoding: str | None, encodings: list[str]) -> str | None:
+    """The client's highest-rated encoding; ties go to the server's order."""
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for name in encodings:
+        quality = qualities.get(name, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def compress(encoding: str, body: bytes, level: int | None = None) -> bytes:
+    """Compress a whole body in one go."""
+    stream = STREAMS[encoding](LEVELS[encoding] if level is None else level)
+    return stream.compress(body) + stream.finish()
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses per `Accept-Encoding`."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: str | None = None,
+        min_size: int | None = None,
+        enabled: bool | None = None,
+    ):
+        self.app = app
+        self.encodings = available_encodings(
+            settings.COMPRESSION_ENCODINGS if encodings is None else encodings
+        )
+        self.min_size = settings.COMPRESSION_MIN_SIZE if min_size is None else min_size
+        self.enabled = settings.COMPRESSION_ENABLED if enabled is None else enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = None
+        if self.enabled and scope["type"] == "http":
+            accept_encoding = Headers(scope=scope).get("accept-encoding")
+            encoding = negotiate(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingSend(send, encoding, self.min_size)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSend:
+    """
+    Wraps `send` for one response. Responses that the start message alone
+    rules out (such as an event stream) are passed through at once; the rest
+    are decided on the first body message, which carries the size.
+    """
+
+    def __init__(self, send: Send, encoding: str, min_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.min_size = min_size
+        self.start: Message | None = None
+        self.stream = None
+        self.passthrough = False
+        self.pending = 0
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+        elif message["type"] == "http.response.start":
+            self.start = message
+            if not self._compressible(MutableHeaders(raw=message["headers"])):
+                # Don't hold back the headers, e.g. of an SSE stream
+                self.passthrough = True
+                await self.send(message)
+        elif message["type"] != "http.response.body":
+            await self.send(message)
+        elif self.stream is None:
+            await self._first_body(message)
+        else:
+            await self._next_body(message)
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        if self.start["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(UNCOMPRESSED_TYPES):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _should_compress(
+        self, headers: MutableHeaders, body: bytes, more: bool
+    ) -> bool:
+        if more:
+            length = headers.get("content-length")
+            return length is None or int(length) >= self.min_size
+        return len(body) >= self.min_size
+
+    async def _first_body(self, message: Message) -> None:
+        headers = MutableHeaders(raw=self.start["headers"])
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+        if not self._should_compress(headers, body, more):
+            self.passthrough = True
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        self.stream = STREAMS[self.encoding](LEVELS[self.encoding])
+        if more:
+            del headers["Content-Length"]
+            await self.send(self.start)
+            await self._next_body(message)
+        else:
+            body = self.stream.compress(body) + self.stream.finish()
+            headers["Content-Length"] = str(len(body))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": body})
+
+    async def _next_body(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more = message.get("more_body", False)
+        data = self.stream.compress(body)
+        self.pending += len(body)
+        if not more:
+            data += self.stream.finish()
+        elif self.pending >= STREAM_FLUSH_BYTES:
+            data += self.stream.flush()
+            self.pending = 0
+        if data or not more:
+            await self.send(
+                {"type": "http.response.body", "body": data, "more_body": more}
+            )
@@ -8,6 +8,31 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "supersecretkey123changeinprod"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    EVENT_BROKER: str = "auto"  # "auto", "memory" or "postgres"
+    EVENT_QUEUE_SIZE: int = 256
+    EVENT_HEARTBEAT_SECONDS: float = 15.0
+    ACTIVITY_FLUSH_INTERVAL_MS: int = 500
+    ACTIVITY_FLUSH_MAX_EVENTS: int = 200
+    CARD_UPDATE_COALESCE_MS: int = 0  # 0 disables write coalescing
+    IDEMPOTENCY_BACKEND: str = "memory"  # "memory" or "database"
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_LOGIN: str = "10/minute"  # per client address
+    RATE_LIMIT_MOVES: str = "120/minute"  # per user, POST .../move
+    RATE_LIMIT_READS: str = "600/minute"
+    RATE_LIMIT_WRITES: str = "300/minute"
+    RATE_LIMIT_REDIS_URL: str = ""  # share buckets between workers (needs `redis`)
+    LOAD_SHED_ENABLED: bool = True
+    LOAD_SHED_TARGET_MS: int = 50  # acceptable DB pool queueing delay
+    LOAD_SHED_INTERVAL_MS: int = 1000
+    ACCESS_CACHE_TTL_SECONDS: float = 30.0  # board roles cached per session
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"  # in order of preference, if installed
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent uncompressed
+    COMPRESSION_GZIP_LEVEL: int = 4
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 1
 
     class Config:
         env_file = ".env"
@@ -1,8 +1,10 @@
 import os
+import time
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core.admission import admission
 from app.core.config import settings
 
 # Use environment variable override or settings
@@ -33,8 +35,16 @@ class Base(DeclarativeBase):
 
 
 async def get_db():
-    """FastAPI dependency that yields an async database session."""
+    """
+    FastAPI dependency that yields an async database session.
+
+    The connection is checked out immediately so the time spent queueing
+    for the pool can be reported to the admission controller.
+    """
     async with async_session() as session:
+        started = time.perf_counter()
+        await session.connection()
+        admission.record(time.perf_counter() - started)
         try:
             yield session
         finally:
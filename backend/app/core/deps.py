@@ -1,9 +1,11 @@
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, WebSocketException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from starlette.requests import HTTPConnection
 
 from app.core.database import get_db
 from app.core.security import decode_token
@@ -12,6 +14,21 @@ from app.models.user import User
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+async def _get_active_user(db: AsyncSession, email: str) -> User | None:
+    """
+    Look up a non-deleted user by email.
+
+    `User.boards` loads eagerly (with every list and card) by default; the
+    request only needs the user row, so that chain is not loaded here.
+    """
+    result = await db.execute(
+        select(User)
+        .where(User.email == email, User.deleted_at.is_(None))
+        .options(raiseload(User.boards))
+    )
+    return result.scalar_one_or_none()
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
@@ -25,10 +42,7 @@ async def get_current_user(
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    result = await db.execute(
-        select(User).where(User.email == email, User.deleted_at.is_(None))
-    )
-    user = result.scalar_one_or_none()
+    user = await _get_active_user(db, email)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,4 +52,39 @@ async def get_current_user(
     return user
 
 
+async def get_stream_user(
+    conn: HTTPConnection,
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Authenticate a long-lived connection (WebSocket or SSE).
+
+    Browsers cannot set headers on WebSocket or EventSource requests, so the
+    token may also be passed as a `token` query parameter.
+    """
+    token = conn.query_params.get("token")
+    authorization = conn.headers.get("Authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+
+    user = None
+    if token:
+        try:
+            email = decode_token(token).get("sub")
+        except HTTPException:
+            email = None
+        if email is not None:
+            user = await _get_active_user(db, email)
+    if user is None:
+        if conn.scope["type"] == "websocket":
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
+StreamUser = Annotated[User, Depends(get_stream_user)]
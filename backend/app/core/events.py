@@ -0,0 +1,111 @@
+"""
+In-process pub/sub hub for real-time board events.
+
+Services publish compact events (card/list created, updated, moved, deleted)
+after their transaction commits. Events travel through the configured broker
+(see `app.core.broker`), which coalesces them per board per tick and hands
+each batch to the hub of every worker. Each subscriber owns a bounded queue; a
+subscriber that falls behind has its backlog discarded and receives a single
+"resync" event telling it to refetch the board instead of blocking publishers.
+"""
+import asyncio
+import uuid
+from collections import defaultdict
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.activity import activity_buffer
+from app.core.broker import create_broker
+from app.core.config import settings
+from app.core.database import engine
+
+
+class Subscription:
+    """A single subscriber's bounded event queue for one board."""
+
+    def __init__(self, board_id: uuid.UUID, maxsize: int):
+        self.board_id = board_id
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=maxsize)
+        self.resyncs = 0
+
+    def put(self, event: dict) -> None:
+        """Enqueue without blocking; replace the backlog with a resync on overflow."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.resyncs += 1
+            self.queue.put_nowait(
+                {"type": "resync", "board_id": str(self.board_id)}
+            )
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class EventHub:
+    """Fans out board events to every local subscriber of that board."""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: dict[uuid.UUID, set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, board_id: uuid.UUID) -> Subscription:
+        subscription = Subscription(board_id, self.queue_size)
+        self._subscribers[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.board_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.board_id]
+
+    def subscriber_count(self, board_id: uuid.UUID) -> int:
+        return len(self._subscribers.get(board_id, ()))
+
+    def publish(self, board_id: uuid.UUID, event: dict) -> None:
+        """Deliver an event to all subscribers of a board. Never blocks."""
+        for subscription in tuple(self._subscribers.get(board_id, ())):
+            subscription.put(event)
+
+    def resync_all(self) -> None:
+        """Tell every local subscriber to refetch, e.g. after events were lost."""
+        for board_id in tuple(self._subscribers):
+            self.publish(board_id, {"type": "resync", "board_id": str(board_id)})
+
+    def dispatch(self, board_id: uuid.UUID, events: list[dict]) -> None:
+        """Deliver a coalesced batch from the broker as one message."""
+        if len(events) == 1:
+            self.publish(board_id, events[0])
+        elif events:
+            self.publish(
+                board_id,
+                {"type": "batch", "board_id": str(board_id), "events": events},
+            )
+
+
+hub = EventHub(queue_size=settings.EVENT_QUEUE_SIZE)
+broker = create_broker(settings.EVENT_BROKER, engine, hub.dispatch, hub.resync_all)
+
+
+def publish_event(
+    board_id: uuid.UUID,
+    event_type: str,
+    actor_id: uuid.UUID | None = None,
+    **data,
+) -> None:
+    """
+    Build a compact JSON-ready event and publish it. Call only after commit.
+
+    When `actor_id` is given the event is also appended to the activity log.
+    """
+    payload = jsonable_encoder(data)
+    broker.publish(board_id, {"type": event_type, "board_id": str(board_id), **payload})
+    if actor_id is not None:
+        activity_buffer.record(
+            board_id, actor_id, event_type, entity_id=data.get("id"), data=payload
+        )
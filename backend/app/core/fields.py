@@ -0,0 +1,90 @@
+"""
+Sparse fieldsets for the read endpoints (`?fields=`).
+
+`fields` is a comma-separated list of field paths in the endpoint's response
+schema, with dots into nested objects:
+
+    GET /api/v1/boards/{id}?fields=title,lists.id,lists.title,lists.cards.title
+
+Naming a nested object or list without sub-fields includes all of its
+fields. The parsed field tree decides both what the service selects
+(unrequested columns are selected as NULL, so row views keep their shape,
+and nested collections nobody asked for are not queried at all) and which
+keys `project` emits.
+"""
+import copy
+import functools
+import typing
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import null
+
+# {"title": True, "lists": {"id": True, "cards": {...}}}
+FieldTree = dict[str, typing.Any]
+
+
+def _nested_schema(annotation) -> type[BaseModel] | None:
+    """The model behind `Model`, `list[Model]` or `Model | None`, if any."""
+    for arg in (annotation, *typing.get_args(annotation)):
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+    return None
+
+
+@functools.cache
+def all_fields(schema: type[BaseModel]) -> FieldTree:
+    """Every field of `schema`, nested schemas expanded."""
+    tree = {}
+    for name, field in schema.model_fields.items():
+        nested = _nested_schema(field.annotation)
+        tree[name] = all_fields(nested) if nested else True
+    return tree
+
+
+def parse_fields(raw: str | None, schema: type[BaseModel]) -> FieldTree | None:
+    """Parse `?fields=` against `schema`, raising 400 for unknown paths."""
+    if raw is None:
+        return None
+    tree: FieldTree = {}
+    for path in filter(None, (part.strip() for part in raw.split(","))):
+        node, model = tree, schema
+        names = path.split(".")
+        for depth, name in enumerate(names):
+            field = model.model_fields.get(name) if model else None
+            if field is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field: {path}",
+                )
+            model = _nested_schema(field.annotation)
+            if depth == len(names) - 1:
+                # A whole object wins over any of its sub-fields
+                node[name] = copy.deepcopy(all_fields(model)) if model else True
+            else:
+                node = node.setdefault(name, {})
+    if not tree:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields selected",
+        )
+    return tree
+
+
+def selected(tree: FieldTree, *columns):
+    """`columns` for a row view, with fields outside `tree` selected as NULL."""
+    return [column if column.key in tree else null() for column in columns]
+
+
+def project(obj, tree: FieldTree) -> dict:
+    """The fields in `tree` of a view object, nested lists included."""
+    out = {}
+    for name, sub in tree.items():
+        value = getattr(obj, name)
+        if sub is not True and value is not None:
+            if isinstance(value, list):
+                value = [project(item, sub) for item in value]
+            else:
+                value = project(value, sub)
+        out[name] = value
+    return out
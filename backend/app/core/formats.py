@@ -0,0 +1,56 @@
+"""
+Response formats for the read endpoints: JSON, or MessagePack when the
+client prefers it in `Accept`.
+
+Both are encoded straight from plain data (dicts, lists, UUIDs, datetimes)
+with pydantic-core, so the values match the JSON API exactly: ids and
+timestamps are strings in MessagePack too. Responses carry `Vary: Accept`
+so shared caches keep the formats apart.
+"""
+from typing import Any
+
+import msgpack
+from fastapi import Request, Response
+from pydantic_core import to_json, to_jsonable_python
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+_MSGPACK_TYPES = (MSGPACK, "application/x-msgpack")
+_JSON_RANGES = (JSON, "application/*", "*/*")
+
+
+def _qualities(accept: str) -> dict[str, float]:
+    qualities = {}
+    for part in accept.split(","):
+        media_type, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type.strip().lower()] = quality
+    return qualities
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """True if `Accept` ranks MessagePack at least as high as JSON."""
+    if not accept:
+        return False
+    qualities = _qualities(accept)
+    msgpack_q = max(qualities.get(t, 0.0) for t in _MSGPACK_TYPES)
+    json_q = max(qualities.get(t, 0.0) for t in _JSON_RANGES)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def render(request: Request, content: Any) -> Response:
+    """`content` in the format negotiated from the request's `Accept`."""
+    if prefers_msgpack(request.headers.get("accept")):
+        body = msgpack.packb(to_jsonable_python(content))
+        media_type = MSGPACK
+    else:
+        body = to_json(content)
+        media_type = JSON
+    return Response(body, media_type=media_type, headers={"Vary": "Accept"})
@@ -0,0 +1,459 @@
+"""
+Idempotency keys for retried POST requests.
+
+A client that sends `Idempotency-Key: <key>` on a POST gets the same
+response back for every retry of that request: the first execution's status,
+headers and body are stored per user and key for `IDEMPOTENCY_TTL_SECONDS`,
+and later requests are answered from the store without reaching the route,
+its services or the database session. A duplicate that arrives while the
+first execution is still running waits for it and then replays its result.
+
+Request bodies are buffered to fingerprint them, up to `MAX_REQUEST_BODY`.
+Larger requests (a streamed board import) skip idempotency handling and
+stream through untouched, so they keep their bounded memory use.
+
+Responses are kept in a bounded in-memory LRU by default. With
+`IDEMPOTENCY_BACKEND=database` they go to the `idempotency_keys` table so
+that retries routed to a different worker are still recognised.
+"""
+import abc
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.security import decode_token
+from app.models.idempotency import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+HEADER = "idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+# Responses larger than this are passed through but not stored
+MAX_STORED_BODY = 1024 * 1024
+# Requests larger than this are passed through without idempotency handling
+MAX_REQUEST_BODY = 1024 * 1024
+# How long a duplicate waits for the original request before giving up
+WAIT_TIMEOUT_SECONDS = 30.0
+POLL_INTERVAL_SECONDS = 0.05
+
+
+class IdempotencyConflict(Exception):
+    """The original request is still running after the wait timeout."""
+
+
+@dataclass(slots=True)
+class StoredResponse:
+    fingerprint: str
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyStore(abc.ABC):
+    """
+    Base store. Tracks requests in flight in this process so duplicates can
+    await them; subclasses persist completed responses.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self._ttl = ttl_seconds
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def begin(
+        self, scope: str, fingerprint: str, timeout: float = WAIT_TIMEOUT_SECONDS
+    ) -> StoredResponse | None:
+        """
+        Return the stored response for `scope`, or None if the caller now owns
+        the key and must execute the request, then `complete` or `abort` it.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            inflight = self._inflight.get(scope)
+            if inflight is not None:
+                remaining = deadline - loop.time()
+                try:
+                    await asyncio.wait_for(asyncio.shield(inflight), max(remaining, 0))
+                except asyncio.TimeoutError:
+                    raise IdempotencyConflict(scope)
+                continue
+
+            stored = await self._load(scope)
+            if stored is not None:
+                return stored
+            if scope in self._inflight:
+                # Another coroutine claimed the key while we were loading
+                continue
+
+            self._inflight[scope] = loop.create_future()
+            try:
+                claimed = await self._claim(scope, fingerprint)
+            except BaseException:
+                # Don't leave duplicates waiting on a claim that never happened
+                self._resolve(scope)
+                raise
+            if claimed:
+                return None
+
+            # Claimed by another worker; poll until it stores a response
+            self._inflight.pop(scope).set_result(None)
+            if loop.time() >= deadline:
+                raise IdempotencyConflict(scope)
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+    async def complete(self, scope: str, response: StoredResponse) -> None:
+        try:
+            await self._save(scope, response)
+        finally:
+            self._resolve(scope)
+
+    async def abort(self, scope: str) -> None:
+        """Give up the key so the next retry executes the request again."""
+        try:
+            await self._release(scope)
+        finally:
+            self._resolve(scope)
+
+    def _resolve(self, scope: str) -> None:
+        future = self._inflight.pop(scope, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    @abc.abstractmethod
+    async def _load(self, scope: str) -> StoredResponse | None:
+        """The unexpired stored response for `scope`, if any."""
+
+    @abc.abstractmethod
+    async def _claim(self, scope: str, fingerprint: str) -> bool:
+        """Take ownership of `scope`; False if another worker holds it."""
+
+    @abc.abstractmethod
+    async def _save(self, scope: str, response: StoredResponse) -> None:
+        """Store the completed response for `scope`."""
+
+    @abc.abstractmethod
+    async def _release(self, scope: str) -> None:
+        """Drop the claim on `scope` without storing a response."""
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Per-process LRU of stored responses, bounded by `max_entries`."""
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        super().__init__(ttl_seconds)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _load(self, scope: str) -> StoredResponse | None:
+        entry = self._entries.get(scope)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= asyncio.get_running_loop().time():
+            del self._entries[scope]
+            return None
+        self._entries.move_to_end(scope)
+        return response
+
+    async def _claim(self, scope: str, fingerprint: str) -> bool:
+        # In-process claims are tracked by the in-flight futures alone
+        return True
+
+    async def _save(self, scope: str, response: StoredResponse) -> None:
+        expires_at = asyncio.get_running_loop().time() + self._ttl
+        self._entries[scope] = (expires_at, response)
+        self._entries.move_to_end(scope)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _release(self, scope: str) -> None:
+        return None
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """
+    Stores responses in `idempotency_keys`. A request claims its key by
+    inserting a row with no status; the primary key makes the claim atomic
+    across workers. Claims older than the wait timeout are treated as
+    abandoned (the worker died mid-request) and taken over.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], ttl_seconds: int
+    ):
+        super().__init__(ttl_seconds)
+        self._session_factory = session_factory
+
+    async def _load(self, scope: str) -> StoredResponse | None:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(IdempotencyKey).where(
+                    IdempotencyKey.scope == scope,
+                    IdempotencyKey.status_code.is_not(None),
+                    IdempotencyKey.created_at > self._cutoff(self._ttl),
+                )
+            )
+            row = result.scalar_one_or_none()
+        if row is None:
+            return None
+        return StoredResponse(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in row.headers],
+            body=row.body,
+        )
+
+    async def _claim(self, scope: str, fingerprint: str) -> bool:
+        async with self._session_factory() as session:
+            # Expired responses and abandoned claims no longer hold the key
+            await session.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.scope == scope,
+                    (IdempotencyKey.created_at <= self._cutoff(self._ttl))
+                    | (
+                        IdempotencyKey.status_code.is_(None)
+                        & (IdempotencyKey.created_at <= self._cutoff(WAIT_TIMEOUT_SECONDS))
+                    ),
+                )
+            )
+            session.add(
+                IdempotencyKey(
+                    scope=scope,
+                    fingerprint=fingerprint,
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                return False
+        return True
+
+    async def _save(self, scope: str, response: StoredResponse) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.scope == scope)
+                .values(
+                    status_code=response.status_code,
+                    headers=[
+                        [k.decode("latin-1"), v.decode("latin-1")]
+                        for k, v in response.headers
+                    ],
+                    body=response.body,
+                )
+            )
+            await session.commit()
+
+    async def _release(self, scope: str) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.scope == scope)
+            )
+            await session.commit()
+
+    @staticmethod
+    def _cutoff(seconds: float) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=seconds)
+
+
+def create_store(backend: str) -> IdempotencyStore:
+    if backend == "database":
+        return DatabaseIdempotencyStore(async_session, settings.IDEMPOTENCY_TTL_SECONDS)
+    if backend == "memory":
+        return MemoryIdempotencyStore(
+            settings.IDEMPOTENCY_TTL_SECONDS, settings.IDEMPOTENCY_MAX_ENTRIES
+        )
+    raise ValueError(f"Unknown idempotency backend: {backend!r}")
+
+
+idempotency_store = create_store(settings.IDEMPOTENCY_BACKEND)
+
+
+def _user_from_headers(headers: Headers) -> str | None:
+    """JWT subject of the request, or None if it carries no valid token."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_token(token).get("sub")
+    except HTTPException:
+        return None
+
+
+class IdempotencyMiddleware:
+    """
+    ASGI middleware applying idempotency keys to authenticated POSTs.
+
+    Requests without the header, without a valid token, with another method
+    or with a body over `MAX_REQUEST_BODY` pass straight through. Server
+    errors (5xx) are not stored, so a retry after one executes again.
+    """
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore | None = None):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        key = headers.get(HEADER)
+        user = _user_from_headers(headers) if key else None
+        if user is None:
+            await self.app(scope, receive, send)
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            await JSONResponse(
+                {"detail": f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters"},
+                status_code=400,
+            )(scope, receive, send)
+            return
+
+        length = headers.get("content-length", "")
+        if length.isdigit() and int(length) > MAX_REQUEST_BODY:
+            await self.app(scope, receive, send)
+            return
+        chunks, complete = await _read_body(receive, MAX_REQUEST_BODY)
+        if not complete:
+            await self.app(scope, _prefixed(chunks, receive), send)
+            return
+
+        store = self.store or idempotency_store
+        body = b"".join(chunks)
+        fingerprint = hashlib.sha256(
+            b"\n".join([scope["path"].encode(), scope.get("query_string", b""), body])
+        ).hexdigest()
+        # Fixed width: the subject and key together may exceed the scope column
+        store_key = hashlib.sha256(f"{user}:{key}".encode()).hexdigest()
+
+        try:
+            stored = await store.begin(store_key, fingerprint)
+        except IdempotencyConflict:
+            await JSONResponse(
+                {"detail": "A request with this Idempotency-Key is still in progress"},
+                status_code=409,
+            )(scope, receive, send)
+            return
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await JSONResponse(
+                    {"detail": "Idempotency-Key was already used for a different request"},
+                    status_code=422,
+                )(scope, receive, send)
+                return
+            await _replay(stored, send)
+            return
+
+        await self._execute(scope, receive, send, body, store, store_key, fingerprint)
+
+    async def _execute(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        body: bytes,
+        store: IdempotencyStore,
+        store_key: str,
+        fingerprint: str,
+    ) -> None:
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status_code = 500
+        response_headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+        size = 0
+
+        async def capture_send(message: Message) -> None:
+            nonlocal status_code, response_headers, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and size <= MAX_STORED_BODY:
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                chunks.append(chunk)
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except BaseException:
+            await store.abort(store_key)
+            raise
+        if status_code >= 500 or size > MAX_STORED_BODY:
+            await store.abort(store_key)
+            return
+        await store.complete(
+            store_key,
+            StoredResponse(
+                fingerprint=fingerprint,
+                status_code=status_code,
+                headers=response_headers,
+                body=b"".join(chunks),
+            ),
+        )
+
+
+async def _read_body(receive: Receive, limit: int) -> tuple[list[bytes], bool]:
+    """Buffer the body up to `limit` bytes; returns (chunks, whole body read)."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        chunks.append(chunk)
+        size += len(chunk)
+        if not message.get("more_body", False):
+            return chunks, True
+        if size > limit:
+            return chunks, False
+
+
+def _prefixed(chunks: list[bytes], receive: Receive) -> Receive:
+    """A `receive` that yields the already-read chunks before the rest."""
+    buffered = deque(chunks)
+
+    async def prefixed_receive() -> Message:
+        if buffered:
+            chunk = buffered.popleft()
+            return {"type": "http.request", "body": chunk, "more_body": True}
+        return await receive()
+
+    return prefixed_receive
+
+
+async def _replay(stored: StoredResponse, send: Send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": stored.status_code,
+            "headers": stored.headers + [(REPLAYED_HEADER, b"true")],
+        }
+    )
+    await send({"type": "http.response.body", "body": stored.body})
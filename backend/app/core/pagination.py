@@ -0,0 +1,25 @@
+"""Opaque keyset-pagination cursors shared by the paginated endpoints."""
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode the (created_at, id) key of the last row on a page."""
+    raw = json.dumps([created_at.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor from `encode_cursor`, raising 400 if it is malformed."""
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
@@ -0,0 +1,202 @@
+"""
+Token-bucket rate limiting for the HTTP API.
+
+Every request is charged one token from the bucket for (route class, caller).
+The caller is the JWT subject when a valid bearer token is present and the
+client address otherwise. Each route class has its own budget, configured as
+"<requests>/<second|minute|hour>": a full bucket allows that many requests in
+a burst and refills continuously at the same average rate.
+
+Checking a bucket is O(1) and never touches the database. Buckets live in a
+per-process LRU by default; set `RATE_LIMIT_REDIS_URL` (requires the `redis`
+package) to share them between workers.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.security import decode_token
+
+logger = logging.getLogger(__name__)
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+# Requests that are never limited (probes and in-process counters)
+EXEMPT_PATHS = frozenset({"/health", "/ready", "/metrics"})
+AUTH_PATHS = frozenset({"/api/v1/auth/login", "/api/v1/auth/register"})
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    capacity: int
+    per_seconds: int
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.per_seconds
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        count, _, period = value.partition("/")
+        if period not in _PERIODS or not count.isdigit() or int(count) < 1:
+            raise ValueError(f"Invalid rate limit {value!r}, expected e.g. '60/minute'")
+        return cls(int(count), _PERIODS[period])
+
+
+def route_class(method: str, path: str) -> str | None:
+    """Budget a request is charged to, or None if it is not limited."""
+    if path in EXEMPT_PATHS:
+        return None
+    if path in AUTH_PATHS:
+        return "login"
+    if method == "POST" and path.endswith("/move"):
+        return "moves"
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return "reads"
+    return "writes"
+
+
+class MemoryBucketStore:
+    """Per-process buckets; least recently used callers are dropped past `max_keys`."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, limit: RateLimit, now: float) -> float:
+        """Take one token; returns 0 if allowed, else seconds until one is available."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(limit.capacity)
+        else:
+            tokens, updated = bucket
+            tokens = min(limit.capacity, tokens + (now - updated) * limit.rate)
+            self._buckets.move_to_end(key)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / limit.rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            # An evicted caller simply starts again with a full bucket
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# Same algorithm as MemoryBucketStore.take, run atomically inside Redis
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore:
+    """
+    Buckets shared by all workers through Redis. Fails open: if Redis is
+    unreachable the request is allowed and the error logged.
+    """
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.from_url(url)
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, limit: RateLimit, now: float) -> float:
+        try:
+            wait = await self._take(
+                keys=[f"taskflow:ratelimit:{key}"],
+                args=[limit.capacity, limit.rate, now],
+            )
+        except Exception:
+            logger.exception("Rate limit store unavailable, allowing request")
+            return 0.0
+        return float(wait)
+
+
+def default_limits() -> dict[str, RateLimit]:
+    return {
+        "login": RateLimit.parse(settings.RATE_LIMIT_LOGIN),
+        "moves": RateLimit.parse(settings.RATE_LIMIT_MOVES),
+        "reads": RateLimit.parse(settings.RATE_LIMIT_READS),
+        "writes": RateLimit.parse(settings.RATE_LIMIT_WRITES),
+    }
+
+
+def create_store(redis_url: str):
+    return RedisBucketStore(redis_url) if redis_url else MemoryBucketStore()
+
+
+def _caller(scope: Scope, headers: Headers) -> str:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = decode_token(token).get("sub")
+        except HTTPException:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 with Retry-After once a bucket is empty."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limits: dict[str, RateLimit] | None = None,
+        store=None,
+        enabled: bool | None = None,
+    ):
+        self.app = app
+        self.enabled = settings.RATE_LIMIT_ENABLED if enabled is None else enabled
+        self.limits = limits if limits is not None else default_limits()
+        self.store = store if store is not None else create_store(settings.RATE_LIMIT_REDIS_URL)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        budget = route_class(scope["method"], scope["path"])
+        limit = self.limits.get(budget) if budget else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{budget}:{_caller(scope, Headers(scope=scope))}"
+        wait = await self.store.take(key, limit, time.time())
+        if wait > 0:
+            await JSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
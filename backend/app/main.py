@@ -2,17 +2,41 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.api.v1 import auth, boards, cards, lists
+from app.api.v1 import (
+    auth,
+    batch,
+    boards,
+    cards,
+    commands,
+    events,
+    lists,
+    members,
+    search,
+)
+from app.core.activity import activity_buffer
+from app.core.admission import AdmissionMiddleware, admission, pool_status
+from app.core.coalescer import card_writes
+from app.core.compression import CompressionMiddleware
 from app.core.database import Base, engine
+from app.core.events import broker
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.ratelimit import RateLimitMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan: create tables on startup."""
+    """Application lifespan: create tables, start the event broker and activity log."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await broker.start()
+    activity_buffer.start()
     yield
+    # Write staged card edits and buffered activity before the process exits
+    await card_writes.stop()
+    await broker.stop()
+    await activity_buffer.stop()
 
 
 app = FastAPI(
@@ -22,6 +46,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Replays retried POSTs sent with an Idempotency-Key header
+app.add_middleware(IdempotencyMiddleware)
+
+# Per-user, per-route token buckets; runs before replay and routing
+app.add_middleware(RateLimitMiddleware)
+
+# Sheds low-priority reads with 503 while the DB pool has a standing queue
+app.add_middleware(AdmissionMiddleware)
+
 # CORS - allow all origins for development
 app.add_middleware(
     CORSMiddleware,
@@ -31,14 +64,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost: compresses every response, including idempotent replays and 503s
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(boards.router)
+app.include_router(members.router)
 app.include_router(lists.router)
 app.include_router(cards.router)
+app.include_router(events.router)
+app.include_router(commands.router)
+app.include_router(search.router)
+app.include_router(batch.router)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 503 while the DB pool is saturated so balancers route elsewhere."""
+    body = {
+        "status": "overloaded" if admission.is_overloaded() else "ready",
+        "db_queue_delay_ms": round(admission.last_delay * 1000, 2),
+        "pool": pool_status(engine),
+    }
+    if admission.is_overloaded():
+        return JSONResponse(body, status_code=503)
+    return body
+
+
+@app.get("/metrics")
+async def metrics():
+    """In-process counters for the write-behind paths."""
+    return {
+        "card_update_writes": card_writes.writes,
+        "card_update_writes_saved": card_writes.writes_saved,
+        "card_update_writes_failed": card_writes.writes_failed,
+        "activity_pending": activity_buffer.pending,
+        "requests_shed": admission.shed,
+    }
@@ -1,6 +1,10 @@
 from app.models.user import User
 from app.models.board import Board
+from app.models.board_member import BoardMember
 from app.models.list import List
 from app.models.card import Card
+from app.models.activity import Activity
+from app.models.idempotency import IdempotencyKey
+from app.models import card_search  # noqa: F401  (registers search index DDL)
 
-__all__ = ["User", "Board", "List", "Card"]
+__all__ = ["User", "Board", "BoardMember", "List", "Card", "Activity", "IdempotencyKey"]
@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.core.ids import uuid7
+
+
+class Activity(Base):
+    """
+    Append-only audit entry: who did what to which card or list.
+
+    Rows are written in batches by the activity buffer, so `created_at` is
+    the time the action happened (set when buffered), not the insert time.
+    """
+
+    __tablename__ = "activity"
+    __table_args__ = (
+        Index("ix_activity_board_created", "board_id", "created_at", "id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    board_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("boards.id"), nullable=False
+    )
+    actor_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
+    action: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
+    data: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -1,19 +1,34 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DDL, DateTime, String, event
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.core.ids import POSTGRES_FUNCTION_DDL, uuid7
+
+# Server-side UUIDv7 generator used by INSERT ... SELECT paths; created
+# before the tables so `create_all` matches the migrated schema
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(POSTGRES_FUNCTION_DDL).execute_if(dialect="postgresql"),
+)
+
+# LexoRank strings are compared bytewise in Python (LexoRank.rank_between);
+# "C" collation makes PostgreSQL sort and index them the same way, and
+# skips locale-aware comparison. SQLite's default BINARY collation already
+# matches.
+RankString = String(255).with_variant(String(255, collation="C"), "postgresql")
 
 
 class TimestampMixin:
-    """Mixin that adds UUID primary key, timestamps, and soft delete support."""
+    """Mixin that adds UUIDv7 primary key, timestamps, and soft delete support."""
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class BoardMember(Base):
+    """
+    A user's role on a board: "viewer", "editor" or "owner".
+
+    The primary key (user_id, board_id) is the index behind every access
+    check, which loads all of one user's memberships with a single range
+    scan (see app.core.access).
+    """
+
+    __tablename__ = "board_members"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id"), primary_key=True
+    )
+    board_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("boards.id"), primary_key=True, index=True
+    )
+    role: Mapped[str] = mapped_column(String(20), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
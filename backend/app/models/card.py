@@ -1,10 +1,10 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import RankString, TimestampMixin
 
 
 class Card(TimestampMixin, Base):
@@ -13,6 +13,39 @@ class Card(TimestampMixin, Base):
     __tablename__ = "cards"
     __table_args__ = (
         UniqueConstraint("list_id", "rank", name="uq_card_list_rank"),
+        # Partial composite indexes backing the filtered card query API.
+        # Each leads with the scoping column and ends with the keyset order.
+        Index(
+            "ix_cards_board_created",
+            "board_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_cards_list_created",
+            "list_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_cards_board_updated",
+            "board_id",
+            "updated_at",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_cards_board_title",
+            "board_id",
+            "title",
+            postgresql_ops={"title": "text_pattern_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
     )
 
     list_id: Mapped[uuid.UUID] = mapped_column(
@@ -23,7 +56,12 @@ class Card(TimestampMixin, Base):
     )
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    rank: Mapped[str] = mapped_column(String(255), nullable=False)
+    rank: Mapped[str] = mapped_column(RankString, nullable=False)
 
     # Relationships
     list = relationship("List", back_populates="cards")
+
+    # The ORM identity includes the partition key of the hash-partitioned
+    # schema (migration 007), so refreshes and flushed UPDATEs filter on
+    # board_id as well as id and touch a single partition.
+    __mapper_args__ = {"primary_key": [TimestampMixin.id, board_id]}
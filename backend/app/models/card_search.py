@@ -0,0 +1,90 @@
+"""
+Full-text search index over card titles and descriptions.
+
+Not mapped by the ORM: the index lives beside the `cards` table and is
+created/dropped with it through DDL events, so `Base.metadata.create_all`
+(startup, tests) and the Alembic migration produce the same schema.
+
+- PostgreSQL: a generated, weighted `tsvector` column with a GIN index.
+- SQLite: an FTS5 table kept in sync by triggers, indexing only live
+  (non-deleted) cards. `cards` has a UUID primary key, so its implicit rowid
+  is not stable (VACUUM may renumber it); the FTS rowid is instead the
+  INTEGER PRIMARY KEY of `cards_fts_ids`, which maps it to the card id.
+"""
+from sqlalchemy import DDL, event
+
+from app.models.card import Card
+
+SEARCH_CONFIG = "english"
+FTS_TABLE = "cards_fts"
+FTS_IDS_TABLE = "cards_fts_ids"
+
+_POSTGRES_DDL = [
+    f"""
+    ALTER TABLE cards ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_cards_search_vector
+    ON cards USING gin (search_vector)
+    """,
+]
+
+_SQLITE_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {FTS_IDS_TABLE} (
+        id INTEGER PRIMARY KEY,
+        card_id CHAR(32) NOT NULL UNIQUE
+    )
+    """,
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(title, description)
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS cards_fts_ai AFTER INSERT ON cards
+    WHEN new.deleted_at IS NULL BEGIN
+        INSERT INTO {FTS_IDS_TABLE}(card_id) VALUES (new.id);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (last_insert_rowid(), new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS cards_fts_ad AFTER DELETE ON cards
+    WHEN old.deleted_at IS NULL BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid =
+            (SELECT id FROM {FTS_IDS_TABLE} WHERE card_id = old.id);
+        DELETE FROM {FTS_IDS_TABLE} WHERE card_id = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS cards_fts_au
+    AFTER UPDATE OF title, description, deleted_at ON cards BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid =
+            (SELECT id FROM {FTS_IDS_TABLE} WHERE card_id = old.id);
+        DELETE FROM {FTS_IDS_TABLE} WHERE card_id = old.id;
+        INSERT INTO {FTS_IDS_TABLE}(card_id)
+        SELECT new.id WHERE new.deleted_at IS NULL;
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        SELECT last_insert_rowid(), new.title, new.description
+        WHERE new.deleted_at IS NULL;
+    END
+    """,
+]
+
+for _statement in _POSTGRES_DDL:
+    event.listen(
+        Card.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+for _statement in _SQLITE_DDL:
+    event.listen(
+        Card.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+for _table in (FTS_TABLE, FTS_IDS_TABLE):
+    event.listen(
+        Card.__table__,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect="sqlite"),
+    )
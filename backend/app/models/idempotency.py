@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    Stored response for a POST retried with the same Idempotency-Key.
+
+    Used only by the database-backed idempotency store. A row with a NULL
+    `status_code` is a claim by a request that is still executing.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    scope: Mapped[str] = mapped_column(String(300), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    headers: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
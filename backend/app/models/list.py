@@ -1,10 +1,10 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import RankString, TimestampMixin
 
 
 class List(TimestampMixin, Base):
@@ -19,7 +19,14 @@ class List(TimestampMixin, Base):
         ForeignKey("boards.id"), nullable=False, index=True
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    rank: Mapped[str] = mapped_column(String(255), nullable=False)
+    rank: Mapped[str] = mapped_column(RankString, nullable=False)
+    # Live cards in the list, maintained by the card services in the same
+    # transaction as the change (see list_service.adjust_card_count)
+    card_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Optional work-in-progress limit on card_count
+    wip_limit: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Relationships
     board = relationship("Board", back_populates="lists")
@@ -0,0 +1,23 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ActivityOut(BaseModel):
+    """Schema for one activity log entry."""
+    id: uuid.UUID
+    board_id: uuid.UUID
+    actor_id: uuid.UUID
+    action: str
+    entity_id: uuid.UUID | None
+    data: dict
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ActivityPage(BaseModel):
+    """A page of activity, newest first; pass `next_cursor` back as `cursor`."""
+    items: list[ActivityOut]
+    next_cursor: str | None = None
@@ -0,0 +1,126 @@
+import uuid
+from typing import Annotated, Literal, Union
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.board import CardOut
+
+MAX_BATCH_OPERATIONS = 100
+
+
+class _TargetsList(BaseModel):
+    """
+    Operations addressing a list by `list_id`, or by `list_ref` naming the
+    `ref` of a list created earlier in the same batch.
+    """
+    list_id: uuid.UUID | None = None
+    list_ref: str | None = None
+
+    @model_validator(mode="after")
+    def _one_list_target(self):
+        if (self.list_id is None) == (self.list_ref is None):
+            raise ValueError("Exactly one of list_id or list_ref is required")
+        return self
+
+
+class _TargetsCard(BaseModel):
+    """Operations addressing a card by `card_id` or by an earlier `card_ref`."""
+    card_id: uuid.UUID | None = None
+    card_ref: str | None = None
+
+    @model_validator(mode="after")
+    def _one_card_target(self):
+        if (self.card_id is None) == (self.card_ref is None):
+            raise ValueError("Exactly one of card_id or card_ref is required")
+        return self
+
+
+class ListCreateOp(BaseModel):
+    op: Literal["list.create"]
+    ref: str | None = None
+    board_id: uuid.UUID
+    title: str
+    after_rank: str | None = None
+    wip_limit: int | None = Field(None, ge=1)
+
+
+class ListUpdateOp(_TargetsList):
+    """As ListUpdate: an explicit `"wip_limit": null` removes the limit."""
+    op: Literal["list.update"]
+    title: str | None = None
+    wip_limit: int | None = Field(None, ge=1)
+
+
+class ListDeleteOp(_TargetsList):
+    op: Literal["list.delete"]
+
+
+class CardCreateOp(_TargetsList):
+    """Creates a card at the end of the list; the board is the list's board."""
+    op: Literal["card.create"]
+    ref: str | None = None
+    title: str
+    description: str | None = None
+
+
+class CardUpdateOp(_TargetsCard):
+    op: Literal["card.update"]
+    title: str | None = None
+    description: str | None = None
+
+
+class CardMoveOp(_TargetsCard, _TargetsList):
+    """Moves a card within its board; ranks as in CardMove."""
+    op: Literal["card.move"]
+    before_rank: str | None = None
+    after_rank: str | None = None
+
+
+class CardDeleteOp(_TargetsCard):
+    op: Literal["card.delete"]
+
+
+BatchOperation = Annotated[
+    Union[
+        ListCreateOp,
+        ListUpdateOp,
+        ListDeleteOp,
+        CardCreateOp,
+        CardUpdateOp,
+        CardMoveOp,
+        CardDeleteOp,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BatchRequest(BaseModel):
+    """Ordered operations executed in one transaction, all or nothing."""
+    operations: list[BatchOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+
+
+class BatchListOut(BaseModel):
+    """List in batch results (without nested cards)."""
+    id: uuid.UUID
+    title: str
+    rank: str
+    board_id: uuid.UUID
+    card_count: int
+    wip_limit: int | None
+
+    model_config = {"from_attributes": True}
+
+
+class BatchResult(BaseModel):
+    """Outcome of one operation; `list`/`card` is omitted for deletes."""
+    index: int
+    op: str
+    id: uuid.UUID
+    list: BatchListOut | None = None
+    card: CardOut | None = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchResult]
@@ -4,11 +4,10 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 
-class CardOut(BaseModel):
-    """Schema for card in API responses."""
+class CardBriefOut(BaseModel):
+    """Schema for card in board summaries (no description)."""
     id: uuid.UUID
     title: str
-    description: str | None
     rank: str
     list_id: uuid.UUID
     created_at: datetime
@@ -16,17 +15,29 @@ class CardOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
-class ListOut(BaseModel):
-    """Schema for list in API responses, includes nested cards."""
+class CardOut(CardBriefOut):
+    """Schema for card in API responses."""
+    description: str | None
+
+
+class ListSummaryOut(BaseModel):
+    """Schema for list in board summaries, includes nested brief cards."""
     id: uuid.UUID
     title: str
     rank: str
     board_id: uuid.UUID
-    cards: list[CardOut] = []
+    card_count: int = 0
+    wip_limit: int | None = None
+    cards: list[CardBriefOut] = []
 
     model_config = {"from_attributes": True}
 
 
+class ListOut(ListSummaryOut):
+    """Schema for list in API responses, includes nested cards."""
+    cards: list[CardOut] = []
+
+
 class BoardCreate(BaseModel):
     """Schema for creating a new board."""
     title: str = Field(..., min_length=1)
@@ -39,6 +50,11 @@ class BoardUpdate(BaseModel):
     description: str | None = None
 
 
+class BoardDuplicate(BaseModel):
+    """Schema for duplicating a board. Title defaults to '<source> (copy)'."""
+    title: str | None = Field(default=None, min_length=1)
+
+
 class BoardOut(BaseModel):
     """Schema for board in API responses."""
     id: uuid.UUID
@@ -53,3 +69,8 @@ class BoardOut(BaseModel):
 class BoardDetailOut(BoardOut):
     """Schema for detailed board response with nested lists and cards."""
     lists: list[ListOut] = []
+
+
+class BoardSummaryOut(BoardOut):
+    """Board detail without card descriptions (`?mode=summary`)."""
+    lists: list[ListSummaryOut] = []
@@ -1,6 +1,9 @@
 import uuid
+from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+MAX_BULK_MOVE_CARDS = 100
 
 
 class CardCreate(BaseModel):
@@ -27,3 +30,38 @@ class CardMove(BaseModel):
     list_id: uuid.UUID
     before_rank: str | None = None
     after_rank: str | None = None
+
+
+class CardBulkMove(BaseModel):
+    """
+    Schema for moving several cards, in the given order, to consecutive
+    positions in one list. The list may be on another board of the user's;
+    before_rank/after_rank are the neighbors of the whole block, as in CardMove.
+    board_ids lists the boards the cards are currently on.
+    """
+    card_ids: list[uuid.UUID] = Field(..., min_length=1, max_length=MAX_BULK_MOVE_CARDS)
+    board_ids: list[uuid.UUID] = Field(
+        ..., min_length=1, max_length=MAX_BULK_MOVE_CARDS
+    )
+    list_id: uuid.UUID
+    before_rank: str | None = None
+    after_rank: str | None = None
+
+
+class CardSummaryOut(BaseModel):
+    """Slim card projection for the filtered query API (no description)."""
+    id: uuid.UUID
+    title: str
+    rank: str
+    list_id: uuid.UUID
+    board_id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
+class CardPage(BaseModel):
+    """A page of cards; pass `next_cursor` back as `cursor` for the next page."""
+    items: list[CardSummaryOut]
+    next_cursor: str | None = None
@@ -0,0 +1,31 @@
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.schemas.board import CardOut
+
+
+class Command(BaseModel):
+    """
+    A mutation sent over the board command WebSocket.
+
+    seq: client-chosen sequence number echoed back in the acknowledgement
+    op: which card_service operation to run
+    card_id: target card for update/move
+    data: payload for the matching CardCreate/CardUpdate/CardMove schema
+    """
+    seq: int
+    op: Literal["card.create", "card.update", "card.move"]
+    card_id: uuid.UUID | None = None
+    data: dict = {}
+
+
+class CommandAck(BaseModel):
+    """Acknowledgement for one command; `result` on success, `detail` on failure."""
+    type: Literal["ack"] = "ack"
+    seq: int
+    ok: bool
+    result: CardOut | None = None
+    status: int | None = None
+    detail: str | None = None
@@ -0,0 +1,30 @@
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class BoardRecord(BaseModel):
+    """NDJSON export record for the board itself (always the first line)."""
+    type: Literal["board"] = "board"
+    title: str = Field(..., min_length=1)
+    description: str | None = None
+
+
+class ListRecord(BaseModel):
+    """NDJSON export record for a list. `id` is the source id, remapped on import."""
+    type: Literal["list"] = "list"
+    id: uuid.UUID
+    title: str
+    rank: str
+    wip_limit: int | None = Field(None, ge=1)
+
+
+class CardRecord(BaseModel):
+    """NDJSON export record for a card. `list_id` refers to a preceding list record."""
+    type: Literal["card"] = "card"
+    id: uuid.UUID
+    list_id: uuid.UUID
+    title: str
+    description: str | None = None
+    rank: str
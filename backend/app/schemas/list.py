@@ -1,6 +1,6 @@
 import uuid
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ListCreate(BaseModel):
@@ -8,8 +8,24 @@ class ListCreate(BaseModel):
     title: str
     board_id: uuid.UUID
     after_rank: str | None = None
+    wip_limit: int | None = Field(None, ge=1)
 
 
 class ListUpdate(BaseModel):
-    """Schema for updating a list."""
+    """
+    Schema for updating a list. Omitted fields are left unchanged; an
+    explicit `"wip_limit": null` removes the limit.
+    """
     title: str | None = None
+    wip_limit: int | None = Field(None, ge=1)
+
+
+class ListMove(BaseModel):
+    """
+    Schema for moving a list to a new position on its board.
+
+    before_rank: rank of the list just left of the target position (None if moving to start)
+    after_rank: rank of the list just right of the target position (None if moving to end)
+    """
+    before_rank: str | None = None
+    after_rank: str | None = None
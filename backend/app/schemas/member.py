@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, EmailStr
+
+Role = Literal["viewer", "editor", "owner"]
+
+
+class MemberCreate(BaseModel):
+    """Schema for sharing a board with a registered user, or changing their role."""
+    email: EmailStr
+    role: Role = "editor"
+
+
+class MemberOut(BaseModel):
+    """Schema for a board member in API responses."""
+    user_id: uuid.UUID
+    email: str
+    full_name: str | None
+    role: Role
+    created_at: datetime
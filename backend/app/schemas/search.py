@@ -0,0 +1,19 @@
+import uuid
+
+from pydantic import BaseModel
+
+
+class CardSearchHit(BaseModel):
+    """A ranked card match. Higher score means more relevant."""
+    id: uuid.UUID
+    title: str
+    list_id: uuid.UUID
+    board_id: uuid.UUID
+    score: float
+
+
+class SearchResults(BaseModel):
+    """A page of search results; `next_offset` is None on the last page."""
+    query: str
+    items: list[CardSearchHit]
+    next_offset: int | None = None
@@ -0,0 +1,46 @@
+import uuid
+
+from sqlalchemy import literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.activity import activity_buffer
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.activity import Activity
+from app.schemas.activity import ActivityOut, ActivityPage
+from app.services.board_service import get_board
+
+
+async def get_activity(
+    db: AsyncSession,
+    board_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    limit: int,
+    cursor: str | None = None,
+) -> ActivityPage:
+    """
+    Page through a board's activity, newest first, with keyset pagination.
+
+    Buffered entries are flushed first so callers always see their own writes.
+    """
+    await get_board(db, board_id, owner_id)
+    await activity_buffer.flush()
+
+    query = select(Activity).where(Activity.board_id == board_id)
+    if cursor is not None:
+        before_created, before_id = decode_cursor(cursor)
+        before_key = tuple_(
+            literal(before_created, Activity.created_at.type),
+            literal(before_id, Activity.id.type),
+        )
+        query = query.where(tuple_(Activity.created_at, Activity.id) < before_key)
+    query = query.order_by(Activity.created_at.desc(), Activity.id.desc()).limit(
+        limit + 1
+    )
+    rows = list((await db.execute(query)).scalars().all())
+
+    items = [ActivityOut.model_validate(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return ActivityPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,324 @@
+import uuid
+from datetime import datetime, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import EDITOR, board_access, check_role
+from app.core.coalescer import card_writes
+from app.core.events import publish_event
+from app.core.lexorank import LexoRank
+from app.models.card import Card
+from app.models.list import List
+from app.schemas.batch import (
+    BatchListOut,
+    BatchOperation,
+    BatchResponse,
+    BatchResult,
+    CardCreateOp,
+    CardDeleteOp,
+    CardMoveOp,
+    CardUpdateOp,
+    ListCreateOp,
+    ListDeleteOp,
+    ListUpdateOp,
+)
+from app.schemas.board import CardOut
+from app.services.card_service import (
+    new_card_rank,
+    relocate_cards,
+    resolve_rank_collisions,
+)
+from app.services.list_service import adjust_card_count, new_list_rank
+
+
+def _not_found(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class _BatchContext:
+    """
+    Lists, cards and the user's board roles preloaded for one batch, plus
+    everything created by earlier operations. Access is resolved once for
+    all boards.
+    """
+
+    def __init__(
+        self,
+        lists: dict[uuid.UUID, List],
+        cards: dict[uuid.UUID, Card],
+        roles: dict[uuid.UUID, str],
+    ):
+        self.lists = lists
+        self.cards = cards
+        self.roles = roles
+        self.list_refs: dict[str, uuid.UUID] = {}
+        self.card_refs: dict[str, uuid.UUID] = {}
+        self.events: list[tuple[uuid.UUID, str, dict]] = []
+        self.created_cards: list[Card] = []
+
+    def get_list(self, op, detail: str = "List not found") -> List:
+        if op.list_ref is not None:
+            list_id = self.list_refs.get(op.list_ref)
+            if list_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Unknown list_ref {op.list_ref!r}",
+                )
+        else:
+            list_id = op.list_id
+        lst = self.lists.get(list_id)
+        if lst is None or lst.deleted_at is not None:
+            raise _not_found(detail)
+        check_role(self.roles.get(lst.board_id), EDITOR, detail)
+        return lst
+
+    def get_card(self, op) -> Card:
+        if op.card_ref is not None:
+            card_id = self.card_refs.get(op.card_ref)
+            if card_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Unknown card_ref {op.card_ref!r}",
+                )
+        else:
+            card_id = op.card_id
+        card = self.cards.get(card_id)
+        if card is None or card.deleted_at is not None:
+            raise _not_found("Card not found")
+        check_role(self.roles.get(card.board_id), EDITOR, "Card not found")
+        return card
+
+    def event(self, board_id: uuid.UUID, event_type: str, **data) -> None:
+        self.events.append((board_id, event_type, data))
+
+
+async def _load_context(
+    db: AsyncSession, operations: list[BatchOperation], owner_id: uuid.UUID
+) -> _BatchContext:
+    """
+    Preload every referenced list and card and the user's board roles: three
+    queries. Cards are looked up on the user's boards only, which keeps the
+    lookup to those boards' partitions.
+    """
+    list_ids = {op.list_id for op in operations if getattr(op, "list_id", None)}
+    card_ids = {op.card_id for op in operations if getattr(op, "card_id", None)}
+
+    lists: dict[uuid.UUID, List] = {}
+    if list_ids:
+        result = await db.execute(
+            select(List).where(List.id.in_(list_ids), List.deleted_at.is_(None))
+        )
+        lists = {lst.id: lst for lst in result.scalars()}
+
+    # Land staged card edits before any card rows are locked
+    deleted_lists = {op.list_id for op in operations if isinstance(op, ListDeleteOp)}
+    for board_id in {lists[i].board_id for i in deleted_lists if i in lists}:
+        await card_writes.flush_board(board_id)
+    for card_id in card_ids:
+        await card_writes.flush_card(card_id)
+
+    roles = await board_access(db, owner_id).roles()
+
+    cards: dict[uuid.UUID, Card] = {}
+    if card_ids and roles:
+        query = select(Card).where(
+            Card.board_id.in_(roles),
+            Card.id.in_(card_ids),
+            Card.deleted_at.is_(None),
+        )
+        # Lock the cards for the whole batch, as move_card does for one
+        dialect = db.bind.dialect.name if db.bind else ""
+        if dialect != "sqlite":
+            query = query.with_for_update()
+        result = await db.execute(query)
+        cards = {card.id: card for card in result.scalars()}
+
+    return _BatchContext(lists, cards, roles)
+
+
+async def _create_list(db: AsyncSession, ctx: _BatchContext, op: ListCreateOp) -> List:
+    board_id = op.board_id
+    check_role(ctx.roles.get(board_id), EDITOR)
+    rank = await new_list_rank(db, board_id, op.after_rank)
+
+    lst = List(board_id=board_id, title=op.title, rank=rank, wip_limit=op.wip_limit)
+    db.add(lst)
+    await db.flush()
+    ctx.lists[lst.id] = lst
+    if op.ref is not None:
+        ctx.list_refs[op.ref] = lst.id
+    ctx.event(board_id, "list.created", id=lst.id, title=lst.title, rank=lst.rank)
+    return lst
+
+
+async def _update_list(db: AsyncSession, ctx: _BatchContext, op: ListUpdateOp) -> List:
+    lst = ctx.get_list(op)
+    if op.title is not None:
+        lst.title = op.title
+    if "wip_limit" in op.model_fields_set:
+        lst.wip_limit = op.wip_limit
+    ctx.event(
+        lst.board_id,
+        "list.updated",
+        id=lst.id,
+        title=lst.title,
+        wip_limit=lst.wip_limit,
+    )
+    return lst
+
+
+async def _delete_list(db: AsyncSession, ctx: _BatchContext, op: ListDeleteOp) -> List:
+    lst = ctx.get_list(op)
+    now = datetime.now(timezone.utc)
+    lst.deleted_at = now
+    lst.card_count = 0
+    await db.execute(
+        update(Card)
+        .where(
+            Card.board_id == lst.board_id,
+            Card.list_id == lst.id,
+            Card.deleted_at.is_(None),
+        )
+        .values(deleted_at=now)
+    )
+    ctx.event(lst.board_id, "list.deleted", id=lst.id)
+    return lst
+
+
+async def _create_card(db: AsyncSession, ctx: _BatchContext, op: CardCreateOp) -> Card:
+    lst = ctx.get_list(op)
+    rank = await new_card_rank(db, lst.board_id, lst.id)
+    await adjust_card_count(db, lst.id, 1)
+
+    card = Card(
+        title=op.title,
+        description=op.description,
+        list_id=lst.id,
+        board_id=lst.board_id,
+        rank=rank,
+    )
+    db.add(card)
+    await db.flush()
+    ctx.cards[card.id] = card
+    ctx.created_cards.append(card)
+    if op.ref is not None:
+        ctx.card_refs[op.ref] = card.id
+    ctx.event(
+        card.board_id,
+        "card.created",
+        id=card.id,
+        list_id=card.list_id,
+        title=card.title,
+        rank=card.rank,
+    )
+    return card
+
+
+async def _update_card(db: AsyncSession, ctx: _BatchContext, op: CardUpdateOp) -> Card:
+    card = ctx.get_card(op)
+    if op.title is not None:
+        card.title = op.title
+    if op.description is not None:
+        card.description = op.description
+    ctx.event(
+        card.board_id,
+        "card.updated",
+        id=card.id,
+        title=card.title,
+        description=card.description,
+    )
+    return card
+
+
+async def _move_card(db: AsyncSession, ctx: _BatchContext, op: CardMoveOp) -> Card:
+    card = ctx.get_card(op)
+    target = ctx.get_list(op, "Target list not found")
+    if target.board_id != card.board_id:
+        raise _not_found("Target list not found")
+
+    new_rank = LexoRank.rank_between(op.before_rank, op.after_rank)
+    ranks = await resolve_rank_collisions(db, target, [new_rank], [card.id])
+    [card] = await relocate_cards(db, [card], target, ranks)
+    ctx.event(
+        card.board_id, "card.moved", id=card.id, list_id=card.list_id, rank=card.rank
+    )
+    return card
+
+
+async def _delete_card(db: AsyncSession, ctx: _BatchContext, op: CardDeleteOp) -> Card:
+    card = ctx.get_card(op)
+    card.deleted_at = datetime.now(timezone.utc)
+    await adjust_card_count(db, card.list_id, -1)
+    ctx.event(card.board_id, "card.deleted", id=card.id)
+    return card
+
+
+_HANDLERS = {
+    "list.create": _create_list,
+    "list.update": _update_list,
+    "list.delete": _delete_list,
+    "card.create": _create_card,
+    "card.update": _update_card,
+    "card.move": _move_card,
+    "card.delete": _delete_card,
+}
+
+
+async def execute_batch(
+    db: AsyncSession, operations: list[BatchOperation], owner_id: uuid.UUID
+) -> BatchResponse:
+    """
+    Run an ordered list of list/card mutations in one transaction.
+
+    Referenced lists and cards are loaded up front and board access is
+    resolved with one membership lookup. If any operation fails the whole
+    batch is rolled back and the error names the failing operation's index.
+    Events are published only after the commit.
+    """
+    ctx = await _load_context(db, operations, owner_id)
+    entities = []
+    for index, op in enumerate(operations):
+        try:
+            entities.append(await _HANDLERS[op.op](db, ctx, op))
+            # Surface constraint violations at the operation that caused them
+            await db.flush()
+        except HTTPException as exc:
+            await db.rollback()
+            raise HTTPException(
+                status_code=exc.status_code,
+                detail=f"Operation {index} ({op.op}) failed: {exc.detail}",
+            )
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Operation {index} ({op.op}) conflicts with existing data",
+            )
+    await db.commit()
+
+    if ctx.created_cards:
+        # Load server-generated timestamps for all new cards in one query
+        await db.execute(
+            select(Card)
+            .where(
+                Card.board_id.in_({card.board_id for card in ctx.created_cards}),
+                Card.id.in_([card.id for card in ctx.created_cards]),
+            )
+            .execution_options(populate_existing=True)
+        )
+
+    for board_id, event_type, data in ctx.events:
+        publish_event(board_id, event_type, actor_id=owner_id, **data)
+
+    results = []
+    for index, (op, entity) in enumerate(zip(operations, entities)):
+        result = BatchResult(index=index, op=op.op, id=entity.id)
+        if op.op in ("list.create", "list.update"):
+            result.list = BatchListOut.model_validate(entity)
+        elif op.op in ("card.create", "card.update", "card.move"):
+            result.card = CardOut.model_validate(entity)
+        results.append(result)
+    return BatchResponse(results=results)
@@ -2,15 +2,33 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from app.core.access import EDITOR, OWNER, VIEWER, board_access
+from app.core.coalescer import card_writes
+from app.core.events import publish_event
+from app.core.fields import FieldTree, all_fields, selected
+from app.core.ids import uuid7_sql
 from app.core.lexorank import LexoRank
 from app.models.board import Board
+from app.models.board_member import BoardMember
 from app.models.card import Card
 from app.models.list import List
-from app.schemas.board import BoardCreate, BoardUpdate
+from app.schemas.board import BoardCreate, BoardDetailOut, BoardDuplicate, BoardUpdate
+
+
+def _new_uuid_sql(db: AsyncSession):
+    """SQL expression producing a fresh UUIDv7 per row for INSERT ... SELECT."""
+    dialect = db.bind.dialect.name if db.bind else ""
+    return uuid7_sql(dialect)
+
+
+def add_owner(db: AsyncSession, board: Board) -> None:
+    """Make the board's creator its owner member (the board must be flushed)."""
+    db.add(BoardMember(board_id=board.id, user_id=board.owner_id, role=OWNER))
+    board_access(db, board.owner_id).grant(board.id, OWNER)
 
 
 async def create_board(
@@ -24,6 +42,7 @@ async def create_board(
     )
     db.add(board)
     await db.flush()
+    add_owner(db, board)
 
     # Create default "To Do" list
     default_list = List(
@@ -35,40 +54,39 @@ async def create_board(
     await db.commit()
     await db.refresh(board)
 
-    # Eager load lists for the response
+    # Eager load lists for the response; a new board has no cards
     result = await db.execute(
         select(Board)
         .where(Board.id == board.id)
-        .options(selectinload(Board.lists).selectinload(List.cards))
+        .options(selectinload(Board.lists).noload(List.cards))
     )
     return result.scalar_one()
 
 
 async def get_boards(db: AsyncSession, owner_id: uuid.UUID) -> list[Board]:
-    """Get all non-deleted boards for a user, ordered by creation date."""
+    """Get all non-deleted boards the user is a member of, newest first."""
     result = await db.execute(
         select(Board)
-        .where(Board.owner_id == owner_id, Board.deleted_at.is_(None))
+        .join(
+            BoardMember,
+            (BoardMember.board_id == Board.id) & (BoardMember.user_id == owner_id),
+        )
+        .where(Board.deleted_at.is_(None))
         .order_by(Board.created_at.desc())
     )
     return list(result.scalars().all())
 
 
-async def get_board_detail(
-    db: AsyncSession, board_id: uuid.UUID, owner_id: uuid.UUID
+async def get_board(
+    db: AsyncSession,
+    board_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    role: str = VIEWER,
 ) -> Board:
-    """
-    Get board with all active lists and cards using selectinload.
-    Generates exactly 3 queries (board + lists + cards) — no N+1.
-    """
+    """Get a single active board the user has at least `role` on, without lists."""
+    await board_access(db, owner_id).require(board_id, role)
     result = await db.execute(
-        select(Board)
-        .where(
-            Board.id == board_id,
-            Board.owner_id == owner_id,
-            Board.deleted_at.is_(None),
-        )
-        .options(selectinload(Board.lists).selectinload(List.cards))
+        select(Board).where(Board.id == board_id, Board.deleted_at.is_(None))
     )
     board = result.scalar_one_or_none()
     if not board:
@@ -76,35 +94,237 @@ async def get_board_detail(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Board not found",
         )
+    return board
 
-    # Filter out soft-deleted lists and cards in-memory
-    board.lists = [lst for lst in board.lists if lst.deleted_at is None]
-    for lst in board.lists:
-        lst.cards = [card for card in lst.cards if card.deleted_at is None]
 
-    return board
+class BoardView:
+    """Read-only board for `BoardDetailOut`, built from plain rows."""
 
+    __slots__ = ("id", "title", "description", "owner_id", "created_at", "lists")
 
-async def update_board(
+    def __init__(self, id, title, description, owner_id, created_at):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.owner_id = owner_id
+        self.created_at = created_at
+        self.lists: list[ListView] = []
+
+
+class ListView:
+    """Read-only list for `ListOut`."""
+
+    __slots__ = ("id", "title", "rank", "board_id", "card_count", "wip_limit", "cards")
+
+    def __init__(self, id, title, rank, board_id, card_count, wip_limit):
+        self.id = id
+        self.title = title
+        self.rank = rank
+        self.board_id = board_id
+        self.card_count = card_count
+        self.wip_limit = wip_limit
+        self.cards: list[CardView] = []
+
+
+class CardView:
+    """Read-only card for `CardOut`."""
+
+    __slots__ = ("id", "title", "description", "rank", "list_id", "created_at")
+
+    def __init__(self, id, title, description, rank, list_id, created_at):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.rank = rank
+        self.list_id = list_id
+        self.created_at = created_at
+
+
+async def get_board_detail(
     db: AsyncSession,
     board_id: uuid.UUID,
     owner_id: uuid.UUID,
-    data: BoardUpdate,
-) -> Board:
-    """Update a board's title and/or description."""
+    fields: FieldTree | None = None,
+) -> BoardView:
+    """
+    Get board with all active lists and cards in 3 queries (board, lists,
+    cards) after the access check — no N+1.
+
+    This is a read-only path: it selects only the columns `BoardDetailOut`
+    renders and builds `__slots__` views from the rows, so nothing is added
+    to the identity map or instrumented for change tracking. Rows come
+    straight from the database, so writes flushed by other sessions are
+    always visible. `python -m benchmarks.board_detail` compares it with
+    loading ORM instances.
+
+    Cards are loaded with one query on `board_id` rather than per list, so a
+    partitioned `cards` table is read from a single partition.
+
+    `fields` (see app.core.fields) narrows the selects further: columns
+    outside it are selected as NULL, and the lists or cards query is skipped
+    when they are not requested. Summary mode leaves out `cards.description`
+    this way, so long descriptions are neither read from TOAST nor sent.
+    """
+    fields = fields or all_fields(BoardDetailOut)
+    await board_access(db, owner_id).require(board_id)
+    await card_writes.flush_board(board_id)
     result = await db.execute(
-        select(Board).where(
-            Board.id == board_id,
-            Board.owner_id == owner_id,
-            Board.deleted_at.is_(None),
-        )
+        select(
+            *selected(
+                fields,
+                Board.id,
+                Board.title,
+                Board.description,
+                Board.owner_id,
+                Board.created_at,
+            )
+        ).where(Board.id == board_id, Board.deleted_at.is_(None))
     )
-    board = result.scalar_one_or_none()
-    if not board:
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Board not found",
         )
+    board = BoardView(*row)
+    if "lists" not in fields:
+        return board
+
+    list_fields = fields["lists"]
+    lists_result = await db.execute(
+        select(
+            List.id,
+            *selected(
+                list_fields,
+                List.id,
+                List.title,
+                List.rank,
+                List.board_id,
+                List.card_count,
+                List.wip_limit,
+            ),
+        )
+        .where(List.board_id == board_id, List.deleted_at.is_(None))
+        .order_by(List.rank)
+    )
+    lists_by_id = {}
+    for row in lists_result:
+        lst = ListView(*row[1:])
+        board.lists.append(lst)
+        lists_by_id[row[0]] = lst.cards
+    if "cards" not in list_fields:
+        return board
+
+    # Cards arrive in rank order, so appending keeps each list sorted.
+    # Cards of soft-deleted lists have no entry and are skipped.
+    cards_result = await db.execute(
+        select(
+            Card.list_id,
+            *selected(
+                list_fields["cards"],
+                Card.id,
+                Card.title,
+                Card.description,
+                Card.rank,
+                Card.list_id,
+                Card.created_at,
+            ),
+        )
+        .where(Card.board_id == board_id, Card.deleted_at.is_(None))
+        .order_by(Card.rank)
+    )
+    for row in cards_result:
+        cards = lists_by_id.get(row[0])
+        if cards is not None:
+            cards.append(CardView(*row[1:]))
+
+    return board
+
+
+async def duplicate_board(
+    db: AsyncSession,
+    board_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    data: BoardDuplicate,
+) -> BoardView:
+    """
+    Copy a board with its active lists and cards in one transaction.
+
+    Lists and cards are copied server-side with two INSERT ... SELECT
+    statements, so the cost is independent of ORM hydration. Ranks are kept
+    as-is; since (board_id, rank) is unique, new lists are matched to their
+    source lists by rank when copying cards.
+    """
+    source = await get_board(db, board_id, owner_id)
+    await card_writes.flush_board(board_id)
+
+    board = Board(
+        title=data.title or f"{source.title} (copy)",
+        description=source.description,
+        owner_id=owner_id,
+    )
+    db.add(board)
+    await db.flush()
+    add_owner(db, board)
+
+    new_board_id = literal(board.id, Board.id.type)
+
+    # 1. Copy active lists
+    await db.execute(
+        insert(List).from_select(
+            ["id", "board_id", "title", "rank", "card_count", "wip_limit"],
+            select(
+                _new_uuid_sql(db),
+                new_board_id,
+                List.title,
+                List.rank,
+                # Every active card of an active list is copied
+                List.card_count,
+                List.wip_limit,
+            ).where(List.board_id == board_id, List.deleted_at.is_(None)),
+        )
+    )
+
+    # 2. Copy active cards, remapping list_id via the (board_id, rank) key
+    source_list = aliased(List)
+    target_list = aliased(List)
+    await db.execute(
+        insert(Card).from_select(
+            ["id", "list_id", "board_id", "title", "description", "rank"],
+            select(
+                _new_uuid_sql(db),
+                target_list.id,
+                new_board_id,
+                Card.title,
+                Card.description,
+                Card.rank,
+            )
+            .join(source_list, source_list.id == Card.list_id)
+            .join(
+                target_list,
+                (target_list.board_id == board.id)
+                & (target_list.rank == source_list.rank),
+            )
+            .where(
+                Card.board_id == board_id,
+                Card.deleted_at.is_(None),
+                source_list.deleted_at.is_(None),
+            ),
+        )
+    )
+
+    await db.commit()
+    return await get_board_detail(db, board.id, owner_id)
+
+
+async def update_board(
+    db: AsyncSession,
+    board_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    data: BoardUpdate,
+) -> Board:
+    """Update a board's title and/or description (editors and owners)."""
+    board = await get_board(db, board_id, owner_id, EDITOR)
 
     if data.title is not None:
         board.title = data.title
@@ -113,6 +333,13 @@ async def update_board(
 
     await db.commit()
     await db.refresh(board)
+    publish_event(
+        board.id,
+        "board.updated",
+        actor_id=owner_id,
+        title=board.title,
+        description=board.description,
+    )
     return board
 
 
@@ -121,23 +348,12 @@ async def soft_delete_board(
 ) -> None:
     """
     Soft delete a board and cascade to all its lists and cards.
-    Single transaction — commit once.
+    Single transaction — commit once. Owners only.
     """
     now = datetime.now(timezone.utc)
 
-    result = await db.execute(
-        select(Board).where(
-            Board.id == board_id,
-            Board.owner_id == owner_id,
-            Board.deleted_at.is_(None),
-        )
-    )
-    board = result.scalar_one_or_none()
-    if not board:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found",
-        )
+    board = await get_board(db, board_id, owner_id, OWNER)
+    await card_writes.flush_board(board_id)
 
     board.deleted_at = now
 
@@ -148,6 +364,7 @@ async def soft_delete_board(
     lists = lists_result.scalars().all()
     for lst in lists:
         lst.deleted_at = now
+        lst.card_count = 0
 
     # Cascade soft delete to cards
     cards_result = await db.execute(
@@ -158,3 +375,5 @@ async def soft_delete_board(
         card.deleted_at = now
 
     await db.commit()
+    board_access(db, owner_id).revoke(board_id)
+    publish_event(board_id, "board.deleted", actor_id=owner_id)
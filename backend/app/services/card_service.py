@@ -1,34 +1,121 @@
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import case, func, literal, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.access import EDITOR, VIEWER, board_access, check_role
+from app.core.coalescer import PendingCardWrite, card_writes
+from app.core.events import publish_event
+from app.core.fields import FieldTree, all_fields, selected
 from app.core.lexorank import LexoRank
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.board import Board
+from app.models.board_member import BoardMember
 from app.models.card import Card
 from app.models.list import List
-from app.schemas.card import CardCreate, CardMove, CardUpdate
+from app.schemas.board import CardOut
+from app.schemas.card import (
+    CardBulkMove,
+    CardCreate,
+    CardMove,
+    CardPage,
+    CardSummaryOut,
+    CardUpdate,
+)
+from app.services.board_service import CardView
+from app.services.list_service import adjust_card_count, apply_card_count_deltas
 
 
-async def create_card(
-    db: AsyncSession, data: CardCreate, owner_id: uuid.UUID
+async def _editable_card(
+    db: AsyncSession,
+    card_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    board_id: uuid.UUID,
+    lock: bool = False,
 ) -> Card:
-    """Create a new card at the end of a list."""
-    # Verify board ownership
-    board_result = await db.execute(
-        select(Board).where(
-            Board.id == data.board_id,
-            Board.owner_id == owner_id,
-            Board.deleted_at.is_(None),
-        )
+    """
+    One live card on a board where the user is at least an editor.
+
+    `cards` may be hash-partitioned on board_id (migration 007); the board id
+    is part of the predicate, so the lookup is pruned to one partition at
+    plan time.
+    """
+    query = select(Card).where(
+        Card.board_id == board_id, Card.id == card_id, Card.deleted_at.is_(None)
     )
-    if not board_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found",
+    # SQLite doesn't support FOR UPDATE — only lock in production (PostgreSQL)
+    dialect = db.bind.dialect.name if db.bind else ""
+    if lock and dialect != "sqlite":
+        query = query.with_for_update()
+
+    result = await db.execute(query)
+    card = result.scalar_one_or_none()
+    role = await board_access(db, owner_id).role(card.board_id) if card else None
+    check_role(role, EDITOR, "Card not found")
+    return card
+
+
+async def get_card(
+    db: AsyncSession,
+    card_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    board_id: uuid.UUID,
+    fields: FieldTree | None = None,
+) -> CardView:
+    """
+    One card with its description, for clients that load boards in summary
+    mode. Any member of the card's board may read it; `fields` narrows the
+    select as in board detail.
+    """
+    fields = fields or all_fields(CardOut)
+    await card_writes.flush_card(card_id)
+    query = select(
+        Card.board_id,
+        *selected(
+            fields,
+            Card.id,
+            Card.title,
+            Card.description,
+            Card.rank,
+            Card.list_id,
+            Card.created_at,
+        ),
+    ).where(Card.board_id == board_id, Card.id == card_id, Card.deleted_at.is_(None))
+    row = (await db.execute(query)).first()
+    role = await board_access(db, owner_id).role(row[0]) if row else None
+    check_role(role, VIEWER, "Card not found")
+    return CardView(*row[1:])
+
+
+async def new_card_rank(
+    db: AsyncSession, board_id: uuid.UUID, list_id: uuid.UUID
+) -> str:
+    """
+    Rank for a card appended to a list: one row read from the end of the
+    (list_id, rank) index, independent of how many cards the list holds.
+    Soft-deleted cards count, since uq_card_list_rank still holds their ranks.
+    """
+    last_rank = (
+        await db.execute(
+            select(Card.rank)
+            .where(Card.board_id == board_id, Card.list_id == list_id)
+            .order_by(Card.rank.desc())
+            .limit(1)
         )
+    ).scalar_one_or_none()
+    return LexoRank.rank_after(last_rank) if last_rank else LexoRank.initial_rank()
+
+
+async def create_card(
+    db: AsyncSession, data: CardCreate, owner_id: uuid.UUID
+) -> Card:
+    """Create a new card at the end of a list, within its WIP limit."""
+    # Verify board access
+    await board_access(db, owner_id).require(data.board_id, EDITOR)
 
     # Verify list belongs to board
     list_result = await db.execute(
@@ -44,16 +131,10 @@ async def create_card(
             detail="List not found",
         )
 
-    # Get last card rank in list
-    last_rank_result = await db.execute(
-        select(Card.rank)
-        .where(Card.list_id == data.list_id, Card.deleted_at.is_(None))
-        .order_by(Card.rank.desc())
-        .limit(1)
-    )
-    last_rank = last_rank_result.scalar_one_or_none()
+    rank = await new_card_rank(db, data.board_id, data.list_id)
 
-    rank = LexoRank.rank_after(last_rank) if last_rank else LexoRank.initial_rank()
+    # Count the card and check the WIP limit in one statement (409 if full)
+    await adjust_card_count(db, data.list_id, 1)
 
     card = Card(
         title=data.title,
@@ -64,6 +145,15 @@ async def create_card(
     db.add(card)
     await db.commit()
     await db.refresh(card)
+    publish_event(
+        card.board_id,
+        "card.created",
+        actor_id=owner_id,
+        id=card.id,
+        list_id=card.list_id,
+        title=card.title,
+        rank=card.rank,
+    )
     return card
 
 
@@ -72,23 +162,34 @@ async def update_card(
     card_id: uuid.UUID,
     owner_id: uuid.UUID,
     data: CardUpdate,
-) -> Card:
-    """Update a card's title and/or description."""
-    result = await db.execute(
-        select(Card)
-        .join(Board, Board.id == Card.board_id)
-        .where(
-            Card.id == card_id,
-            Board.owner_id == owner_id,
-            Card.deleted_at.is_(None),
-        )
-    )
-    card = result.scalar_one_or_none()
-    if not card:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Card not found",
-        )
+    board_id: uuid.UUID,
+) -> Card | PendingCardWrite:
+    """
+    Update a card's title and/or description.
+
+    With write coalescing enabled, the change is staged in memory and merged
+    with further edits of the same card; the staged state is returned.
+    """
+    if card_writes.enabled:
+        changes = data.model_dump(exclude_none=True)
+        pending = card_writes.staged(card_id, owner_id)
+        if pending is not None:
+            # Same checks as _editable_card: the role may have been revoked
+            # or lowered since the edit was staged
+            same_board = board_id == pending.board_id
+            access = board_access(db, owner_id)
+            role = await access.role(pending.board_id) if same_board else None
+            check_role(role, EDITOR, "Card not found")
+            merged = card_writes.merge(card_id, owner_id, changes)
+            if merged is not None:
+                return merged
+        # Another user's staged edit or an in-flight write must land first
+        await card_writes.flush_card(card_id)
+
+    card = await _editable_card(db, card_id, owner_id, board_id)
+
+    if card_writes.enabled:
+        return card_writes.stage(card, owner_id, changes)
 
     if data.title is not None:
         card.title = data.title
@@ -97,6 +198,14 @@ async def update_card(
 
     await db.commit()
     await db.refresh(card)
+    publish_event(
+        card.board_id,
+        "card.updated",
+        actor_id=owner_id,
+        id=card.id,
+        title=card.title,
+        description=card.description,
+    )
     return card
 
 
@@ -105,106 +214,306 @@ async def move_card(
     card_id: uuid.UUID,
     data: CardMove,
     owner_id: uuid.UUID,
+    board_id: uuid.UUID,
 ) -> Card:
     """
     Move a card to a new position using SELECT FOR UPDATE (row-level lock).
+
+    The target list may be on any board the user can edit; the card's board_id
+    follows its list.
     
     Concurrency handling:
     - User A's transaction acquires the lock first
     - User B's transaction WAITS (blocks) until A commits
     - When B proceeds, it reads the UPDATED card state
     """
-    # 1. SELECT the card FOR UPDATE (row-level lock) — skip on SQLite
-    query = select(Card).where(Card.id == card_id, Card.deleted_at.is_(None))
-    
-    # SQLite doesn't support FOR UPDATE — only lock in production (PostgreSQL)
+    await card_writes.flush_card(card_id)
+
+    # 1. SELECT the card FOR UPDATE (row-level lock) and check the user may
+    #    edit its board — the lock is skipped on SQLite
+    card = await _editable_card(db, card_id, owner_id, board_id, lock=True)
+
+    # 2. Verify target list exists, is active and on a board the user edits
+    target = await _target_list(db, data.list_id, owner_id)
+
+    # 3. Compute new rank
+    new_rank = LexoRank.rank_between(data.before_rank, data.after_rank)
+
+    # 4. Check for rank collision in target list
+    ranks = await resolve_rank_collisions(db, target, [new_rank], [card.id])
+
+    # 5. Update card, list counts and (across boards) both boards in place
+    source_board_id = card.board_id
+    [card] = await relocate_cards(db, [card], target, ranks)
+
+    await db.commit()
+    _publish_moves([card], {card.id: source_board_id}, owner_id)
+    return card
+
+
+async def move_cards(
+    db: AsyncSession, data: CardBulkMove, owner_id: uuid.UUID
+) -> list[Card]:
+    """
+    Move several cards, possibly from different lists and boards, to
+    consecutive positions in one target list.
+
+    All cards are locked with one SELECT FOR UPDATE and rewritten with one
+    UPDATE; the access check for every board involved is a single
+    membership lookup. `data.board_ids` names the cards' boards, so the
+    lookup only reads those partitions.
+    """
+    card_ids = list(dict.fromkeys(data.card_ids))
+    for card_id in card_ids:
+        await card_writes.flush_card(card_id)
+
+    query = select(Card).where(
+        Card.board_id.in_(set(data.board_ids)),
+        Card.id.in_(card_ids),
+        Card.deleted_at.is_(None),
+    )
     dialect = db.bind.dialect.name if db.bind else ""
     if dialect != "sqlite":
         query = query.with_for_update()
-    
-    result = await db.execute(query)
-    card = result.scalar_one_or_none()
-    if not card:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Card not found",
-        )
+    cards_by_id = {card.id: card for card in (await db.execute(query)).scalars()}
+    roles = await board_access(db, owner_id).roles()
+    for card_id in card_ids:
+        card = cards_by_id.get(card_id)
+        check_role(roles.get(card.board_id) if card else None, EDITOR, "Card not found")
+    # Keep the request order: cards land in the target list in this order
+    cards = [cards_by_id[card_id] for card_id in card_ids]
 
-    # 2. Verify board ownership
-    board_result = await db.execute(
-        select(Board).where(
-            Board.id == card.board_id,
-            Board.owner_id == owner_id,
-            Board.deleted_at.is_(None),
-        )
+    target = await _target_list(db, data.list_id, owner_id)
+    ranks = _spread_ranks(data.before_rank, data.after_rank, len(cards))
+    ranks = await resolve_rank_collisions(db, target, ranks, card_ids)
+
+    source_board_ids = {card.id: card.board_id for card in cards}
+    moved = await relocate_cards(db, cards, target, ranks)
+
+    await db.commit()
+    _publish_moves(moved, source_board_ids, owner_id)
+    return moved
+
+
+async def _target_list(
+    db: AsyncSession, list_id: uuid.UUID, owner_id: uuid.UUID
+) -> List:
+    """The active list a move targets, on a board the user can edit."""
+    result = await db.execute(
+        select(List).where(List.id == list_id, List.deleted_at.is_(None))
     )
-    if not board_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found",
+    target = result.scalar_one_or_none()
+    role = await board_access(db, owner_id).role(target.board_id) if target else None
+    check_role(role, EDITOR, "Target list not found")
+    return target
+
+
+def _spread_ranks(before: str | None, after: str | None, count: int) -> list[str]:
+    """`count` increasing ranks between two neighbors, for consecutive positions."""
+    ranks = []
+    for _ in range(count):
+        before = LexoRank.rank_between(before, after)
+        ranks.append(before)
+    return ranks
+
+
+async def resolve_rank_collisions(
+    db: AsyncSession,
+    target: List,
+    ranks: list[str],
+    moving_ids: list[uuid.UUID],
+) -> list[str]:
+    """
+    Extend any rank already held by another card in the target list.
+
+    Soft-deleted cards count too: uq_card_list_rank covers them, so their
+    ranks are just as unavailable. Extended ranks are checked again until
+    none collides.
+    """
+    while True:
+        result = await db.execute(
+            select(Card.rank).where(
+                Card.board_id == target.board_id,
+                Card.list_id == target.id,
+                Card.rank.in_(ranks),
+                Card.id.not_in(moving_ids),
+            )
         )
+        taken = set(result.scalars())
+        if not taken:
+            return ranks
+        # Conflict resolution: extend the rank
+        ranks = [
+            f"0|{LexoRank.parse(rank)}i:" if rank in taken else rank for rank in ranks
+        ]
 
-    # 3. Verify target list exists and is active
-    target_list_result = await db.execute(
-        select(List).where(
-            List.id == data.list_id,
-            List.deleted_at.is_(None),
+
+async def relocate_cards(
+    db: AsyncSession, cards: list[Card], target: List, ranks: list[str]
+) -> list[Card]:
+    """
+    Rewrite list_id, board_id and rank of `cards` with one set-based UPDATE.
+
+    Updating board_id with the list keeps every board-scoped query (board
+    detail, cascades, the board_id index and partition) correct after a
+    cross-board move. List counts are adjusted and the target's WIP limit
+    checked first; a cross-board move also bumps updated_at on both boards.
+    Returns the cards reloaded under their new identity.
+    """
+    deltas: dict[uuid.UUID, int] = defaultdict(int)
+    for card in cards:
+        if card.list_id != target.id:
+            deltas[card.list_id] -= 1
+            deltas[target.id] += 1
+    await apply_card_count_deltas(db, deltas)
+
+    card_ids = [card.id for card in cards]
+    board_ids = {card.board_id for card in cards} | {target.board_id}
+    try:
+        await db.execute(
+            update(Card)
+            .where(
+                Card.id.in_(card_ids),
+                Card.board_id.in_({card.board_id for card in cards}),
+            )
+            .values(
+                list_id=target.id,
+                board_id=target.board_id,
+                rank=case(dict(zip(card_ids, ranks)), value=Card.id),
+            )
+            .execution_options(synchronize_session=False)
         )
-    )
-    if not target_list_result.scalar_one_or_none():
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Target list not found",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Target position was taken; reload the list and move again",
         )
-
-    # 4. Compute new rank
-    new_rank = LexoRank.rank_between(data.before_rank, data.after_rank)
-
-    # 5. Check for rank collision in target list
-    collision_result = await db.execute(
-        select(func.count())
-        .select_from(Card)
-        .where(
-            Card.list_id == data.list_id,
-            Card.rank == new_rank,
-            Card.id != card_id,
-            Card.deleted_at.is_(None),
+    if len(board_ids) > 1:
+        await db.execute(
+            update(Board).where(Board.id.in_(board_ids)).values(updated_at=func.now())
         )
+
+    result = await db.execute(
+        select(Card)
+        .where(Card.id.in_(card_ids), Card.board_id == target.board_id)
+        .order_by(Card.rank)
+        .execution_options(populate_existing=True)
     )
-    collision_count = collision_result.scalar()
-    if collision_count and collision_count > 0:
-        # Conflict resolution: extend the rank
-        new_rank = LexoRank.parse(new_rank)
-        new_rank = f"0|{new_rank}i:"
+    return list(result.scalars())
 
-    # 6. Update card
-    card.list_id = data.list_id
-    card.rank = new_rank
 
-    await db.commit()
-    await db.refresh(card)
-    return card
+def _publish_moves(
+    cards: list[Card], source_board_ids: dict[uuid.UUID, uuid.UUID], owner_id: uuid.UUID
+) -> None:
+    """card.moved on the target board, and on the source board if it changed."""
+    for card in cards:
+        data = {"id": card.id, "list_id": card.list_id, "rank": card.rank}
+        source_board_id = source_board_ids[card.id]
+        if source_board_id == card.board_id:
+            publish_event(card.board_id, "card.moved", actor_id=owner_id, **data)
+            continue
+        data.update(from_board_id=source_board_id, to_board_id=card.board_id)
+        for board_id in (source_board_id, card.board_id):
+            publish_event(board_id, "card.moved", actor_id=owner_id, **data)
 
 
 async def soft_delete_card(
-    db: AsyncSession, card_id: uuid.UUID, owner_id: uuid.UUID
+    db: AsyncSession,
+    card_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    board_id: uuid.UUID,
 ) -> None:
     """Soft delete a card."""
-    result = await db.execute(
-        select(Card)
+    await card_writes.flush_card(card_id)
+    card = await _editable_card(db, card_id, owner_id, board_id)
+
+    card.deleted_at = datetime.now(timezone.utc)
+    await adjust_card_count(db, card.list_id, -1)
+    await db.commit()
+    publish_event(card.board_id, "card.deleted", actor_id=owner_id, id=card.id)
+
+
+def _timestamp_param(db: AsyncSession, value: datetime):
+    """
+    Bind a timestamp for comparison against server-defaulted columns.
+
+    SQLite stores `now()` defaults as 'YYYY-MM-DD HH:MM:SS' text, so the
+    value is rendered in that exact form to keep keyset ties comparable.
+    """
+    dialect = db.bind.dialect.name if db.bind else ""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    if dialect == "sqlite":
+        return literal(value.strftime("%Y-%m-%d %H:%M:%S"))
+    return literal(value, Card.created_at.type)
+
+
+async def query_cards(
+    db: AsyncSession,
+    owner_id: uuid.UUID,
+    *,
+    board_id: uuid.UUID | None = None,
+    list_id: uuid.UUID | None = None,
+    created_after: datetime | None = None,
+    updated_after: datetime | None = None,
+    title_prefix: str | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> CardPage:
+    """
+    Filter live cards on the user's boards with keyset pagination.
+
+    Results are ordered by (created_at, id); the cursor encodes the last row's
+    key so each page is a single index range scan regardless of depth.
+    Only the slim summary columns are selected.
+    """
+    # Land staged edits on the queried board, or on all the caller's boards
+    if board_id is not None:
+        await card_writes.flush_board(board_id)
+    else:
+        await card_writes.flush_boards(await board_access(db, owner_id).roles())
+    query = (
+        select(
+            Card.id,
+            Card.title,
+            Card.rank,
+            Card.list_id,
+            Card.board_id,
+            Card.created_at,
+            Card.updated_at,
+        )
         .join(Board, Board.id == Card.board_id)
-        .where(
-            Card.id == card_id,
-            Board.owner_id == owner_id,
-            Card.deleted_at.is_(None),
+        .join(
+            BoardMember,
+            (BoardMember.board_id == Card.board_id)
+            & (BoardMember.user_id == owner_id),
         )
+        .where(Board.deleted_at.is_(None), Card.deleted_at.is_(None))
     )
-    card = result.scalar_one_or_none()
-    if not card:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Card not found",
+    if board_id is not None:
+        query = query.where(Card.board_id == board_id)
+    if list_id is not None:
+        query = query.where(Card.list_id == list_id)
+    if created_after is not None:
+        query = query.where(Card.created_at > _timestamp_param(db, created_after))
+    if updated_after is not None:
+        query = query.where(Card.updated_at > _timestamp_param(db, updated_after))
+    if title_prefix:
+        query = query.where(Card.title.startswith(title_prefix, autoescape=True))
+    if cursor is not None:
+        after_created, after_id = decode_cursor(cursor)
+        after_key = tuple_(
+            _timestamp_param(db, after_created), literal(after_id, Card.id.type)
         )
+        query = query.where(tuple_(Card.created_at, Card.id) > after_key)
 
-    card.deleted_at = datetime.now(timezone.utc)
-    await db.commit()
+    query = query.order_by(Card.created_at, Card.id).limit(limit + 1)
+    rows = (await db.execute(query)).all()
+
+    items = [CardSummaryOut.model_validate(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return CardPage(items=items, next_cursor=next_cursor)
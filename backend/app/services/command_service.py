@@ -0,0 +1,38 @@
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.card import Card
+from app.schemas.card import CardCreate, CardMove, CardUpdate
+from app.schemas.command import Command
+from app.services import card_service
+
+
+async def execute_command(
+    db: AsyncSession, board_id: uuid.UUID, command: Command, owner_id: uuid.UUID
+) -> Card:
+    """
+    Run one WebSocket command through the regular card_service functions.
+
+    Commands are pinned to the connection's board. Payloads are validated with
+    the same schemas as the HTTP endpoints (ValidationError propagates).
+    """
+    if command.op == "card.create":
+        data = CardCreate.model_validate({**command.data, "board_id": board_id})
+        return await card_service.create_card(db, data, owner_id)
+
+    if command.card_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="card_id is required",
+        )
+    if command.op == "card.update":
+        data = CardUpdate.model_validate(command.data)
+        return await card_service.update_card(
+            db, command.card_id, owner_id, data, board_id=board_id
+        )
+    data = CardMove.model_validate(command.data)
+    return await card_service.move_card(
+        db, command.card_id, data, owner_id, board_id=board_id
+    )
@@ -0,0 +1,210 @@
+"""
+Streaming NDJSON export and import of boards.
+
+Export streams one JSON object per line — the board, then its lists, then its
+cards — from a server-side cursor, so memory stays constant regardless of
+board size. Import parses the request body line by line and inserts lists and
+cards in batches within a single transaction.
+"""
+import json
+import uuid
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.coalescer import card_writes
+from app.core.database import async_session
+from app.core.ids import uuid7
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.schemas.export import BoardRecord, CardRecord, ListRecord
+from app.services.board_service import add_owner
+from app.services.list_service import repair_card_counts
+
+EXPORT_YIELD_PER = 500
+IMPORT_BATCH_SIZE = 500
+
+
+async def stream_board_export(board: Board) -> AsyncIterator[bytes]:
+    """
+    Yield the board as NDJSON lines.
+
+    Uses its own session because the request-scoped one is closed before the
+    response body is sent.
+    """
+    await card_writes.flush_board(board.id)
+    yield _line(BoardRecord(title=board.title, description=board.description))
+
+    async with async_session() as session:
+        lists = await session.stream(
+            select(List.id, List.title, List.rank, List.wip_limit)
+            .where(List.board_id == board.id, List.deleted_at.is_(None))
+            .order_by(List.rank)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for row in lists:
+            yield _line(
+                ListRecord(
+                    id=row.id, title=row.title, rank=row.rank, wip_limit=row.wip_limit
+                )
+            )
+
+        cards = await session.stream(
+            select(Card.id, Card.list_id, Card.title, Card.description, Card.rank)
+            .join(List, List.id == Card.list_id)
+            .where(
+                Card.board_id == board.id,
+                Card.deleted_at.is_(None),
+                List.deleted_at.is_(None),
+            )
+            .order_by(Card.list_id, Card.rank)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for row in cards:
+            yield _line(
+                CardRecord(
+                    id=row.id,
+                    list_id=row.list_id,
+                    title=row.title,
+                    description=row.description,
+                    rank=row.rank,
+                )
+            )
+
+
+def _line(record: BoardRecord | ListRecord | CardRecord) -> bytes:
+    return record.model_dump_json().encode("utf-8") + b"\n"
+
+
+async def _iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict]]:
+    """Split a byte stream into parsed JSON lines without buffering the whole body."""
+    buffer = b""
+    lineno = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            lineno += 1
+            if raw.strip():
+                yield lineno, _parse_line(lineno, raw)
+    if buffer.strip():
+        yield lineno + 1, _parse_line(lineno + 1, buffer)
+
+
+def _parse_line(lineno: int, raw: bytes) -> dict:
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        _invalid(lineno, "malformed JSON")
+    if not isinstance(value, dict):
+        _invalid(lineno, "expected a JSON object")
+    return value
+
+
+def _invalid(lineno: int, reason: str):
+    raise HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=f"Invalid import at line {lineno}: {reason}",
+    )
+
+
+async def import_board(
+    db: AsyncSession, chunks: AsyncIterator[bytes], owner_id: uuid.UUID
+) -> Board:
+    """
+    Create a new board from an NDJSON stream produced by `stream_board_export`.
+
+    All ids are regenerated; only the list id mapping is kept in memory.
+    Everything is committed once at the end, or rolled back on any error.
+    """
+    board: Board | None = None
+    list_ids: dict[uuid.UUID, uuid.UUID] = {}
+    pending_lists: list[dict] = []
+    pending_cards: list[dict] = []
+
+    async def flush_lists():
+        if pending_lists:
+            await db.execute(insert(List), pending_lists)
+            pending_lists.clear()
+
+    async def flush_cards():
+        await flush_lists()
+        if pending_cards:
+            await db.execute(insert(Card), pending_cards)
+            pending_cards.clear()
+
+    try:
+        async for lineno, value in _iter_ndjson(chunks):
+            kind = value.get("type")
+            try:
+                if board is None:
+                    if kind != "board":
+                        _invalid(lineno, "first record must be the board")
+                    record = BoardRecord.model_validate(value)
+                    board = Board(
+                        title=record.title,
+                        description=record.description,
+                        owner_id=owner_id,
+                    )
+                    db.add(board)
+                    await db.flush()
+                    add_owner(db, board)
+                elif kind == "list":
+                    record = ListRecord.model_validate(value)
+                    new_id = uuid7()
+                    list_ids[record.id] = new_id
+                    pending_lists.append(
+                        {
+                            "id": new_id,
+                            "board_id": board.id,
+                            "title": record.title,
+                            "rank": record.rank,
+                            "wip_limit": record.wip_limit,
+                        }
+                    )
+                    if len(pending_lists) >= IMPORT_BATCH_SIZE:
+                        await flush_lists()
+                elif kind == "card":
+                    record = CardRecord.model_validate(value)
+                    if record.list_id not in list_ids:
+                        _invalid(lineno, "card references an unknown list")
+                    pending_cards.append(
+                        {
+                            "id": uuid7(),
+                            "list_id": list_ids[record.list_id],
+                            "board_id": board.id,
+                            "title": record.title,
+                            "description": record.description,
+                            "rank": record.rank,
+                        }
+                    )
+                    if len(pending_cards) >= IMPORT_BATCH_SIZE:
+                        await flush_cards()
+                else:
+                    _invalid(lineno, f"unknown record type {kind!r}")
+            except ValidationError as exc:
+                _invalid(lineno, exc.errors()[0]["msg"])
+
+        if board is None:
+            _invalid(0, "empty stream")
+        await flush_cards()
+        # WIP limits are not enforced on import; counts are set in one pass
+        await repair_card_counts(db, board.id)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid import: duplicate rank within a list or board",
+        )
+    except HTTPException:
+        await db.rollback()
+        raise
+
+    await db.refresh(board)
+    return board
@@ -2,67 +2,162 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.access import EDITOR, VIEWER, board_access, check_role
+from app.core.coalescer import card_writes
+from app.core.events import publish_event
+from app.core.fields import FieldTree, all_fields, selected
 from app.core.lexorank import LexoRank
-from app.models.board import Board
 from app.models.card import Card
 from app.models.list import List
-from app.schemas.list import ListCreate, ListUpdate
+from app.schemas.board import ListOut
+from app.schemas.list import ListCreate, ListMove, ListUpdate
+from app.services.board_service import CardView, ListView
 
+# Rank UPDATEs tried before a list move gives up on a contended gap
+MOVE_RANK_ATTEMPTS = 3
 
-async def create_list(
-    db: AsyncSession, data: ListCreate, owner_id: uuid.UUID
+
+async def _editable_list(
+    db: AsyncSession, list_id: uuid.UUID, owner_id: uuid.UUID, lock: bool = False
 ) -> List:
-    """Create a new list in a board with proper LexoRank positioning."""
-    # Verify board exists and belongs to owner
-    board_result = await db.execute(
-        select(Board).where(
-            Board.id == data.board_id,
-            Board.owner_id == owner_id,
-            Board.deleted_at.is_(None),
+    """A live list on a board where the user is at least an editor."""
+    query = select(List).where(List.id == list_id, List.deleted_at.is_(None))
+    # SQLite doesn't support FOR UPDATE — only lock in production (PostgreSQL)
+    dialect = db.bind.dialect.name if db.bind else ""
+    if lock and dialect != "sqlite":
+        query = query.with_for_update()
+
+    result = await db.execute(query)
+    lst = result.scalar_one_or_none()
+    role = await board_access(db, owner_id).role(lst.board_id) if lst else None
+    check_role(role, EDITOR, "List not found")
+    return lst
+
+
+async def get_list(
+    db: AsyncSession,
+    list_id: uuid.UUID,
+    owner_id: uuid.UUID,
+    fields: FieldTree | None = None,
+) -> ListView:
+    """
+    One live list with its cards in rank order, for any member of its board.
+    Built from column selects like board detail, narrowed by `fields`.
+    """
+    fields = fields or all_fields(ListOut)
+    result = await db.execute(
+        select(
+            List.board_id,
+            *selected(
+                fields,
+                List.id,
+                List.title,
+                List.rank,
+                List.board_id,
+                List.card_count,
+                List.wip_limit,
+            ),
+        ).where(List.id == list_id, List.deleted_at.is_(None))
+    )
+    row = result.first()
+    role = await board_access(db, owner_id).role(row[0]) if row else None
+    check_role(role, VIEWER, "List not found")
+    lst = ListView(*row[1:])
+    if "cards" not in fields:
+        return lst
+
+    await card_writes.flush_board(row[0])
+    cards_result = await db.execute(
+        select(
+            *selected(
+                fields["cards"],
+                Card.id,
+                Card.title,
+                Card.description,
+                Card.rank,
+                Card.list_id,
+                Card.created_at,
+            )
         )
+        .where(
+            Card.board_id == row[0],
+            Card.list_id == list_id,
+            Card.deleted_at.is_(None),
+        )
+        .order_by(Card.rank)
     )
-    board = board_result.scalar_one_or_none()
-    if not board:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found",
+    lst.cards = [CardView(*card) for card in cards_result]
+    return lst
+
+
+async def new_list_rank(
+    db: AsyncSession, board_id: uuid.UUID, after_rank: str | None
+) -> str:
+    """
+    Rank for a new list placed after `after_rank`, or at the end.
+
+    Reads at most two rows from the (board_id, rank) unique index, so the
+    cost does not depend on how many lists the board has. An anchor that is
+    no list's rank falls back to appending. Soft-deleted lists are included:
+    uq_list_board_rank still holds their ranks.
+    """
+    if after_rank:
+        # The anchor itself and its successor, if any
+        neighbors = list(
+            (
+                await db.execute(
+                    select(List.rank)
+                    .where(List.board_id == board_id, List.rank >= after_rank)
+                    .order_by(List.rank)
+                    .limit(2)
+                )
+            ).scalars()
         )
+        if neighbors and neighbors[0] == after_rank:
+            if len(neighbors) > 1:
+                return LexoRank.rank_between(after_rank, neighbors[1])
+            return LexoRank.rank_after(after_rank)
 
-    # Fetch existing list ranks
-    ranks_result = await db.execute(
-        select(List.rank)
-        .where(List.board_id == data.board_id, List.deleted_at.is_(None))
-        .order_by(List.rank)
-    )
-    existing_ranks = list(ranks_result.scalars().all())
+    last_rank = (
+        await db.execute(
+            select(List.rank)
+            .where(List.board_id == board_id)
+            .order_by(List.rank.desc())
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+    return LexoRank.rank_after(last_rank) if last_rank else LexoRank.initial_rank()
 
-    # Compute rank
-    if not existing_ranks:
-        rank = LexoRank.initial_rank()
-    elif data.after_rank:
-        # Find the rank after the specified one
-        try:
-            idx = existing_ranks.index(data.after_rank)
-            if idx + 1 < len(existing_ranks):
-                rank = LexoRank.rank_between(data.after_rank, existing_ranks[idx + 1])
-            else:
-                rank = LexoRank.rank_after(data.after_rank)
-        except ValueError:
-            rank = LexoRank.rank_after(existing_ranks[-1])
-    else:
-        rank = LexoRank.rank_after(existing_ranks[-1])
+
+async def create_list(
+    db: AsyncSession, data: ListCreate, owner_id: uuid.UUID
+) -> List:
+    """Create a new list in a board with proper LexoRank positioning."""
+    await board_access(db, owner_id).require(data.board_id, EDITOR)
+
+    rank = await new_list_rank(db, data.board_id, data.after_rank)
 
     new_list = List(
         board_id=data.board_id,
         title=data.title,
         rank=rank,
+        wip_limit=data.wip_limit,
     )
     db.add(new_list)
     await db.commit()
     await db.refresh(new_list)
+    publish_event(
+        new_list.board_id,
+        "list.created",
+        actor_id=owner_id,
+        id=new_list.id,
+        title=new_list.title,
+        rank=new_list.rank,
+    )
     return new_list
 
 
@@ -72,28 +167,72 @@ async def update_list(
     owner_id: uuid.UUID,
     data: ListUpdate,
 ) -> List:
-    """Update a list's title."""
-    result = await db.execute(
-        select(List)
-        .join(Board, Board.id == List.board_id)
-        .where(
-            List.id == list_id,
-            Board.owner_id == owner_id,
-            List.deleted_at.is_(None),
-        )
-    )
-    lst = result.scalar_one_or_none()
-    if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-        )
+    """Update a list's title and/or WIP limit."""
+    lst = await _editable_list(db, list_id, owner_id)
 
     if data.title is not None:
         lst.title = data.title
+    if "wip_limit" in data.model_fields_set:
+        # Lowering the limit below the current count only blocks additions
+        lst.wip_limit = data.wip_limit
 
     await db.commit()
     await db.refresh(lst)
+    publish_event(
+        lst.board_id,
+        "list.updated",
+        actor_id=owner_id,
+        id=lst.id,
+        title=lst.title,
+        wip_limit=lst.wip_limit,
+    )
+    return lst
+
+
+async def move_list(
+    db: AsyncSession,
+    list_id: uuid.UUID,
+    data: ListMove,
+    owner_id: uuid.UUID,
+) -> List:
+    """
+    Move a list to a new position on its board by rewriting only its rank.
+
+    Like move_card, the list row is locked with SELECT FOR UPDATE. Instead
+    of checking for a collision first, the single-row UPDATE relies on
+    uq_list_board_rank: if another list already holds the computed rank
+    (e.g. a concurrent move into the same gap), the savepoint is rolled
+    back and the rank extended, up to MOVE_RANK_ATTEMPTS times.
+    """
+    lst = await _editable_list(db, list_id, owner_id, lock=True)
+
+    new_rank = LexoRank.rank_between(data.before_rank, data.after_rank)
+    for _ in range(MOVE_RANK_ATTEMPTS):
+        if new_rank == lst.rank:
+            break
+        try:
+            async with db.begin_nested():
+                await db.execute(
+                    update(List)
+                    .where(List.id == lst.id)
+                    .values(rank=new_rank)
+                    .execution_options(synchronize_session=False)
+                )
+            break
+        except IntegrityError:
+            # Conflict resolution: extend the rank, as move_card does
+            new_rank = f"0|{LexoRank.parse(new_rank)}i:"
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="No free position between the given ranks",
+        )
+
+    await db.commit()
+    await db.refresh(lst)
+    publish_event(
+        lst.board_id, "list.moved", actor_id=owner_id, id=lst.id, rank=lst.rank
+    )
     return lst
 
 
@@ -103,30 +242,100 @@ async def soft_delete_list(
     """Soft delete a list and all its active cards in one transaction."""
     now = datetime.now(timezone.utc)
 
-    result = await db.execute(
-        select(List)
-        .join(Board, Board.id == List.board_id)
-        .where(
-            List.id == list_id,
-            Board.owner_id == owner_id,
-            List.deleted_at.is_(None),
-        )
-    )
-    lst = result.scalar_one_or_none()
-    if not lst:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="List not found",
-        )
+    lst = await _editable_list(db, list_id, owner_id)
 
     lst.deleted_at = now
+    lst.card_count = 0
 
     # Cascade to cards
+    await card_writes.flush_board(lst.board_id)
     cards_result = await db.execute(
-        select(Card).where(Card.list_id == list_id, Card.deleted_at.is_(None))
+        select(Card).where(
+            Card.board_id == lst.board_id,
+            Card.list_id == list_id,
+            Card.deleted_at.is_(None),
+        )
     )
     cards = cards_result.scalars().all()
     for card in cards:
         card.deleted_at = now
 
     await db.commit()
+    publish_event(lst.board_id, "list.deleted", actor_id=owner_id, id=lst.id)
+
+
+async def adjust_card_count(
+    db: AsyncSession, list_id: uuid.UUID, delta: int
+) -> None:
+    """
+    Add `delta` to a list's card_count inside the caller's transaction.
+
+    An increment is a single conditional UPDATE that also enforces the WIP
+    limit, so the check and the write happen atomically under the list's
+    row lock; if the limit is already reached no row matches and 409 is
+    raised.
+    """
+    query = (
+        update(List)
+        .where(List.id == list_id)
+        .values(card_count=List.card_count + delta)
+        # Keep a List already in the session in step with the new count
+        .execution_options(synchronize_session="fetch")
+    )
+    if delta > 0:
+        query = query.where(
+            or_(
+                List.wip_limit.is_(None),
+                List.card_count + delta <= List.wip_limit,
+            )
+        )
+    result = await db.execute(query)
+    if delta > 0 and result.rowcount == 0:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="List WIP limit reached",
+        )
+
+
+async def apply_card_count_deltas(
+    db: AsyncSession, deltas: dict[uuid.UUID, int]
+) -> None:
+    """
+    Adjust several lists' counts, e.g. for a bulk move.
+
+    List rows are updated in id order, so two moves in opposite directions
+    between the same lists cannot deadlock.
+    """
+    for list_id in sorted(deltas):
+        if deltas[list_id]:
+            await adjust_card_count(db, list_id, deltas[list_id])
+
+
+async def repair_card_counts(
+    db: AsyncSession, board_id: uuid.UUID | None = None
+) -> int:
+    """
+    Recompute card_count from the cards table with one set-based UPDATE,
+    optionally for a single board. Only lists whose count drifted are
+    written; returns how many were corrected. Does not commit.
+    """
+    live_cards = (
+        select(func.count())
+        .select_from(Card)
+        .where(
+            Card.board_id == List.board_id,
+            Card.list_id == List.id,
+            Card.deleted_at.is_(None),
+        )
+        .correlate(List)
+        .scalar_subquery()
+    )
+    query = update(List).where(List.card_count != live_cards)
+    if board_id is not None:
+        query = query.where(List.board_id == board_id)
+    result = await db.execute(
+        query.values(card_count=live_cards).execution_options(
+            synchronize_session="fetch"
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,90 @@
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import OWNER, VIEWER, board_access
+from app.models.board_member import BoardMember
+from app.models.user import User
+from app.schemas.member import MemberCreate, MemberOut
+from app.services.board_service import get_board
+
+
+def _member_query(board_id: uuid.UUID):
+    return (
+        select(
+            BoardMember.user_id,
+            User.email,
+            User.full_name,
+            BoardMember.role,
+            BoardMember.created_at,
+        )
+        .join(User, User.id == BoardMember.user_id)
+        .where(BoardMember.board_id == board_id)
+    )
+
+
+async def get_members(
+    db: AsyncSession, board_id: uuid.UUID, owner_id: uuid.UUID
+) -> list[MemberOut]:
+    """List a board's members, oldest first. Any member may see them."""
+    await board_access(db, owner_id).require(board_id, VIEWER)
+    result = await db.execute(
+        _member_query(board_id).order_by(BoardMember.created_at, BoardMember.user_id)
+    )
+    return [MemberOut.model_validate(row, from_attributes=True) for row in result]
+
+
+async def add_member(
+    db: AsyncSession, board_id: uuid.UUID, owner_id: uuid.UUID, data: MemberCreate
+) -> MemberOut:
+    """Share a board with a user, or change an existing member's role (owners only)."""
+    board = await get_board(db, board_id, owner_id, OWNER)
+    user = (
+        await db.execute(
+            select(User).where(User.email == data.email, User.deleted_at.is_(None))
+        )
+    ).scalar_one_or_none()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    if user.id == board.owner_id and data.role != OWNER:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The board's creator must remain an owner",
+        )
+
+    member = await db.get(BoardMember, (user.id, board_id))
+    if member is None:
+        db.add(BoardMember(board_id=board_id, user_id=user.id, role=data.role))
+    else:
+        member.role = data.role
+    await db.commit()
+
+    result = await db.execute(
+        _member_query(board_id).where(BoardMember.user_id == user.id)
+    )
+    return MemberOut.model_validate(result.one(), from_attributes=True)
+
+
+async def remove_member(
+    db: AsyncSession, board_id: uuid.UUID, owner_id: uuid.UUID, user_id: uuid.UUID
+) -> None:
+    """Revoke a user's access to a board (owners only)."""
+    board = await get_board(db, board_id, owner_id, OWNER)
+    if user_id == board.owner_id:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="The board's creator must remain an owner",
+        )
+    member = await db.get(BoardMember, (user_id, board_id))
+    if member is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Member not found",
+        )
+    await db.delete(member)
+    await db.commit()
@@ -0,0 +1,94 @@
+import re
+import uuid
+
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import board_access
+from app.core.coalescer import card_writes
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.card import Card
+from app.models.card_search import FTS_IDS_TABLE, FTS_TABLE, SEARCH_CONFIG
+from app.schemas.search import CardSearchHit, SearchResults
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+_fts = table(FTS_TABLE, column("rowid"))
+_fts_ids = table(FTS_IDS_TABLE, column("id"), column("card_id"))
+
+
+def _fts5_query(q: str) -> str | None:
+    """Turn free text into a safe FTS5 query: every word as a quoted prefix term."""
+    words = _WORD.findall(q)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+async def search_cards(
+    db: AsyncSession,
+    owner_id: uuid.UUID,
+    q: str,
+    limit: int,
+    offset: int,
+) -> SearchResults:
+    """
+    Ranked full-text search over live cards on the caller's boards.
+
+    PostgreSQL matches the generated `search_vector` column (GIN index) with
+    `websearch_to_tsquery` and ranks by `ts_rank`. SQLite matches the FTS5
+    index and ranks by bm25. One extra row is fetched to detect a next page.
+    """
+    # Only staged edits on boards the caller can see affect the results
+    await card_writes.flush_boards(await board_access(db, owner_id).roles())
+    dialect = db.bind.dialect.name if db.bind else ""
+
+    if dialect == "sqlite":
+        match = _fts5_query(q)
+        if match is None:
+            return SearchResults(query=q, items=[])
+        # bm25() is lower-is-better; negate so higher score means more relevant
+        score = (-func.bm25(literal_column(FTS_TABLE))).label("score")
+        query = (
+            select(Card.id, Card.title, Card.list_id, Card.board_id, score)
+            .select_from(_fts)
+            .join(_fts_ids, _fts_ids.c.id == _fts.c.rowid)
+            .join(Card, Card.id == _fts_ids.c.card_id)
+            .where(literal_column(FTS_TABLE).op("MATCH")(match))
+        )
+    else:
+        config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, q)
+        search_vector = literal_column("cards.search_vector")
+        score = func.ts_rank(search_vector, tsquery).label("score")
+        query = select(Card.id, Card.title, Card.list_id, Card.board_id, score).where(
+            search_vector.op("@@")(tsquery)
+        )
+
+    query = (
+        query.join(Board, Board.id == Card.board_id)
+        .join(
+            BoardMember,
+            (BoardMember.board_id == Card.board_id)
+            & (BoardMember.user_id == owner_id),
+        )
+        .where(Board.deleted_at.is_(None), Card.deleted_at.is_(None))
+        .order_by(score.desc(), Card.id)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    rows = (await db.execute(query)).all()
+
+    items = [
+        CardSearchHit(
+            id=row.id,
+            title=row.title,
+            list_id=row.list_id,
+            board_id=row.board_id,
+            score=row.score,
+        )
+        for row in rows[:limit]
+    ]
+    next_offset = offset + limit if len(rows) > limit else None
+    return SearchResults(query=q, items=items, next_offset=next_offset)
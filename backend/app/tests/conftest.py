@@ -1,5 +1,8 @@
 import asyncio
+import atexit
 import os
+import shutil
+import tempfile
 from typing import AsyncGenerator
 
 import pytest
@@ -7,15 +10,23 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-# Set test database URL BEFORE importing the app
-os.environ["TEST_DATABASE_URL"] = "sqlite+aiosqlite:///./test.db"
-
+# Set test database URL BEFORE importing the app. The file lives in a scratch
+# directory so test runs never touch the working tree.
+_test_db_dir = tempfile.mkdtemp(prefix="taskflow-test-")
+atexit.register(shutil.rmtree, _test_db_dir, ignore_errors=True)
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///{os.path.join(_test_db_dir, 'test.db')}"
+os.environ["TEST_DATABASE_URL"] = TEST_DATABASE_URL
+# The suite logs in far more often than the login budget allows
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+from app.core.activity import activity_buffer
+from app.core.coalescer import card_writes
 from app.core.database import Base, get_db
 from app.main import app
 
 # Create test-specific engine
 test_engine = create_async_engine(
-    "sqlite+aiosqlite:///./test.db",
+    TEST_DATABASE_URL,
     echo=False,
     connect_args={"check_same_thread": False},
 )
@@ -52,6 +63,9 @@ async def setup_database():
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    # Don't leak staged writes or buffered activity into the next test's database
+    await card_writes.flush_all()
+    await activity_buffer.flush()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -64,6 +78,19 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 
+@pytest.fixture
+def session_factory() -> async_sessionmaker[AsyncSession]:
+    """The test database's session factory, for components that open their own."""
+    return test_session
+
+
+@pytest_asyncio.fixture
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Direct database session for service-level tests."""
+    async with test_session() as session:
+        yield session
+
+
 @pytest_asyncio.fixture
 async def auth_headers(client: AsyncClient) -> dict:
     """Register a test user and return auth headers."""
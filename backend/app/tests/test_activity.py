@@ -0,0 +1,104 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.activity import ActivityBuffer
+from app.models.activity import Activity
+
+
+class TestActivityBuffer:
+    """Tests for the write-behind activity buffer."""
+
+    async def test_record_does_not_write_until_flush(
+        self,
+        test_board: dict,
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        buffer = ActivityBuffer(session_factory, interval_ms=60_000, max_events=100)
+        board_id = uuid.UUID(test_board["id"])
+        actor_id = uuid.UUID(test_board["owner_id"])
+
+        for _ in range(3):
+            buffer.record(board_id, actor_id, "card.moved")
+        count = await db_session.scalar(select(func.count()).select_from(Activity))
+        assert count == 0
+
+        assert await buffer.flush() == 3
+        assert buffer.pending == 0
+        count = await db_session.scalar(select(func.count()).select_from(Activity))
+        assert count == 3
+
+    async def test_stop_flushes_pending(
+        self,
+        test_board: dict,
+        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
+    ):
+        buffer = ActivityBuffer(session_factory, interval_ms=60_000, max_events=100)
+        buffer.start()
+        buffer.record(
+            uuid.UUID(test_board["id"]),
+            uuid.UUID(test_board["owner_id"]),
+            "card.deleted",
+        )
+        await buffer.stop()
+        count = await db_session.scalar(select(func.count()).select_from(Activity))
+        assert count == 1
+
+
+class TestActivityEndpoint:
+    """Tests for the board activity endpoint."""
+
+    async def test_activity_records_card_changes(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        await client.post(
+            f"/api/v1/cards/{test_card['id']}/move",
+            json={"list_id": test_lists[1]["id"]},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        await client.delete(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+
+        response = await client.get(
+            f"/api/v1/boards/{test_board['id']}/activity", headers=auth_headers
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        card_actions = [i["action"] for i in items if i["entity_id"] == test_card["id"]]
+        assert card_actions == ["card.deleted", "card.moved", "card.created"]
+        assert items[0]["actor_id"] == test_board["owner_id"]
+
+    async def test_activity_paginates(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        first = await client.get(
+            f"/api/v1/boards/{test_board['id']}/activity",
+            params={"limit": 1},
+            headers=auth_headers,
+        )
+        page = first.json()
+        assert len(page["items"]) == 1
+        second = await client.get(
+            f"/api/v1/boards/{test_board['id']}/activity",
+            params={"limit": 1, "cursor": page["next_cursor"]},
+            headers=auth_headers,
+        )
+        assert second.json()["items"][0]["id"] != page["items"][0]["id"]
@@ -0,0 +1,63 @@
+import time
+
+from httpx import AsyncClient
+
+from app.core.admission import AdmissionController, admission
+
+
+class TestAdmissionController:
+    """Tests for queueing-delay based overload detection."""
+
+    def test_standing_queue_sheds_reads_only(self):
+        controller = AdmissionController(target_ms=50, interval_ms=1000)
+        controller.record(0.2, now=0.0)
+        controller.record(0.3, now=0.5)
+        assert not controller.is_overloaded(now=0.5)
+        # The whole first interval stayed above target
+        controller.record(0.2, now=1.0)
+        assert controller.is_overloaded(now=1.0)
+
+        assert not controller.admit("GET", "/api/v1/boards/", now=1.0)
+        assert controller.admit("POST", "/api/v1/cards/", now=1.0)
+        assert controller.admit("GET", "/health", now=1.0)
+        assert controller.shed == 1
+
+    def test_recovers_on_fast_checkout_or_silence(self):
+        controller = AdmissionController(target_ms=50, interval_ms=1000)
+        controller.record(0.2, now=0.0)
+        controller.record(0.2, now=1.0)
+        assert controller.is_overloaded(now=1.0)
+        controller.record(0.01, now=1.2)
+        assert not controller.is_overloaded(now=1.2)
+
+        controller.record(0.2, now=2.2)
+        controller.record(0.2, now=3.2)
+        assert controller.is_overloaded(now=3.2)
+        # No samples for a whole interval: nothing shows a queue any more
+        assert not controller.is_overloaded(now=4.5)
+
+
+class TestLoadShedding:
+    """Tests for the readiness endpoint and 503 responses."""
+
+    async def test_ready_and_shedding(self, client: AsyncClient, auth_headers: dict):
+        response = await client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+        # Two consecutive slow intervals ending now
+        now = time.monotonic()
+        admission.record(1.0, now=now - admission.interval)
+        admission.record(1.0, now=now)
+        try:
+            assert (await client.get("/ready")).status_code == 503
+            response = await client.get("/api/v1/boards/", headers=auth_headers)
+            assert response.status_code == 503
+            assert response.headers["retry-after"] == "1"
+            response = await client.post(
+                "/api/v1/boards/", json={"title": "Still works"}, headers=auth_headers
+            )
+            assert response.status_code == 201
+            assert (await client.get("/health")).status_code == 200
+        finally:
+            admission.record(0.0)
@@ -0,0 +1,165 @@
+from httpx import AsyncClient
+
+
+class TestBatch:
+    """Tests for the batch operations endpoint."""
+
+    async def test_create_list_with_cards_and_move(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        operations = [
+            {"op": "list.create", "ref": "new", "board_id": test_board["id"], "title": "Ideas"},
+            {"op": "card.create", "ref": "a", "list_ref": "new", "title": "A"},
+            {"op": "card.create", "list_ref": "new", "title": "B"},
+            {"op": "card.update", "card_ref": "a", "description": "first"},
+            {"op": "card.move", "card_id": test_card["id"], "list_ref": "new"},
+            {"op": "list.update", "list_id": test_lists[2]["id"], "title": "Shipped"},
+        ]
+        response = await client.post(
+            "/api/v1/batch/", json={"operations": operations}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["op"] for r in results] == [op["op"] for op in operations]
+        new_list_id = results[0]["id"]
+        assert results[1]["card"]["list_id"] == new_list_id
+        assert results[3]["card"]["description"] == "first"
+        assert results[4]["card"]["list_id"] == new_list_id
+        assert results[5]["list"]["title"] == "Shipped"
+
+        board = await client.get(f"/api/v1/boards/{test_board['id']}", headers=auth_headers)
+        lists = {lst["id"]: lst for lst in board.json()["lists"]}
+        assert {c["title"] for c in lists[new_list_id]["cards"]} == {"A", "B", "Test Card"}
+        assert lists[new_list_id]["card_count"] == 3
+        assert lists[test_lists[0]["id"]]["card_count"] == 0
+
+    async def test_wip_limit_applies_within_batch(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+    ):
+        operations = [
+            {
+                "op": "list.create",
+                "ref": "doing",
+                "board_id": test_board["id"],
+                "title": "Doing",
+                "wip_limit": 1,
+            },
+            {"op": "card.create", "list_ref": "doing", "title": "A"},
+            {"op": "card.create", "list_ref": "doing", "title": "B"},
+        ]
+        response = await client.post(
+            "/api/v1/batch/", json={"operations": operations}, headers=auth_headers
+        )
+        assert response.status_code == 409
+        assert response.json()["detail"] == (
+            "Operation 2 (card.create) failed: List WIP limit reached"
+        )
+
+    async def test_failure_rolls_back_everything(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        operations = [
+            {"op": "card.delete", "card_id": test_card["id"]},
+            {"op": "list.delete", "list_id": test_lists[1]["id"]},
+            {"op": "card.update", "card_id": test_card["id"], "title": "Gone"},
+        ]
+        response = await client.post(
+            "/api/v1/batch/", json={"operations": operations}, headers=auth_headers
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"].startswith("Operation 2 (card.update) failed")
+
+        board = await client.get(f"/api/v1/boards/{test_board['id']}", headers=auth_headers)
+        assert len(board.json()["lists"]) == 3
+        assert board.json()["lists"][0]["cards"][0]["title"] == "Test Card"
+        assert board.json()["lists"][0]["card_count"] == 1
+
+    async def test_other_users_board_is_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_lists: list[dict],
+    ):
+        await client.post(
+            "/api/v1/auth/register",
+            json={"email": "other@test.com", "password": "password123"},
+        )
+        login = await client.post(
+            "/api/v1/auth/login",
+            data={"username": "other@test.com", "password": "password123"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        other_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        response = await client.post(
+            "/api/v1/batch/",
+            json={"operations": [{"op": "list.delete", "list_id": test_lists[0]["id"]}]},
+            headers=other_headers,
+        )
+        assert response.status_code == 404
+
+    async def test_operation_requires_one_target(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        response = await client.post(
+            "/api/v1/batch/",
+            json={"operations": [{"op": "card.delete"}]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+
+    async def test_move_onto_rank_of_deleted_card(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        operations = [
+            {"op": "card.create", "ref": "gone", "list_id": test_lists[1]["id"], "title": "Gone"},
+            {"op": "card.delete", "card_ref": "gone"},
+            {"op": "card.move", "card_id": test_card["id"], "list_id": test_lists[1]["id"]},
+        ]
+        response = await client.post(
+            "/api/v1/batch/", json={"operations": operations}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        gone, _, moved = response.json()["results"]
+        assert moved["card"]["rank"] != gone["card"]["rank"]
+
+    async def test_repeated_moves_to_same_position(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        source, target = test_lists[0]["id"], test_lists[1]["id"]
+        operations = [
+            {"op": "card.create", "ref": "a", "list_id": source, "title": "A"},
+            {"op": "card.create", "ref": "b", "list_id": source, "title": "B"},
+            {"op": "card.move", "card_id": test_card["id"], "list_id": target},
+            {"op": "card.move", "card_ref": "a", "list_id": target},
+            # Both the rank and its first extension are taken now
+            {"op": "card.move", "card_ref": "b", "list_id": target},
+        ]
+        response = await client.post(
+            "/api/v1/batch/", json={"operations": operations}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        ranks = {r["card"]["rank"] for r in response.json()["results"][2:]}
+        assert len(ranks) == 3
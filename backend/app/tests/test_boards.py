@@ -54,6 +54,33 @@ class TestBoardDetail:
         assert data["title"] == "Test Board"
         assert "lists" in data
 
+    async def test_detail_groups_cards_by_list_in_rank_order(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        board_id = test_board["id"]
+        todo, doing, done = (lst["id"] for lst in test_lists)
+        for list_id, title in [(doing, "B"), (todo, "A"), (doing, "C"), (done, "D")]:
+            await client.post(
+                "/api/v1/cards",
+                json={"title": title, "list_id": list_id, "board_id": board_id},
+                headers=auth_headers,
+            )
+        # Cards of a deleted list are left out with it
+        await client.delete(f"/api/v1/lists/{done}", headers=auth_headers)
+
+        response = await client.get(f"/api/v1/boards/{board_id}", headers=auth_headers)
+        lists = response.json()["lists"]
+        assert [lst["title"] for lst in lists] == ["To Do", "In Progress"]
+        assert [[c["title"] for c in lst["cards"]] for lst in lists] == [["A"], ["B", "C"]]
+        for lst in lists:
+            ranks = [c["rank"] for c in lst["cards"]]
+            assert ranks == sorted(ranks)
+            assert all(c["list_id"] == lst["id"] for c in lst["cards"])
+
     async def test_get_board_not_found(
         self, client: AsyncClient, auth_headers: dict
     ):
@@ -125,3 +152,61 @@ class TestBoardDelete:
             f"/api/v1/boards/{board_id}", headers=other_headers
         )
         assert response.status_code == 404
+
+
+class TestBoardDuplicate:
+    """Tests for bulk board duplication."""
+
+    async def test_duplicate_board_copies_lists_and_cards(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        board_id = test_board["id"]
+        response = await client.post(
+            f"/api/v1/boards/{board_id}/duplicate", headers=auth_headers
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["id"] != board_id
+        assert data["title"] == "Test Board (copy)"
+
+        source = (
+            await client.get(f"/api/v1/boards/{board_id}", headers=auth_headers)
+        ).json()
+        assert [lst["rank"] for lst in data["lists"]] == [
+            lst["rank"] for lst in source["lists"]
+        ]
+        assert {lst["id"] for lst in data["lists"]}.isdisjoint(
+            {lst["id"] for lst in source["lists"]}
+        )
+        copied_card = data["lists"][0]["cards"][0]
+        assert copied_card["id"] != test_card["id"]
+        assert copied_card["title"] == test_card["title"]
+        assert copied_card["rank"] == test_card["rank"]
+        assert copied_card["list_id"] == data["lists"][0]["id"]
+
+    async def test_duplicate_board_skips_deleted_cards(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        await client.delete(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        response = await client.post(
+            f"/api/v1/boards/{test_board['id']}/duplicate",
+            json={"title": "Template"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["title"] == "Template"
+        assert data["lists"][0]["cards"] == []
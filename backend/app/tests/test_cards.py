@@ -50,6 +50,31 @@ class TestCreateCard:
         )
         assert response.status_code == 404
 
+    async def test_create_after_last_card_deleted(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        await client.delete(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        response = await client.post(
+            "/api/v1/cards",
+            json={
+                "title": "Replacement",
+                "list_id": test_board["lists"][0]["id"],
+                "board_id": test_board["id"],
+            },
+            headers=auth_headers,
+        )
+        # The deleted card keeps its rank in uq_card_list_rank
+        assert response.status_code == 201
+        assert response.json()["rank"] != test_card["rank"]
+
 
 class TestUpdateCard:
     """Tests for card updates."""
@@ -58,12 +83,14 @@ class TestUpdateCard:
         self,
         client: AsyncClient,
         auth_headers: dict,
+        test_board: dict,
         test_card: dict,
     ):
         card_id = test_card["id"]
         response = await client.patch(
             f"/api/v1/cards/{card_id}",
             json={"title": "Updated Card", "description": "New description"},
+            params={"board_id": test_board["id"]},
             headers=auth_headers,
         )
         assert response.status_code == 200
@@ -72,6 +99,76 @@ class TestUpdateCard:
         assert data["description"] == "New description"
 
 
+class TestGetCard:
+    """Tests for summary board detail and fetching a card on demand."""
+
+    async def test_summary_omits_descriptions_fetched_per_card(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        card_id = test_card["id"]
+        spec = "Long pasted spec. " * 500
+        await client.patch(
+            f"/api/v1/cards/{card_id}",
+            json={"description": spec},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+
+        response = await client.get(
+            f"/api/v1/boards/{test_board['id']}",
+            params={"mode": "summary"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        card = response.json()["lists"][0]["cards"][0]
+        assert card["id"] == card_id
+        assert "description" not in card
+        assert len(response.content) < len(spec)
+
+        response = await client.get(
+            f"/api/v1/cards/{card_id}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["description"] == spec
+
+    async def test_get_deleted_card_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        await client.delete(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        response = await client.get(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+    async def test_board_id_is_required(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_card: dict,
+    ):
+        # The partition key is part of every lookup by card id
+        response = await client.get(
+            f"/api/v1/cards/{test_card['id']}", headers=auth_headers
+        )
+        assert response.status_code == 422
+
+
 class TestMoveCard:
     """Tests for card movement."""
 
@@ -93,6 +190,7 @@ class TestMoveCard:
                 "before_rank": None,
                 "after_rank": None,
             },
+            params={"board_id": test_board["id"]},
             headers=auth_headers,
         )
         assert response.status_code == 200
@@ -115,6 +213,7 @@ class TestMoveCard:
             json={
                 "list_id": target_list_id,
             },
+            params={"board_id": test_board["id"]},
             headers=auth_headers,
         )
         assert response.status_code == 200
@@ -122,6 +221,171 @@ class TestMoveCard:
         # Rank should match "0|...:\" pattern
         assert re.match(r"^0\|[0-9a-z]+:$", data["rank"])
 
+    async def test_move_card_scoped_by_board_id(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        other = await client.post(
+            "/api/v1/boards/", json={"title": "Other"}, headers=auth_headers
+        )
+        url = f"/api/v1/cards/{test_card['id']}/move"
+        payload = {"list_id": test_lists[1]["id"]}
+
+        response = await client.post(
+            url, json=payload, params={"board_id": other.json()["id"]}, headers=auth_headers
+        )
+        assert response.status_code == 404
+
+        response = await client.post(
+            url, json=payload, params={"board_id": test_board["id"]}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        # The card's board_id now names the source board
+        response = await client.post(
+            url, json=payload, params={"board_id": other.json()["id"]}, headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    async def test_move_into_list_holding_deleted_card(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        target_list_id = test_lists[1]["id"]
+        deleted = await client.post(
+            "/api/v1/cards",
+            json={
+                "title": "Gone",
+                "list_id": target_list_id,
+                "board_id": test_board["id"],
+            },
+            headers=auth_headers,
+        )
+        await client.delete(
+            f"/api/v1/cards/{deleted.json()['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+
+        # The deleted card still holds the initial rank in uq_card_list_rank
+        for _ in range(2):
+            response = await client.post(
+                f"/api/v1/cards/{test_card['id']}/move",
+                json={"list_id": target_list_id},
+                params={"board_id": test_board["id"]},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            assert response.json()["rank"] != deleted.json()["rank"]
+
+
+class TestCrossBoardMove:
+    """Tests for moving cards to lists on other boards."""
+
+    async def _other_board(self, client: AsyncClient, auth_headers: dict) -> dict:
+        response = await client.post(
+            "/api/v1/boards/", json={"title": "Other"}, headers=auth_headers
+        )
+        return response.json()
+
+    async def test_move_card_to_other_board(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        other = await self._other_board(client, auth_headers)
+        target_list = other["lists"][0]
+        response = await client.post(
+            f"/api/v1/cards/{test_card['id']}/move",
+            json={"list_id": target_list["id"]},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["list_id"] == target_list["id"]
+
+        source = await client.get(f"/api/v1/boards/{test_board['id']}", headers=auth_headers)
+        assert source.json()["lists"][0]["cards"] == []
+        assert source.json()["lists"][0]["card_count"] == 0
+        target = await client.get(f"/api/v1/boards/{other['id']}", headers=auth_headers)
+        assert [c["id"] for c in target.json()["lists"][0]["cards"]] == [test_card["id"]]
+        assert target.json()["lists"][0]["card_count"] == 1
+
+        # Board-scoped operations now find the card on its new board
+        response = await client.delete(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": other["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 204
+
+    async def test_bulk_move_keeps_request_order(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        other = await self._other_board(client, auth_headers)
+        card_ids = []
+        for i, lst in enumerate(test_lists):
+            response = await client.post(
+                "/api/v1/cards",
+                json={"title": f"Card {i}", "list_id": lst["id"], "board_id": test_board["id"]},
+                headers=auth_headers,
+            )
+            card_ids.append(response.json()["id"])
+        card_ids.reverse()
+
+        response = await client.post(
+            "/api/v1/cards/move",
+            json={
+                "card_ids": card_ids,
+                "board_ids": [test_board["id"]],
+                "list_id": other["lists"][0]["id"],
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert [c["id"] for c in response.json()] == card_ids
+
+        target = await client.get(f"/api/v1/boards/{other['id']}", headers=auth_headers)
+        assert [c["id"] for c in target.json()["lists"][0]["cards"]] == card_ids
+        source = await client.get(f"/api/v1/boards/{test_board['id']}", headers=auth_headers)
+        assert all(lst["card_count"] == 0 for lst in source.json()["lists"])
+
+    async def test_bulk_move_rejects_foreign_cards(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        other = await self._other_board(client, auth_headers)
+        response = await client.post(
+            "/api/v1/cards/move",
+            json={
+                "card_ids": [test_card["id"], "00000000-0000-0000-0000-000000000000"],
+                "board_ids": [test_board["id"]],
+                "list_id": other["lists"][0]["id"],
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+        board = await client.get(f"/api/v1/boards/{test_board['id']}", headers=auth_headers)
+        assert board.json()["lists"][0]["cards"][0]["id"] == test_card["id"]
+
 
 class TestDeleteCard:
     """Tests for card soft deletion."""
@@ -138,7 +402,7 @@ class TestDeleteCard:
 
         # Delete the card
         del_resp = await client.delete(
-            f"/api/v1/cards/{card_id}", headers=auth_headers
+            f"/api/v1/cards/{card_id}", params={"board_id": board_id}, headers=auth_headers
         )
         assert del_resp.status_code == 204
 
@@ -153,3 +417,221 @@ class TestDeleteCard:
             for card in lst["cards"]
         ]
         assert card_id not in all_card_ids
+
+
+class TestQueryCards:
+    """Tests for the filtered card query API."""
+
+    async def _create_cards(self, client, auth_headers, board, titles):
+        for title in titles:
+            await client.post(
+                "/api/v1/cards",
+                json={
+                    "title": title,
+                    "list_id": board["lists"][0]["id"],
+                    "board_id": board["id"],
+                },
+                headers=auth_headers,
+            )
+
+    async def test_keyset_pagination_covers_all_cards(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+    ):
+        await self._create_cards(
+            client, auth_headers, test_board, [f"Card {i}" for i in range(5)]
+        )
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"board_id": test_board["id"], "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                "/api/v1/cards", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(card["title"] for card in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert sorted(seen) == [f"Card {i}" for i in range(5)]
+        assert "description" not in page["items"][0]
+
+    async def test_title_prefix_filter(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+    ):
+        await self._create_cards(
+            client, auth_headers, test_board, ["Bug: login", "Bug: logout", "Feature"]
+        )
+        response = await client.get(
+            "/api/v1/cards",
+            params={"board_id": test_board["id"], "title_prefix": "Bug:"},
+            headers=auth_headers,
+        )
+        titles = [card["title"] for card in response.json()["items"]]
+        assert sorted(titles) == ["Bug: login", "Bug: logout"]
+
+    async def test_flushes_only_queried_board(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        from app.core.coalescer import card_writes
+
+        monkeypatch.setattr(card_writes, "window_ms", 60_000)
+        await client.patch(
+            f"/api/v1/cards/{test_card['id']}",
+            json={"title": "Staged"},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        writes_before = card_writes.writes
+        other = await client.post(
+            "/api/v1/boards/", json={"title": "Other"}, headers=auth_headers
+        )
+
+        await client.get(
+            "/api/v1/cards", params={"board_id": other.json()["id"]}, headers=auth_headers
+        )
+        assert card_writes.writes == writes_before
+
+        response = await client.get(
+            "/api/v1/cards", params={"board_id": test_board["id"]}, headers=auth_headers
+        )
+        assert [card["title"] for card in response.json()["items"]] == ["Staged"]
+        assert card_writes.writes == writes_before + 1
+
+    async def test_invalid_cursor(self, client: AsyncClient, auth_headers: dict):
+        response = await client.get(
+            "/api/v1/cards", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestCoalescedUpdates:
+    """Tests for opt-in write coalescing of rapid card edits."""
+
+    async def test_burst_of_edits_written_once(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        from app.core.coalescer import card_writes
+
+        monkeypatch.setattr(card_writes, "window_ms", 60_000)
+        writes_before = card_writes.writes
+        saved_before = card_writes.writes_saved
+
+        for text in ["H", "He", "Hel", "Hello"]:
+            response = await client.patch(
+                f"/api/v1/cards/{test_card['id']}",
+                json={"title": text},
+                params={"board_id": test_board["id"]},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            assert response.json()["title"] == text
+        response = await client.patch(
+            f"/api/v1/cards/{test_card['id']}",
+            json={"description": "typed"},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        assert response.json()["title"] == "Hello"
+        assert card_writes.writes == writes_before
+
+        # Reading the board flushes the staged edit
+        board = await client.get(
+            f"/api/v1/boards/{test_board['id']}", headers=auth_headers
+        )
+        card = board.json()["lists"][0]["cards"][0]
+        assert card["title"] == "Hello"
+        assert card["description"] == "typed"
+        assert card_writes.writes == writes_before + 1
+        assert card_writes.writes_saved == saved_before + 4
+
+    async def test_coalescing_still_checks_ownership(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        from app.core.coalescer import card_writes
+
+        monkeypatch.setattr(card_writes, "window_ms", 60_000)
+        fake_id = "00000000-0000-0000-0000-000000000000"
+        response = await client.patch(
+            f"/api/v1/cards/{fake_id}",
+            json={"title": "x"},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+    async def test_failed_write_is_retried_then_resyncs(
+        self,
+        test_board: dict,
+        test_card: dict,
+        session_factory,
+        db_session,
+    ):
+        import uuid
+
+        from app.core.coalescer import RETRY_DELAYS, CardWriteCoalescer
+        from app.core.events import hub
+        from app.models.card import Card
+
+        failures = {"left": 1}
+
+        def flaky_sessions():
+            if failures["left"]:
+                failures["left"] -= 1
+                raise ConnectionError("database unavailable")
+            return session_factory()
+
+        coalescer = CardWriteCoalescer(flaky_sessions, window_ms=60_000)
+        card_id = uuid.UUID(test_card["id"])
+        key = (card_id, uuid.UUID(test_board["id"]))
+        card = await db_session.get(Card, key)
+        owner_id = uuid.uuid4()
+        coalescer.stage(card, owner_id, {"title": "Saved"})
+
+        # A forced flush surfaces the failure and keeps the edit staged
+        with pytest.raises(ConnectionError):
+            await coalescer.flush_card(card_id)
+        assert coalescer.merge(card_id, owner_id, {}).title == "Saved"
+
+        await coalescer.flush_card(card_id)
+        assert coalescer.writes == 1
+        async with session_factory() as db:
+            assert (await db.get(Card, key)).title == "Saved"
+
+        # Once the retries are used up the edit is dropped and clients resync
+        failures["left"] = len(RETRY_DELAYS) + 1
+        coalescer.stage(card, owner_id, {"title": "Lost"})
+        subscription = hub.subscribe(card.board_id)
+        try:
+            for _ in range(len(RETRY_DELAYS) + 1):
+                with pytest.raises(ConnectionError):
+                    await coalescer.flush_card(card_id)
+            assert coalescer.writes_failed == 1
+            assert coalescer.merge(card_id, owner_id, {}) is None
+            assert (await subscription.get())["type"] == "resync"
+        finally:
+            hub.unsubscribe(subscription)
@@ -0,0 +1,139 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException, WebSocketDisconnect
+from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.schemas.command import Command
+from app.services import command_service
+
+
+async def _owner_id(client: AsyncClient, auth_headers: dict, board_id: str) -> uuid.UUID:
+    board = await client.get(f"/api/v1/boards/{board_id}", headers=auth_headers)
+    return uuid.UUID(board.json()["owner_id"])
+
+
+class TestCommandService:
+    """Tests for commands executed over the board mutation channel."""
+
+    async def test_create_is_pinned_to_board(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        db_session: AsyncSession,
+    ):
+        owner_id = await _owner_id(client, auth_headers, test_board["id"])
+        command = Command(
+            seq=1,
+            op="card.create",
+            data={"title": "Via socket", "list_id": test_board["lists"][0]["id"]},
+        )
+        card = await command_service.execute_command(
+            db_session, uuid.UUID(test_board["id"]), command, owner_id
+        )
+        assert card.title == "Via socket"
+        assert str(card.board_id) == test_board["id"]
+
+    async def test_pipelined_moves_apply_in_order(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+        db_session: AsyncSession,
+    ):
+        owner_id = await _owner_id(client, auth_headers, test_board["id"])
+        board_id = uuid.UUID(test_board["id"])
+        commands = [
+            Command(
+                seq=seq,
+                op="card.move",
+                card_id=test_card["id"],
+                data={"list_id": lst["id"]},
+            )
+            for seq, lst in enumerate(test_lists[1:], start=1)
+        ]
+        for command in commands:
+            card = await command_service.execute_command(
+                db_session, board_id, command, owner_id
+            )
+            await db_session.close()
+        assert str(card.list_id) == test_lists[-1]["id"]
+
+    async def test_update_requires_card_id(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        db_session: AsyncSession,
+    ):
+        owner_id = await _owner_id(client, auth_headers, test_board["id"])
+        command = Command(seq=3, op="card.update", data={"title": "x"})
+        with pytest.raises(HTTPException) as exc_info:
+            await command_service.execute_command(
+                db_session, uuid.UUID(test_board["id"]), command, owner_id
+            )
+        assert exc_info.value.status_code == 422
+
+    def test_unknown_op_is_rejected(self):
+        with pytest.raises(ValidationError):
+            Command.model_validate({"seq": 1, "op": "card.explode"})
+
+
+class TestCommandSocket:
+    """Tests for the /boards/{id}/commands WebSocket."""
+
+    async def test_pipelined_commands_all_acked(
+        self,
+        auth_headers: dict,
+        test_board: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        execute_command = command_service.execute_command
+
+        async def failing_on_boom(db, board_id, command, owner_id):
+            if command.data.get("title") == "boom":
+                raise RuntimeError("boom")
+            return await execute_command(db, board_id, command, owner_id)
+
+        monkeypatch.setattr(command_service, "execute_command", failing_on_boom)
+        token = auth_headers["Authorization"].split()[1]
+        list_id = test_board["lists"][0]["id"]
+        with TestClient(app) as sync_client:
+            with sync_client.websocket_connect(
+                f"/api/v1/boards/{test_board['id']}/commands?token={token}"
+            ) as websocket:
+                for seq, title in enumerate(["first", "boom", "third"], start=1):
+                    websocket.send_json(
+                        {
+                            "seq": seq,
+                            "op": "card.create",
+                            "data": {"title": title, "list_id": list_id},
+                        }
+                    )
+                acks = [websocket.receive_json() for _ in range(3)]
+                websocket.send_text("not json")
+                rejected = websocket.receive_json()
+
+        assert [(ack["seq"], ack["ok"], ack["status"]) for ack in acks] == [
+            (1, True, None),
+            (2, False, 500),
+            (3, True, None),
+        ]
+        assert acks[2]["result"]["title"] == "third"
+        assert (rejected["ok"], rejected["status"]) == (False, 422)
+
+    async def test_invalid_token_is_refused(self, test_board: dict):
+        with TestClient(app) as sync_client:
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                with sync_client.websocket_connect(
+                    f"/api/v1/boards/{test_board['id']}/commands?token=invalid"
+                ):
+                    pass
+        assert exc_info.value.code == 1008
@@ -0,0 +1,172 @@
+import gzip
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import CompressionMiddleware, negotiate
+
+BODY = b'{"id":"0192c3a4-0000-7000-8000-000000000000","rank":"0|i00000:"}' * 100
+
+
+async def _json(request):
+    return Response(BODY, media_type="application/json", headers={"ETag": '"v1"'})
+
+
+async def _small(request):
+    return Response(b'{"ok":true}', media_type="application/json")
+
+
+async def _not_modified(request):
+    return Response(status_code=304, headers={"ETag": '"v1"'})
+
+
+async def _ndjson(request):
+    async def lines():
+        for n in range(5000):
+            yield b'{"type":"card","title":"Card %d"}\n' % n
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def _events(request):
+    async def events():
+        yield b"event: ping\ndata: {}\n\n" * 100
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _client(encodings: str = "gzip") -> AsyncClient:
+    app = Starlette(
+        routes=[
+            Route("/json", _json),
+            Route("/small", _small),
+            Route("/304", _not_modified),
+            Route("/ndjson", _ndjson),
+            Route("/events", _events),
+        ]
+    )
+    app.add_middleware(
+        CompressionMiddleware, encodings=encodings, min_size=1024, enabled=True
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestCompressionMiddleware:
+    """Tests for Accept-Encoding negotiated response compression."""
+
+    async def test_large_body_gzipped_with_weak_etag(self):
+        async with _client() as client:
+            response = await client.get("/json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(BODY) / 10
+        assert response.content == BODY
+
+    async def test_small_bodies_and_304_untouched(self):
+        async with _client() as client:
+            gzip_ok = {"Accept-Encoding": "gzip"}
+            small = await client.get("/small", headers=gzip_ok)
+            not_modified = await client.get("/304", headers=gzip_ok)
+            identity = await client.get(
+                "/json", headers={"Accept-Encoding": "identity"}
+            )
+        assert "content-encoding" not in small.headers
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == '"v1"'
+        assert "content-encoding" not in identity.headers
+        assert identity.content == BODY
+
+    async def test_streaming_response_compressed_incrementally(self):
+        async with _client() as client:
+            response = await client.get("/ndjson", headers={"Accept-Encoding": "gzip"})
+            raw = b""
+            async with client.stream(
+                "GET", "/ndjson", headers={"Accept-Encoding": "gzip"}
+            ) as stream:
+                async for chunk in stream.aiter_raw():
+                    raw += chunk
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        lines = response.content.splitlines()
+        assert len(lines) == 5000
+        assert lines[-1] == b'{"type":"card","title":"Card 4999"}'
+        assert gzip.decompress(raw) == response.content
+        assert len(raw) < len(response.content) / 5
+
+    async def test_event_stream_not_compressed(self):
+        async with _client() as client:
+            response = await client.get("/events", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    async def test_event_stream_headers_not_held_back(self):
+        sent = []
+
+        async def app(scope, receive, send):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream")],
+                }
+            )
+            # The client must see the headers before the first event
+            assert [message["type"] for message in sent] == ["http.response.start"]
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        async def send(message):
+            sent.append(message)
+
+        middleware = CompressionMiddleware(app, encodings="gzip", enabled=True)
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        await middleware(scope, None, send)
+        assert len(sent) == 2
+
+    async def test_zstd_preferred_when_installed(self):
+        zstandard = pytest.importorskip("zstandard")
+        async with _client("zstd,br,gzip") as client:
+            response = await client.get(
+                "/json", headers={"Accept-Encoding": "gzip, br, zstd"}
+            )
+        assert response.headers["content-encoding"] == "zstd"
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        assert decompressor.decompress(response.content) == BODY
+
+    async def test_api_board_detail_compressed(
+        self, client: AsyncClient, auth_headers: dict, test_board: dict
+    ):
+        for title in ("A", "B", "C") * 10:
+            await client.post(
+                "/api/v1/cards",
+                json={
+                    "title": f"Card {title}",
+                    "list_id": test_board["lists"][0]["id"],
+                    "board_id": test_board["id"],
+                },
+                headers=auth_headers,
+            )
+        response = await client.get(
+            f"/api/v1/boards/{test_board['id']}",
+            headers={**auth_headers, "Accept-Encoding": "gzip"},
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept, Accept-Encoding"
+        assert len(response.json()["lists"][0]["cards"]) == 30
+
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip", "gzip"),
+            ("gzip, br", "br"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("*", "br"),
+            ("*, br;q=0", "gzip"),
+        ],
+    )
+    def test_negotiate(self, accept_encoding: str | None, expected: str | None):
+        assert negotiate(accept_encoding, ["br", "gzip"]) == expected
@@ -0,0 +1,328 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import AsyncClient
+
+from app.core.broker import InMemoryBroker, PostgresBroker
+from app.core.events import EventHub, hub
+from app.main import app
+
+
+async def _collect(iterator) -> list[bytes]:
+    return [chunk async for chunk in iterator]
+
+
+class TestEventHub:
+    """Tests for the in-process pub/sub hub."""
+
+    async def test_fan_out_to_all_subscribers(self):
+        local_hub = EventHub(queue_size=10)
+        board_id = uuid.uuid4()
+        first = local_hub.subscribe(board_id)
+        second = local_hub.subscribe(board_id)
+        other = local_hub.subscribe(uuid.uuid4())
+
+        local_hub.publish(board_id, {"type": "card.deleted"})
+
+        assert (await first.get())["type"] == "card.deleted"
+        assert (await second.get())["type"] == "card.deleted"
+        assert other.queue.empty()
+
+    async def test_slow_consumer_is_resynced(self):
+        local_hub = EventHub(queue_size=3)
+        board_id = uuid.uuid4()
+        subscription = local_hub.subscribe(board_id)
+
+        for i in range(5):
+            local_hub.publish(board_id, {"type": "card.moved", "n": i})
+
+        assert subscription.resyncs == 1
+        assert (await subscription.get())["type"] == "resync"
+        assert (await subscription.get())["n"] == 4
+
+    async def test_unsubscribe_removes_board_entry(self):
+        local_hub = EventHub(queue_size=3)
+        board_id = uuid.uuid4()
+        subscription = local_hub.subscribe(board_id)
+        local_hub.unsubscribe(subscription)
+        assert local_hub.subscriber_count(board_id) == 0
+
+
+class TestServiceEvents:
+    """Tests that services publish events after commit."""
+
+    async def test_move_card_publishes_event(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        subscription = hub.subscribe(uuid.UUID(test_board["id"]))
+        try:
+            target_list_id = test_lists[1]["id"]
+            response = await client.post(
+                f"/api/v1/cards/{test_card['id']}/move",
+                json={"list_id": target_list_id},
+                params={"board_id": test_board["id"]},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+
+            event = await subscription.get()
+            assert event == {
+                "type": "card.moved",
+                "board_id": test_board["id"],
+                "id": test_card["id"],
+                "list_id": target_list_id,
+                "rank": response.json()["rank"],
+            }
+        finally:
+            hub.unsubscribe(subscription)
+
+    async def test_events_require_token(
+        self, client: AsyncClient, test_board: dict
+    ):
+        response = await client.get(f"/api/v1/boards/{test_board['id']}/events")
+        assert response.status_code == 401
+
+
+class TestEventTransports:
+    """Tests that mutations reach clients over the WebSocket and SSE streams."""
+
+    async def test_websocket_receives_mutation(
+        self, auth_headers: dict, test_board: dict
+    ):
+        token = auth_headers["Authorization"].split()[1]
+        with TestClient(app) as sync_client:
+            with sync_client.websocket_connect(
+                f"/api/v1/boards/{test_board['id']}/events?token={token}"
+            ) as websocket:
+                response = sync_client.post(
+                    "/api/v1/cards",
+                    json={
+                        "title": "Pushed",
+                        "list_id": test_board["lists"][0]["id"],
+                        "board_id": test_board["id"],
+                    },
+                    headers=auth_headers,
+                )
+                event = websocket.receive_json()
+
+        assert event["type"] == "card.created"
+        assert event["id"] == response.json()["id"]
+        assert event["title"] == "Pushed"
+
+    async def test_sse_streams_until_board_deleted(
+        self, client: AsyncClient, auth_headers: dict, test_board: dict
+    ):
+        board_id = test_board["id"]
+        stream = asyncio.create_task(
+            client.get(f"/api/v1/boards/{board_id}/events", headers=auth_headers)
+        )
+        for _ in range(100):
+            if hub.subscriber_count(uuid.UUID(board_id)):
+                break
+            await asyncio.sleep(0.01)
+
+        await client.patch(
+            f"/api/v1/boards/{board_id}", json={"title": "Renamed"}, headers=auth_headers
+        )
+        # board.deleted is the last event; the stream ends after it
+        await client.delete(f"/api/v1/boards/{board_id}", headers=auth_headers)
+        response = await asyncio.wait_for(stream, timeout=5)
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events == ["board.updated", "board.deleted"]
+
+    async def _open_stream(self, db_session, board_id: uuid.UUID):
+        """The SSE response as the endpoint returns it, before any body is sent."""
+        from sqlalchemy import select
+
+        from app.api.v1.events import board_events_stream
+        from app.models.user import User
+
+        user = await db_session.scalar(select(User).where(User.email == "test@test.com"))
+
+        async def is_disconnected():
+            return False
+
+        request = SimpleNamespace(is_disconnected=is_disconnected)
+        return await board_events_stream(board_id, request, user, db_session)
+
+    async def test_sse_keeps_events_published_before_streaming(
+        self, db_session, test_board: dict
+    ):
+        board_id = uuid.UUID(test_board["id"])
+        response = await self._open_stream(db_session, board_id)
+        hub.publish(board_id, {"type": "board.updated"})
+        hub.publish(board_id, {"type": "board.deleted"})
+
+        chunks = await asyncio.wait_for(_collect(response.body_iterator), timeout=5)
+        assert [chunk.split(b"\n")[0] for chunk in chunks] == [
+            b"event: board.updated",
+            b"event: board.deleted",
+        ]
+        assert hub.subscriber_count(board_id) == 0
+
+    async def test_batched_board_deletion_ends_stream(
+        self, db_session, test_board: dict
+    ):
+        board_id = uuid.UUID(test_board["id"])
+        response = await self._open_stream(db_session, board_id)
+        hub.dispatch(board_id, [{"type": "list.deleted"}, {"type": "board.deleted"}])
+
+        chunks = await asyncio.wait_for(_collect(response.body_iterator), timeout=5)
+        assert len(chunks) == 1
+        assert chunks[0].startswith(b"event: batch")
+
+
+class TestBrokerCoalescing:
+    """Tests for per-board, per-tick event coalescing."""
+
+    async def test_batch_publish_fans_out_once(self):
+        delivered = []
+        broker = InMemoryBroker(lambda board_id, events: delivered.append(events))
+        board_id = uuid.uuid4()
+
+        for i in range(200):
+            broker.publish(board_id, {"type": "card.moved", "id": str(i)})
+        await asyncio.sleep(0)
+
+        assert len(delivered) == 1
+        assert len(delivered[0]) == 200
+
+    async def test_repeated_events_collapse_to_latest(self):
+        delivered = []
+        broker = InMemoryBroker(lambda board_id, events: delivered.append(events))
+        board_id = uuid.uuid4()
+
+        broker.publish(board_id, {"type": "card.updated", "id": "a", "title": "1"})
+        broker.publish(board_id, {"type": "card.moved", "id": "b"})
+        broker.publish(board_id, {"type": "card.updated", "id": "a", "title": "2"})
+        await asyncio.sleep(0)
+
+        assert delivered == [
+            [
+                {"type": "card.moved", "id": "b"},
+                {"type": "card.updated", "id": "a", "title": "2"},
+            ]
+        ]
+
+    async def test_hub_dispatch_wraps_batches(self):
+        local_hub = EventHub(queue_size=10)
+        board_id = uuid.uuid4()
+        subscription = local_hub.subscribe(board_id)
+
+        local_hub.dispatch(board_id, [{"type": "a"}, {"type": "b"}])
+
+        message = await subscription.get()
+        assert message["type"] == "batch"
+        assert [e["type"] for e in message["events"]] == ["a", "b"]
+
+
+class FakeListenConnection:
+    """Stands in for an asyncpg connection; NOTIFY loops back to LISTEN."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.alive = True
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.pop(channel, None)
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    async def execute(self, query, *args):
+        if not self.alive:
+            raise ConnectionError("connection is closed")
+        if args:
+            channel, payload = args
+            self.listeners[channel](self, 0, channel, payload)
+
+    def terminate(self):
+        self.alive = False
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+class FakeEngine:
+    def __init__(self):
+        self.connections: list[FakeListenConnection] = []
+
+    async def connect(self):
+        driver_conn = FakeListenConnection()
+        self.connections.append(driver_conn)
+        raw = SimpleNamespace(driver_connection=driver_conn)
+
+        async def get_raw_connection():
+            return raw
+
+        async def close():
+            pass
+
+        return SimpleNamespace(
+            get_raw_connection=get_raw_connection, close=close, invalidate=close
+        )
+
+
+class TestPostgresBroker:
+    """Tests for LISTEN connection recovery, against a fake asyncpg connection."""
+
+    async def _wait_for_reconnect(self, broker: PostgresBroker, count: int) -> None:
+        for _ in range(100):
+            if broker.reconnects >= count:
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("broker did not reconnect")
+
+    async def test_terminated_connection_is_replaced_and_resyncs(self):
+        local_hub = EventHub(queue_size=10)
+        engine = FakeEngine()
+        broker = PostgresBroker(local_hub.dispatch, engine, local_hub.resync_all)
+        board_id = uuid.uuid4()
+        subscription = local_hub.subscribe(board_id)
+        await broker.start()
+        try:
+            engine.connections[0].terminate()
+            await self._wait_for_reconnect(broker, 1)
+            assert len(engine.connections) == 2
+            assert (await subscription.get())["type"] == "resync"
+
+            broker.publish(board_id, {"type": "card.deleted", "id": "a"})
+            assert (await subscription.get())["type"] == "card.deleted"
+        finally:
+            await broker.stop()
+
+    async def test_failed_health_check_reconnects(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("app.core.broker.HEALTH_CHECK_SECONDS", 0.01)
+        local_hub = EventHub(queue_size=10)
+        engine = FakeEngine()
+        broker = PostgresBroker(local_hub.dispatch, engine, local_hub.resync_all)
+        await broker.start()
+        try:
+            # Dead without a termination callback, like a half-open socket
+            engine.connections[0].alive = False
+            await self._wait_for_reconnect(broker, 1)
+            assert engine.connections[-1].alive
+        finally:
+            await broker.stop()
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestBoardExport:
+    """Tests for streaming NDJSON export and import."""
+
+    async def test_export_streams_board_lists_cards(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        response = await client.get(
+            f"/api/v1/boards/{test_board['id']}/export", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["type"] for r in records] == ["board", "list", "list", "list", "card"]
+        assert records[0]["title"] == "Test Board"
+        assert records[-1]["id"] == test_card["id"]
+
+    async def test_export_other_user_not_found(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        fake_id = "00000000-0000-0000-0000-000000000000"
+        response = await client.get(
+            f"/api/v1/boards/{fake_id}/export", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    async def test_import_round_trip(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        exported = await client.get(
+            f"/api/v1/boards/{test_board['id']}/export", headers=auth_headers
+        )
+        response = await client.post(
+            "/api/v1/boards/import",
+            content=exported.content,
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 201
+        new_id = response.json()["id"]
+        assert new_id != test_board["id"]
+
+        detail = (
+            await client.get(f"/api/v1/boards/{new_id}", headers=auth_headers)
+        ).json()
+        assert [lst["title"] for lst in detail["lists"]] == [
+            "To Do",
+            "In Progress",
+            "Done",
+        ]
+        assert [lst["card_count"] for lst in detail["lists"]] == [1, 0, 0]
+        card = detail["lists"][0]["cards"][0]
+        assert card["title"] == test_card["title"]
+        assert card["id"] != test_card["id"]
+
+    async def test_import_rejects_unknown_list(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        body = "\n".join(
+            [
+                json.dumps({"type": "board", "title": "Broken"}),
+                json.dumps(
+                    {
+                        "type": "card",
+                        "id": "00000000-0000-0000-0000-000000000001",
+                        "list_id": "00000000-0000-0000-0000-000000000002",
+                        "title": "Orphan",
+                        "rank": "0|hzzzzz:",
+                    }
+                ),
+            ]
+        )
+        response = await client.post(
+            "/api/v1/boards/import",
+            content=body,
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 422
+        assert "line 2" in response.json()["detail"]
+
+        boards = await client.get("/api/v1/boards/", headers=auth_headers)
+        assert boards.json() == []
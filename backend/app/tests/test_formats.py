@@ -0,0 +1,155 @@
+import msgpack
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.core.formats import prefers_msgpack
+from app.tests.conftest import test_engine
+
+
+class TestSparseFieldsets:
+    """Tests for ?fields= on the board, list and card read endpoints."""
+
+    async def test_board_fields_narrow_output_and_queries(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            response = await client.get(
+                f"/api/v1/boards/{test_board['id']}",
+                params={"fields": "title,lists.title,lists.cards.id"},
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", listener)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "title": "Test Board",
+            "lists": [{"title": "To Do", "cards": [{"id": test_card["id"]}]}],
+        }
+        card_query = next(s for s in statements if "FROM cards" in s)
+        assert "cards.title" not in card_query
+        assert "cards.description" not in card_query
+
+    async def test_board_without_lists_skips_list_queries(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+    ):
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", listener)
+        try:
+            response = await client.get(
+                f"/api/v1/boards/{test_board['id']}",
+                params={"fields": "id,title"},
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", listener)
+
+        assert response.json() == {"id": test_board["id"], "title": "Test Board"}
+        assert not any("FROM lists" in s or "FROM cards" in s for s in statements)
+
+    async def test_list_and_card_fields(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        list_id = test_board["lists"][0]["id"]
+        response = await client.get(
+            f"/api/v1/lists/{list_id}",
+            params={"fields": "card_count,cards.title"},
+            headers=auth_headers,
+        )
+        assert response.json() == {"card_count": 1, "cards": [{"title": "Test Card"}]}
+
+        response = await client.get(
+            f"/api/v1/lists/{list_id}", headers=auth_headers
+        )
+        assert response.json()["cards"][0]["description"] is None
+
+        response = await client.get(
+            f"/api/v1/cards/{test_card['id']}",
+            params={"board_id": test_board["id"], "fields": "rank"},
+            headers=auth_headers,
+        )
+        assert response.json() == {"rank": test_card["rank"]}
+
+    @pytest.mark.parametrize(
+        "fields, detail",
+        [
+            ("title,nope", "Unknown field: nope"),
+            ("title.id", "Unknown field: title.id"),
+            ("lists.cards.description", "Unknown field: lists.cards.description"),
+            (" , ", "No fields selected"),
+        ],
+    )
+    async def test_invalid_fields_rejected(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        fields: str,
+        detail: str,
+    ):
+        response = await client.get(
+            f"/api/v1/boards/{test_board['id']}",
+            params={"fields": fields, "mode": "summary"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == detail
+
+
+class TestMessagePack:
+    """Tests for MessagePack content negotiation."""
+
+    async def test_board_detail_as_msgpack(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        url = f"/api/v1/boards/{test_board['id']}"
+        as_json = await client.get(url, headers=auth_headers)
+        as_msgpack = await client.get(
+            url, headers={**auth_headers, "Accept": "application/msgpack"}
+        )
+
+        assert as_json.headers["content-type"] == "application/json"
+        assert as_msgpack.headers["content-type"] == "application/msgpack"
+        assert as_msgpack.headers["vary"] == "Accept"
+        assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+        assert len(as_msgpack.content) < len(as_json.content)
+
+    @pytest.mark.parametrize(
+        "accept, expected",
+        [
+            (None, False),
+            ("*/*", False),
+            ("application/msgpack", True),
+            ("application/x-msgpack, */*;q=0.1", True),
+            ("application/json, application/msgpack;q=0.5", False),
+            ("application/msgpack;q=0", False),
+        ],
+    )
+    def test_accept_negotiation(self, accept: str | None, expected: bool):
+        assert prefers_msgpack(accept) is expected
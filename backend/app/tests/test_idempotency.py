@@ -0,0 +1,219 @@
+import asyncio
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.idempotency import (
+    MAX_KEY_LENGTH,
+    DatabaseIdempotencyStore,
+    MemoryIdempotencyStore,
+    StoredResponse,
+)
+from app.core.security import create_access_token
+from app.models.idempotency import IdempotencyKey
+
+
+def _response(fingerprint: str = "f") -> StoredResponse:
+    return StoredResponse(
+        fingerprint=fingerprint,
+        status_code=201,
+        headers=[(b"content-type", b"application/json")],
+        body=b'{"ok": true}',
+    )
+
+
+class TestIdempotencyStores:
+    """Tests for the stored-response backends."""
+
+    async def test_memory_store_evicts_least_recent(self):
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_entries=2)
+        for scope in ("a", "b", "c"):
+            assert await store.begin(scope, "f") is None
+            await store.complete(scope, _response())
+        assert len(store) == 2
+        assert await store.begin("c", "f") is not None
+        # "a" was evicted, so the caller owns it again
+        assert await store.begin("a", "f") is None
+        await store.abort("a")
+
+    async def test_database_store_replays_and_releases(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ):
+        store = DatabaseIdempotencyStore(session_factory, ttl_seconds=60)
+        assert await store.begin("user:key", "f") is None
+        await store.complete("user:key", _response())
+
+        stored = await store.begin("user:key", "f")
+        assert stored.status_code == 201
+        assert stored.headers == [(b"content-type", b"application/json")]
+        assert stored.body == b'{"ok": true}'
+
+        assert await store.begin("user:other", "f") is None
+        await store.abort("user:other")
+        assert await store.begin("user:other", "f") is None
+        await store.abort("user:other")
+
+    async def test_duplicate_waits_for_in_flight_request(self):
+        store = MemoryIdempotencyStore(ttl_seconds=60, max_entries=10)
+        assert await store.begin("k", "f") is None
+        waiter = asyncio.ensure_future(store.begin("k", "f"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await store.complete("k", _response())
+        assert (await waiter).status_code == 201
+
+    async def test_failed_claim_releases_the_key(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ):
+        class FlakyStore(DatabaseIdempotencyStore):
+            failures = 1
+
+            async def _claim(self, scope: str, fingerprint: str) -> bool:
+                if self.failures:
+                    self.failures -= 1
+                    raise ConnectionError("database unavailable")
+                return await super()._claim(scope, fingerprint)
+
+        store = FlakyStore(session_factory, ttl_seconds=60)
+        with pytest.raises(ConnectionError):
+            await store.begin("user:key", "f")
+        # The retry owns the key right away instead of waiting out the timeout
+        assert await store.begin("user:key", "f", timeout=0.1) is None
+        await store.abort("user:key")
+
+
+class TestIdempotencyMiddleware:
+    """Tests for Idempotency-Key handling on POST endpoints."""
+
+    async def _card_count(self, client: AsyncClient, auth_headers: dict, board_id: str) -> int:
+        response = await client.get(f"/api/v1/boards/{board_id}", headers=auth_headers)
+        return sum(len(lst["cards"]) for lst in response.json()["lists"])
+
+    async def test_retry_replays_first_response(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+        payload = {
+            "title": "Once",
+            "list_id": test_lists[0]["id"],
+            "board_id": test_board["id"],
+        }
+
+        first = await client.post("/api/v1/cards/", json=payload, headers=headers)
+        second = await client.post("/api/v1/cards/", json=payload, headers=headers)
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert second.headers["idempotent-replayed"] == "true"
+        assert "idempotent-replayed" not in first.headers
+        assert await self._card_count(client, auth_headers, test_board["id"]) == 1
+
+    async def test_concurrent_duplicates_execute_once(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+        payload = {
+            "title": "Racing",
+            "list_id": test_lists[0]["id"],
+            "board_id": test_board["id"],
+        }
+
+        responses = await asyncio.gather(
+            *(client.post("/api/v1/cards/", json=payload, headers=headers) for _ in range(3))
+        )
+        assert {r.json()["id"] for r in responses} == {responses[0].json()["id"]}
+        assert await self._card_count(client, auth_headers, test_board["id"]) == 1
+
+    async def test_key_reused_for_different_request(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_lists: list[dict],
+        test_card: dict,
+    ):
+        headers = {**auth_headers, "Idempotency-Key": str(uuid.uuid4())}
+        params = {"board_id": test_lists[0]["board_id"]}
+        first = await client.post(
+            f"/api/v1/cards/{test_card['id']}/move",
+            json={"list_id": test_lists[1]["id"]},
+            params=params,
+            headers=headers,
+        )
+        assert first.status_code == 200
+
+        response = await client.post(
+            f"/api/v1/cards/{test_card['id']}/move",
+            json={"list_id": test_lists[2]["id"]},
+            params=params,
+            headers=headers,
+        )
+        assert response.status_code == 422
+
+    async def test_large_body_streams_through(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_card: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr("app.core.idempotency.MAX_REQUEST_BODY", 64)
+        exported = await client.get(
+            f"/api/v1/boards/{test_board['id']}/export", headers=auth_headers
+        )
+        headers = {
+            **auth_headers,
+            "Content-Type": "application/x-ndjson",
+            "Idempotency-Key": str(uuid.uuid4()),
+        }
+
+        async def chunked():
+            for line in exported.content.splitlines(keepends=True):
+                yield line
+
+        responses = [
+            # Declared length over the cap, and chunked with no length
+            await client.post(
+                "/api/v1/boards/import", content=exported.content, headers=headers
+            ),
+            await client.post(
+                "/api/v1/boards/import", content=chunked(), headers=headers
+            ),
+        ]
+        assert [r.status_code for r in responses] == [201, 201]
+        assert responses[0].json()["id"] != responses[1].json()["id"]
+        assert all("idempotent-replayed" not in r.headers for r in responses)
+
+    async def test_longest_key_fits_the_scope_column(
+        self,
+        client: AsyncClient,
+        session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        store = DatabaseIdempotencyStore(session_factory, ttl_seconds=60)
+        monkeypatch.setattr("app.core.idempotency.idempotency_store", store)
+        # The middleware keys on any validly signed subject, up to 255 chars
+        token = create_access_token({"sub": "u" * 255})
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Idempotency-Key": "k" * MAX_KEY_LENGTH,
+        }
+
+        first = await client.post("/api/v1/lists/", json={}, headers=headers)
+        second = await client.post("/api/v1/lists/", json={}, headers=headers)
+        assert first.status_code < 500
+        assert second.headers["idempotent-replayed"] == "true"
+        async with session_factory() as db:
+            [scope] = (await db.execute(select(IdempotencyKey.scope))).scalars()
+        # SQLite doesn't enforce VARCHAR lengths; PostgreSQL would reject it
+        assert len(scope) <= IdempotencyKey.__table__.c.scope.type.length
@@ -0,0 +1,24 @@
+import time
+import uuid
+
+from app.core.ids import uuid7
+
+
+class TestUuid7:
+    """Tests for time-ordered primary key generation."""
+
+    def test_layout(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        # First 48 bits are the current Unix time in milliseconds
+        assert abs((value.int >> 80) - time.time_ns() // 1_000_000) < 1000
+
+    def test_monotonic_within_process(self):
+        ids = [uuid7() for _ in range(10_000)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    async def test_new_rows_use_uuid7(self, test_board: dict, test_card: dict):
+        assert uuid.UUID(test_board["id"]).version == 7
+        assert uuid.UUID(test_card["id"]).version == 7
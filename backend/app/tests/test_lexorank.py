@@ -43,3 +43,13 @@ class TestLexoRank:
             assert new_rank not in ranks
             assert new_rank < ranks[0]
             ranks.insert(0, new_rank)
+
+    def test_rank_columns_use_byte_order_on_postgres(self):
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateTable
+
+        from app.models.card import Card
+        from app.models.list import List
+        for model in (Card, List):
+            ddl = str(CreateTable(model.__table__).compile(dialect=postgresql.dialect()))
+            assert 'rank VARCHAR(255) COLLATE "C" NOT NULL' in ddl
@@ -0,0 +1,296 @@
+import uuid
+
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.list import List
+from app.services.list_service import repair_card_counts
+
+
+async def _counts(client: AsyncClient, auth_headers: dict, board_id: str) -> dict:
+    response = await client.get(f"/api/v1/boards/{board_id}", headers=auth_headers)
+    return {lst["title"]: lst["card_count"] for lst in response.json()["lists"]}
+
+
+async def _create_card(
+    client: AsyncClient, auth_headers: dict, board_id: str, list_id: str, title: str
+):
+    return await client.post(
+        "/api/v1/cards",
+        json={"title": title, "list_id": list_id, "board_id": board_id},
+        headers=auth_headers,
+    )
+
+
+class TestCardCounts:
+    """Tests for the incrementally maintained List.card_count."""
+
+    async def test_counts_follow_create_move_and_delete(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        board_id = test_board["id"]
+        todo, doing = test_lists[0]["id"], test_lists[1]["id"]
+        cards = [
+            (await _create_card(client, auth_headers, board_id, todo, f"Card {i}")).json()
+            for i in range(3)
+        ]
+        assert await _counts(client, auth_headers, board_id) == {
+            "To Do": 3, "In Progress": 0, "Done": 0
+        }
+
+        await client.post(
+            f"/api/v1/cards/{cards[0]['id']}/move",
+            json={"list_id": doing, "before_rank": None, "after_rank": None},
+            params={"board_id": board_id},
+            headers=auth_headers,
+        )
+        await client.delete(
+            f"/api/v1/cards/{cards[1]['id']}",
+            params={"board_id": board_id},
+            headers=auth_headers,
+        )
+        assert await _counts(client, auth_headers, board_id) == {
+            "To Do": 1, "In Progress": 1, "Done": 0
+        }
+
+        await client.delete(f"/api/v1/lists/{doing}", headers=auth_headers)
+        assert await _counts(client, auth_headers, board_id) == {"To Do": 1, "Done": 0}
+
+    async def test_repair_recomputes_drifted_counts(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        db_session: AsyncSession,
+    ):
+        board_id = test_board["id"]
+        list_id = test_board["lists"][0]["id"]
+        await _create_card(client, auth_headers, board_id, list_id, "Only card")
+
+        await db_session.execute(
+            update(List).where(List.id == uuid.UUID(list_id)).values(card_count=7)
+        )
+        assert await repair_card_counts(db_session) == 1
+        assert await repair_card_counts(db_session, uuid.UUID(board_id)) == 0
+        await db_session.commit()
+
+        assert await _counts(client, auth_headers, board_id) == {"To Do": 1}
+
+
+class TestWipLimit:
+    """Tests for per-list WIP limits."""
+
+    async def test_create_card_rejected_at_limit(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+    ):
+        board_id = test_board["id"]
+        response = await client.post(
+            "/api/v1/lists",
+            json={"title": "Doing", "board_id": board_id, "wip_limit": 2},
+            headers=auth_headers,
+        )
+        assert response.json()["wip_limit"] == 2
+        list_id = response.json()["id"]
+
+        for i in range(2):
+            response = await _create_card(client, auth_headers, board_id, list_id, f"C{i}")
+            assert response.status_code == 201
+        response = await _create_card(client, auth_headers, board_id, list_id, "Over")
+        assert response.status_code == 409
+        assert response.json()["detail"] == "List WIP limit reached"
+        assert (await _counts(client, auth_headers, board_id))["Doing"] == 2
+
+        # Clearing the limit with an explicit null lifts it
+        response = await client.patch(
+            f"/api/v1/lists/{list_id}", json={"wip_limit": None}, headers=auth_headers
+        )
+        assert response.json()["wip_limit"] is None
+        response = await _create_card(client, auth_headers, board_id, list_id, "Now fits")
+        assert response.status_code == 201
+
+    async def test_move_into_full_list_rejected(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        board_id = test_board["id"]
+        todo, doing = test_lists[0]["id"], test_lists[1]["id"]
+        await client.patch(
+            f"/api/v1/lists/{doing}", json={"wip_limit": 1}, headers=auth_headers
+        )
+        first = (await _create_card(client, auth_headers, board_id, todo, "A")).json()
+        second = (await _create_card(client, auth_headers, board_id, todo, "B")).json()
+
+        move = {"list_id": doing, "before_rank": None, "after_rank": None}
+        params = {"board_id": board_id}
+        response = await client.post(
+            f"/api/v1/cards/{first['id']}/move",
+            json=move,
+            params=params,
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        response = await client.post(
+            f"/api/v1/cards/{second['id']}/move",
+            json=move,
+            params=params,
+            headers=auth_headers,
+        )
+        assert response.status_code == 409
+
+        # Reordering within a full list is not an addition
+        response = await client.post(
+            f"/api/v1/cards/{first['id']}/move",
+            json={"list_id": doing, "before_rank": None, "after_rank": "0|zzzzzz:"},
+            params=params,
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert await _counts(client, auth_headers, board_id) == {
+            "To Do": 1, "In Progress": 1, "Done": 0
+        }
+
+
+class TestCreateListRank:
+    """Tests for positioning new lists with neighbor queries."""
+
+    async def test_after_rank_inserts_between_neighbors(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        todo, doing = test_lists[0], test_lists[1]
+        response = await client.post(
+            "/api/v1/lists",
+            json={
+                "title": "Review",
+                "board_id": test_board["id"],
+                "after_rank": todo["rank"],
+            },
+            headers=auth_headers,
+        )
+        assert todo["rank"] < response.json()["rank"] < doing["rank"]
+
+    async def test_after_last_or_unknown_rank_appends(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        last_rank = test_lists[-1]["rank"]
+        for anchor in (last_rank, "0|000001:"):
+            response = await client.post(
+                "/api/v1/lists",
+                json={"title": "Later", "board_id": test_board["id"], "after_rank": anchor},
+                headers=auth_headers,
+            )
+            assert response.json()["rank"] > last_rank
+            last_rank = response.json()["rank"]
+
+    async def test_ranks_of_deleted_lists_are_not_reused(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        todo, doing = test_lists[0], test_lists[1]
+        for after_rank in (todo["rank"], None):
+            first = await client.post(
+                "/api/v1/lists",
+                json={
+                    "title": "Short-lived",
+                    "board_id": test_board["id"],
+                    "after_rank": after_rank,
+                },
+                headers=auth_headers,
+            )
+            await client.delete(
+                f"/api/v1/lists/{first.json()['id']}", headers=auth_headers
+            )
+            second = await client.post(
+                "/api/v1/lists",
+                json={
+                    "title": "Replacement",
+                    "board_id": test_board["id"],
+                    "after_rank": after_rank,
+                },
+                headers=auth_headers,
+            )
+            assert second.status_code == 201
+            assert second.json()["rank"] != first.json()["rank"]
+        assert todo["rank"] < doing["rank"]
+
+
+class TestMoveList:
+    """Tests for repositioning a list."""
+
+    async def test_move_list_to_start(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        done = test_lists[2]
+        response = await client.post(
+            f"/api/v1/lists/{done['id']}/move",
+            json={"before_rank": None, "after_rank": test_lists[0]["rank"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["rank"] < test_lists[0]["rank"]
+
+        board = await client.get(f"/api/v1/boards/{test_board['id']}", headers=auth_headers)
+        assert [lst["title"] for lst in board.json()["lists"]] == [
+            "Done", "To Do", "In Progress"
+        ]
+
+    async def test_rank_collision_retries_with_extended_rank(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        test_lists: list[dict],
+    ):
+        # Without neighbors the computed rank is the initial rank, held by "To Do"
+        todo, done = test_lists[0], test_lists[2]
+        response = await client.post(
+            f"/api/v1/lists/{done['id']}/move", json={}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["rank"] == f"0|{todo['rank'][2:-1]}i:"
+
+    async def test_move_other_users_list_not_found(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_lists: list[dict],
+    ):
+        await client.post(
+            "/api/v1/auth/register",
+            json={"email": "other@test.com", "password": "password123"},
+        )
+        login = await client.post(
+            "/api/v1/auth/login",
+            data={"username": "other@test.com", "password": "password123"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        other_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        response = await client.post(
+            f"/api/v1/lists/{test_lists[1]['id']}/move", json={}, headers=other_headers
+        )
+        assert response.status_code == 404
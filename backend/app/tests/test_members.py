@@ -0,0 +1,174 @@
+import uuid
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.access import board_access
+
+
+@pytest_asyncio.fixture
+async def other_headers(client: AsyncClient) -> dict:
+    """Register a second user and return their auth headers."""
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "other@test.com", "password": "password123"},
+    )
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "other@test.com", "password": "password123"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _share(client: AsyncClient, headers: dict, board_id: str, role: str):
+    return await client.put(
+        f"/api/v1/boards/{board_id}/members",
+        json={"email": "other@test.com", "role": role},
+        headers=headers,
+    )
+
+
+class TestBoardMembers:
+    """Tests for sharing boards with roles."""
+
+    async def test_viewer_can_read_but_not_write(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        other_headers: dict,
+        test_board: dict,
+        test_card: dict,
+    ):
+        board_id = test_board["id"]
+        response = await _share(client, auth_headers, board_id, "viewer")
+        assert response.status_code == 200
+        assert response.json()["role"] == "viewer"
+
+        boards = await client.get("/api/v1/boards", headers=other_headers)
+        assert [b["id"] for b in boards.json()] == [board_id]
+        detail = await client.get(f"/api/v1/boards/{board_id}", headers=other_headers)
+        assert detail.json()["lists"][0]["cards"][0]["id"] == test_card["id"]
+
+        response = await client.patch(
+            f"/api/v1/cards/{test_card['id']}",
+            json={"title": "Nope"},
+            params={"board_id": board_id},
+            headers=other_headers,
+        )
+        assert response.status_code == 403
+        response = await client.put(
+            f"/api/v1/boards/{board_id}/members",
+            json={"email": "test@test.com", "role": "viewer"},
+            headers=other_headers,
+        )
+        assert response.status_code == 403
+
+    async def test_editor_can_write_until_removed(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        other_headers: dict,
+        test_board: dict,
+    ):
+        board_id = test_board["id"]
+        list_id = test_board["lists"][0]["id"]
+        member = (await _share(client, auth_headers, board_id, "editor")).json()
+
+        response = await client.post(
+            "/api/v1/cards",
+            json={"title": "Shared", "list_id": list_id, "board_id": board_id},
+            headers=other_headers,
+        )
+        assert response.status_code == 201
+        response = await client.delete(f"/api/v1/boards/{board_id}", headers=other_headers)
+        assert response.status_code == 403
+
+        response = await client.delete(
+            f"/api/v1/boards/{board_id}/members/{member['user_id']}",
+            headers=auth_headers,
+        )
+        assert response.status_code == 204
+        response = await client.get(f"/api/v1/boards/{board_id}", headers=other_headers)
+        assert response.status_code == 404
+        members = await client.get(f"/api/v1/boards/{board_id}/members", headers=auth_headers)
+        assert [m["role"] for m in members.json()] == ["owner"]
+
+    async def test_staged_edit_rechecks_role(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        other_headers: dict,
+        test_board: dict,
+        test_card: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        from app.core.coalescer import card_writes
+
+        monkeypatch.setattr(card_writes, "window_ms", 60_000)
+        board_id = test_board["id"]
+        url = f"/api/v1/cards/{test_card['id']}"
+        await _share(client, auth_headers, board_id, "editor")
+        params = {"board_id": board_id}
+        response = await client.patch(
+            url, json={"title": "Staged"}, params=params, headers=other_headers
+        )
+        assert response.status_code == 200
+        response = await client.patch(
+            url,
+            json={"title": "Merged"},
+            params={"board_id": str(uuid.uuid4())},
+            headers=other_headers,
+        )
+        assert response.status_code == 404
+
+        # Downgraded while the edit is still staged
+        await _share(client, auth_headers, board_id, "viewer")
+        response = await client.patch(
+            url, json={"title": "Merged"}, params=params, headers=other_headers
+        )
+        assert response.status_code == 403
+
+    async def test_creator_stays_owner(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+    ):
+        response = await client.put(
+            f"/api/v1/boards/{test_board['id']}/members",
+            json={"email": "test@test.com", "role": "viewer"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 409
+
+
+class TestBoardAccess:
+    """Tests for the session-scoped access resolver."""
+
+    async def test_one_lookup_per_session(
+        self,
+        test_board: dict,
+        db_session: AsyncSession,
+    ):
+        access = board_access(db_session, uuid.UUID(test_board["owner_id"]))
+        assert board_access(db_session, access.user_id) is access
+
+        statements = []
+        sync_engine = db_session.bind.sync_engine
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", listener)
+        try:
+            for _ in range(3):
+                await access.require(uuid.UUID(test_board["id"]), "owner")
+            assert await access.role(uuid.uuid4()) is None
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", listener)
+        assert access.loads == 1
+        assert len(statements) == 1
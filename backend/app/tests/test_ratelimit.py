@@ -0,0 +1,89 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.ratelimit import (
+    MemoryBucketStore,
+    RateLimit,
+    RateLimitMiddleware,
+    route_class,
+)
+from app.core.security import create_access_token
+
+
+def _app(limits: dict[str, RateLimit]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware, limits=limits, store=MemoryBucketStore(), enabled=True
+    )
+
+    @app.get("/api/v1/boards/")
+    async def boards():
+        return []
+
+    @app.post("/api/v1/cards/{card_id}/move")
+    async def move(card_id: str):
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app
+
+
+def _headers(email: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+
+class TestTokenBucket:
+    """Tests for bucket arithmetic and route classification."""
+
+    async def test_bucket_refills_over_time(self):
+        store = MemoryBucketStore()
+        limit = RateLimit(capacity=2, per_seconds=10)
+        assert await store.take("k", limit, now=0) == 0
+        assert await store.take("k", limit, now=0) == 0
+        assert await store.take("k", limit, now=0) == pytest.approx(5)
+        # Half the refill interval later one token is back
+        assert await store.take("k", limit, now=5) == 0
+
+    async def test_store_is_bounded(self):
+        store = MemoryBucketStore(max_keys=2)
+        limit = RateLimit(capacity=1, per_seconds=60)
+        for key in ("a", "b", "c"):
+            await store.take(key, limit, now=0)
+        # "a" was evicted and starts with a full bucket again
+        assert await store.take("a", limit, now=0) == 0
+        assert await store.take("c", limit, now=0) > 0
+
+    def test_parse_and_classify(self):
+        assert RateLimit.parse("120/minute") == RateLimit(120, 60)
+        with pytest.raises(ValueError):
+            RateLimit.parse("fast")
+        assert route_class("POST", "/api/v1/cards/abc/move") == "moves"
+        assert route_class("POST", "/api/v1/auth/login") == "login"
+        assert route_class("GET", "/api/v1/boards/") == "reads"
+        assert route_class("PATCH", "/api/v1/cards/abc") == "writes"
+        assert route_class("GET", "/health") is None
+
+
+class TestRateLimitMiddleware:
+    """Tests for 429 responses from the middleware."""
+
+    async def test_returns_429_with_retry_after(self):
+        app = _app({"moves": RateLimit(2, 60), "reads": RateLimit(100, 60)})
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            headers = _headers("a@test.com")
+            for _ in range(2):
+                response = await ac.post("/api/v1/cards/1/move", headers=headers)
+                assert response.status_code == 200
+            response = await ac.post("/api/v1/cards/1/move", headers=headers)
+            assert response.status_code == 429
+            assert response.headers["retry-after"] == "30"
+
+            # Other budgets, other users and exempt paths are unaffected
+            assert (await ac.get("/api/v1/boards/", headers=headers)).status_code == 200
+            other = await ac.post("/api/v1/cards/1/move", headers=_headers("b@test.com"))
+            assert other.status_code == 200
+            assert (await ac.get("/health")).status_code == 200
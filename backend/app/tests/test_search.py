@@ -0,0 +1,178 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+
+async def _create_card(client, auth_headers, board, title, description=None):
+    response = await client.post(
+        "/api/v1/cards",
+        json={
+            "title": title,
+            "list_id": board["lists"][0]["id"],
+            "board_id": board["id"],
+        },
+        headers=auth_headers,
+    )
+    card = response.json()
+    if description is not None:
+        await client.patch(
+            f"/api/v1/cards/{card['id']}",
+            json={"description": description},
+            params={"board_id": board["id"]},
+            headers=auth_headers,
+        )
+    return card
+
+
+class TestSearch:
+    """Tests for full-text card search."""
+
+    async def test_search_matches_title_and_description(
+        self, client: AsyncClient, auth_headers: dict, test_board: dict
+    ):
+        by_title = await _create_card(client, auth_headers, test_board, "Deploy pipeline")
+        by_description = await _create_card(
+            client, auth_headers, test_board, "Ops", "fix the deployment script"
+        )
+        await _create_card(client, auth_headers, test_board, "Unrelated")
+
+        response = await client.get(
+            "/api/v1/search", params={"q": "deploy"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        ids = [hit["id"] for hit in response.json()["items"]]
+        assert set(ids) == {by_title["id"], by_description["id"]}
+
+    async def test_search_excludes_deleted_and_updates_index(
+        self, client: AsyncClient, auth_headers: dict, test_board: dict
+    ):
+        card = await _create_card(client, auth_headers, test_board, "Quarterly report")
+        await client.patch(
+            f"/api/v1/cards/{card['id']}",
+            json={"title": "Annual summary"},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        old = await client.get(
+            "/api/v1/search", params={"q": "quarterly"}, headers=auth_headers
+        )
+        assert old.json()["items"] == []
+
+        await client.delete(
+            f"/api/v1/cards/{card['id']}",
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        new = await client.get(
+            "/api/v1/search", params={"q": "annual"}, headers=auth_headers
+        )
+        assert new.json()["items"] == []
+
+    async def test_search_paginates(
+        self, client: AsyncClient, auth_headers: dict, test_board: dict
+    ):
+        for i in range(3):
+            await _create_card(client, auth_headers, test_board, f"Bug {i}")
+
+        first = await client.get(
+            "/api/v1/search",
+            params={"q": "bug", "limit": 2},
+            headers=auth_headers,
+        )
+        assert len(first.json()["items"]) == 2
+        assert first.json()["next_offset"] == 2
+
+        second = await client.get(
+            "/api/v1/search",
+            params={"q": "bug", "limit": 2, "offset": 2},
+            headers=auth_headers,
+        )
+        assert len(second.json()["items"]) == 1
+        assert second.json()["next_offset"] is None
+
+    async def test_search_scoped_to_caller(
+        self, client: AsyncClient, auth_headers: dict, test_board: dict
+    ):
+        await _create_card(client, auth_headers, test_board, "Secret plan")
+        await client.post(
+            "/api/v1/auth/register",
+            json={"email": "other@test.com", "password": "password123"},
+        )
+        login_resp = await client.post(
+            "/api/v1/auth/login",
+            data={"username": "other@test.com", "password": "password123"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        other_headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+        response = await client.get(
+            "/api/v1/search", params={"q": "secret"}, headers=other_headers
+        )
+        assert response.json()["items"] == []
+
+    async def test_search_flushes_only_callers_boards(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        from app.core.coalescer import card_writes
+
+        monkeypatch.setattr(card_writes, "window_ms", 60_000)
+        card = await _create_card(client, auth_headers, test_board, "Draft")
+        await client.patch(
+            f"/api/v1/cards/{card['id']}",
+            json={"title": "Roadmap"},
+            params={"board_id": test_board["id"]},
+            headers=auth_headers,
+        )
+        writes_before = card_writes.writes
+
+        await client.post(
+            "/api/v1/auth/register",
+            json={"email": "other@test.com", "password": "password123"},
+        )
+        login_resp = await client.post(
+            "/api/v1/auth/login",
+            data={"username": "other@test.com", "password": "password123"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        other_headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+        await client.get("/api/v1/search", params={"q": "roadmap"}, headers=other_headers)
+        assert card_writes.writes == writes_before
+
+        response = await client.get(
+            "/api/v1/search", params={"q": "roadmap"}, headers=auth_headers
+        )
+        assert [hit["title"] for hit in response.json()["items"]] == ["Roadmap"]
+        assert card_writes.writes == writes_before + 1
+
+    async def test_search_tolerates_query_syntax(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        response = await client.get(
+            "/api/v1/search", params={"q": '"AND (*'}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
+    async def test_index_survives_rowid_renumbering(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_board: dict,
+        session_factory,
+    ):
+        for word in ("alpha", "bravo", "charlie"):
+            await _create_card(client, auth_headers, test_board, f"Card {word}")
+        # What VACUUM or a dump and restore may do to a table without an
+        # INTEGER PRIMARY KEY: the implicit rowids change, the rows don't
+        async with session_factory() as db:
+            await db.execute(text("UPDATE cards SET rowid = rowid + 1000"))
+            await db.commit()
+
+        response = await client.get(
+            "/api/v1/search", params={"q": "charlie"}, headers=auth_headers
+        )
+        assert [hit["title"] for hit in response.json()["items"]] == ["Card charlie"]
@@ -0,0 +1,186 @@
+"""
+Board detail: ORM instances vs Core rows.
+
+Seeds a scratch board (one user, `--lists` lists, `--cards` cards spread
+across them), then loads and serializes it through `BoardDetailOut` with:
+
+- orm:  Board/List/Card instances with selectinload and set_committed_value,
+        as get_board_detail did before the read-only path;
+- core: board_service.get_board_detail, column selects into __slots__ views.
+
+Each request uses a fresh session, as the API does. For each path it reports
+CPU and wall time per request, then for one request under tracemalloc the
+peak memory allocated and the number of garbage collector runs its
+allocations triggered (timed runs are untraced).
+
+    cd backend
+    python -m benchmarks.board_detail --cards 10000
+    python -m benchmarks.board_detail --url sqlite+aiosqlite:///./bench.db
+
+Runs against DATABASE_URL by default; the tables are created if missing and
+the scratch rows are deleted at the end.
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+import uuid
+from collections import defaultdict
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.core.config import settings
+from app.core.database import Base
+from app.core.ids import uuid7
+from app.core.lexorank import LexoRank
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+from app.schemas.board import BoardDetailOut
+from app.services import board_service
+
+DESCRIPTION = "Acceptance criteria: " + "lorem ipsum " * 10
+
+
+async def _orm_detail(db, board_id: uuid.UUID) -> Board:
+    result = await db.execute(
+        select(Board)
+        .where(Board.id == board_id, Board.deleted_at.is_(None))
+        .options(selectinload(Board.lists).noload(List.cards))
+    )
+    board = result.scalar_one()
+    cards_result = await db.execute(
+        select(Card)
+        .where(Card.board_id == board_id, Card.deleted_at.is_(None))
+        .order_by(Card.rank)
+    )
+    cards_by_list: dict[uuid.UUID, list[Card]] = defaultdict(list)
+    for card in cards_result.scalars():
+        cards_by_list[card.list_id].append(card)
+    set_committed_value(
+        board, "lists", [lst for lst in board.lists if lst.deleted_at is None]
+    )
+    for lst in board.lists:
+        set_committed_value(lst, "cards", cards_by_list.get(lst.id, []))
+    return board
+
+
+async def _core_detail(db, board_id: uuid.UUID, user_id: uuid.UUID):
+    return await board_service.get_board_detail(db, board_id, user_id)
+
+
+async def seed_board(
+    session_factory, lists: int, cards: int
+) -> tuple[uuid.UUID, uuid.UUID]:
+    """Create a scratch user and board; returns (user_id, board_id)."""
+    user_id, board_id = uuid7(), uuid7()
+    list_ids = [uuid7() for _ in range(lists)]
+    list_ranks = LexoRank.generate_n_ranks(lists)
+    per_list = -(-cards // lists)
+    card_ranks = LexoRank.generate_n_ranks(per_list)
+    async with session_factory() as db:
+        db.add(User(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="-"))
+        await db.flush()
+        db.add(Board(id=board_id, title="Benchmark board", owner_id=user_id))
+        await db.flush()
+        db.add(BoardMember(user_id=user_id, board_id=board_id, role="owner"))
+        await db.execute(
+            insert(List),
+            [
+                {"id": list_id, "board_id": board_id, "title": f"List {i}", "rank": rank}
+                for i, (list_id, rank) in enumerate(zip(list_ids, list_ranks))
+            ],
+        )
+        rows = [
+            {
+                "id": uuid7(),
+                "list_id": list_ids[n % lists],
+                "board_id": board_id,
+                "title": f"Card {n}",
+                "description": DESCRIPTION,
+                "rank": card_ranks[n // lists],
+            }
+            for n in range(cards)
+        ]
+        for start in range(0, cards, 5_000):
+            await db.execute(insert(Card), rows[start:start + 5_000])
+        await db.commit()
+    return user_id, board_id
+
+
+async def delete_board(
+    session_factory, user_id: uuid.UUID, board_id: uuid.UUID
+) -> None:
+    """Remove everything `seed_board` created."""
+    async with session_factory() as db:
+        await db.execute(delete(Card).where(Card.board_id == board_id))
+        await db.execute(delete(List).where(List.board_id == board_id))
+        await db.execute(delete(BoardMember).where(BoardMember.board_id == board_id))
+        await db.execute(delete(Board).where(Board.id == board_id))
+        await db.execute(delete(User).where(User.id == user_id))
+        await db.commit()
+
+
+async def _request(session_factory, load, board_id, user_id) -> None:
+    async with session_factory() as db:
+        board = await load(db, board_id, user_id)
+        BoardDetailOut.model_validate(board, from_attributes=True).model_dump_json()
+
+
+async def _run(url: str, lists: int, cards: int, requests: int) -> None:
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, board_id = await seed_board(session_factory, lists, cards)
+    paths = {
+        "orm": lambda db, b, u: _orm_detail(db, b),
+        "core": _core_detail,
+    }
+    try:
+        print(f"{cards:,} cards in {lists} lists, {requests} requests per path")
+        for name, load in paths.items():
+            await _request(session_factory, load, board_id, user_id)  # warm up
+
+            cpu_started, wall_started = time.process_time(), time.perf_counter()
+            for _ in range(requests):
+                await _request(session_factory, load, board_id, user_id)
+            cpu = (time.process_time() - cpu_started) / requests
+            wall = (time.perf_counter() - wall_started) / requests
+
+            gc.collect()
+            collections = sum(stat["collections"] for stat in gc.get_stats())
+            tracemalloc.start()
+            await _request(session_factory, load, board_id, user_id)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+            print(
+                f"{name:>5}: cpu {cpu * 1000:8.1f} ms | wall {wall * 1000:8.1f} ms | "
+                f"peak {peak / 1024:9,.0f} KiB | gc runs {collections}"
+            )
+    finally:
+        await delete_board(session_factory, user_id, board_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.lists, args.cards, args.requests))
+
+
+if __name__ == "__main__":
+    main()
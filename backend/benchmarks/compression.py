@@ -0,0 +1,102 @@
+"""
+Response compression: bytes on the wire and CPU cost per request size.
+
+Builds board detail payloads of increasing size (ids, LexoRank ranks, titles
+and short descriptions, encoded like the API), then compresses each with
+every available encoding at several levels using app.core.compression and
+reports the compressed size, the ratio and the CPU time per response.
+
+    cd backend
+    python -m benchmarks.compression
+    python -m benchmarks.compression --cards 100 1000 10000 --repeat 20
+
+zstd and br rows appear only when `zstandard` and `brotli` are installed.
+No database is needed.
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+
+from pydantic_core import to_json
+
+from app.core.compression import available_encodings, compress
+from app.core.ids import uuid7
+from app.core.lexorank import LexoRank
+
+LEVELS = {"gzip": (1, 4, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 9, 19)}
+LISTS = 10
+
+
+def _board(cards: int) -> bytes:
+    board_id = uuid7()
+    now = datetime.now(timezone.utc)
+    lists = [
+        {
+            "id": uuid7(),
+            "title": f"List {i}",
+            "rank": rank,
+            "board_id": board_id,
+            "card_count": 0,
+            "wip_limit": None,
+            "cards": [],
+        }
+        for i, rank in enumerate(LexoRank.generate_n_ranks(LISTS))
+    ]
+    ranks = LexoRank.generate_n_ranks(-(-cards // LISTS))
+    for n in range(cards):
+        lst = lists[n % LISTS]
+        lst["cards"].append(
+            {
+                "id": uuid7(),
+                "title": f"Card {n}: follow up on the release checklist",
+                "rank": ranks[n // LISTS],
+                "list_id": lst["id"],
+                "created_at": now,
+                "description": None if n % 3 else f"Details for card {n}.",
+            }
+        )
+        lst["card_count"] += 1
+    return to_json(
+        {
+            "id": board_id,
+            "title": "Benchmark board",
+            "description": None,
+            "owner_id": uuid7(),
+            "created_at": now,
+            "lists": lists,
+        }
+    )
+
+
+def _run(sizes: list[int], repeat: int) -> None:
+    encodings = available_encodings("gzip,br,zstd")
+    print(f"encodings: {', '.join(encodings)}; {repeat} runs per level")
+    for cards in sizes:
+        body = _board(cards)
+        print(f"\n{cards:,} cards: {len(body):,} bytes uncompressed")
+        for encoding in encodings:
+            for level in LEVELS[encoding]:
+                started = time.process_time()
+                for _ in range(repeat):
+                    compressed = compress(encoding, body, level)
+                cpu = (time.process_time() - started) / repeat
+                print(
+                    f"  {encoding:>4} {level:>2}: {len(compressed):>10,} bytes "
+                    f"({len(compressed) / len(body):6.1%}) | "
+                    f"cpu {cpu * 1000:8.2f} ms | "
+                    f"{len(body) / cpu / 1e6 if cpu else 0:8.1f} MB/s"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--cards", type=int, nargs="+", default=[10, 100, 1_000, 10_000]
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    _run(args.cards, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
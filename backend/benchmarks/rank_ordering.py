@@ -0,0 +1,130 @@
+"""
+Rank ordering: locale collation vs COLLATE "C" on PostgreSQL.
+
+Fills two scratch tables with the same LexoRank strings, one `rank` column
+using a locale collation and one using "C", then times for each:
+
+- CREATE INDEX on (list_id, rank), as rebuilt for uq_card_list_rank;
+- a full sort (ORDER BY rank without an index);
+- an index-ordered scan of one list's ranks, as in board detail.
+
+It also checks which collation returns the ranks in the same order as
+Python's `sorted()`, which is what LexoRank.rank_between assumes.
+
+    cd backend
+    python -m benchmarks.rank_ordering --rows 2000000
+    python -m benchmarks.rank_ordering --locale en-US-x-icu
+
+The database default collation is used for the locale table unless
+`--locale` is given; if the default is already C the comparison is moot.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.lexorank import LexoRank
+
+LISTS = 1_000
+
+
+def _ranks(rows: int) -> list[str]:
+    """Realistic ranks: evenly spread appends plus midpoints from moves."""
+    ranks = []
+    for _ in range(rows):
+        length = random.choice((6, 6, 6, 7, 8, 10))
+        value = "".join(random.choice(LexoRank.CHARSET) for _ in range(length))
+        ranks.append(f"0|{value}:")
+    return ranks
+
+
+async def _timed(conn, sql: str, params: dict | None = None) -> tuple[float, list]:
+    started = time.perf_counter()
+    result = await conn.execute(text(sql), params or {})
+    rows = result.fetchall() if result.returns_rows else []
+    return time.perf_counter() - started, rows
+
+
+async def _run(url: str, rows: int, locale: str | None) -> None:
+    engine = create_async_engine(url)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("This benchmark needs PostgreSQL (collations are dialect-specific)")
+
+    list_ids = [uuid.uuid4() for _ in range(LISTS)]
+    ranks = _ranks(rows)
+    data = [
+        {"list_id": list_ids[i % LISTS], "rank": rank} for i, rank in enumerate(ranks)
+    ]
+    collations = {
+        "locale": f'COLLATE "{locale}"' if locale else "",
+        "C": 'COLLATE "C"',
+    }
+
+    async with engine.begin() as conn:
+        default = await conn.scalar(
+            text("SELECT datcollate FROM pg_database WHERE datname = current_database()")
+        )
+        print(f"database default collation: {default}")
+        for name, collate in collations.items():
+            table = f"bench_rank_{name.lower()}"
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            await conn.execute(
+                text(f"CREATE TABLE {table} (list_id uuid NOT NULL, rank varchar(255) {collate} NOT NULL)")
+            )
+            for start in range(0, rows, 10_000):
+                await conn.execute(
+                    text(f"INSERT INTO {table} (list_id, rank) VALUES (:list_id, :rank)"),
+                    data[start:start + 10_000],
+                )
+            await conn.execute(text(f"ANALYZE {table}"))
+
+    try:
+        expected = sorted(set(ranks))
+        for name in collations:
+            table = f"bench_rank_{name.lower()}"
+            async with engine.begin() as conn:
+                await conn.execute(text("SET LOCAL work_mem = '256MB'"))
+                sort_time, sorted_rows = await _timed(
+                    conn, f"SELECT DISTINCT rank FROM {table} ORDER BY rank"
+                )
+                build_time, _ = await _timed(
+                    conn, f"CREATE INDEX ix_{table} ON {table} (list_id, rank)"
+                )
+                scan_time = 0.0
+                for list_id in list_ids[:200]:
+                    elapsed, _ = await _timed(
+                        conn,
+                        f"SELECT rank FROM {table} WHERE list_id = :l ORDER BY rank",
+                        {"l": list_id},
+                    )
+                    scan_time += elapsed
+            matches = [row[0] for row in sorted_rows] == expected
+            print(
+                f"{name:>6}: sort {sort_time * 1000:8.1f} ms | "
+                f"index build {build_time * 1000:8.1f} ms | "
+                f"200 list scans {scan_time * 1000:8.1f} ms | "
+                f"matches Python order: {matches}"
+            )
+    finally:
+        async with engine.begin() as conn:
+            for name in collations:
+                await conn.execute(text(f"DROP TABLE IF EXISTS bench_rank_{name.lower()}"))
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--locale", default=None, help="e.g. en_US.utf8 or en-US-x-icu")
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.rows, args.locale))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Board detail response formats: size and latency.
+
+Seeds a scratch board like benchmarks.board_detail, then for each variant
+loads it through board_service.get_board_detail, projects it and encodes it
+as the API does, and reports:
+
+- bytes on the wire (uncompressed);
+- server time per request (queries, projection and encoding);
+- client decode time (json.loads or msgpack.unpackb).
+
+Variants cover the full payload, summary mode and an integration-style
+sparse fieldset (ids, titles and ranks), each as JSON and MessagePack.
+
+    cd backend
+    python -m benchmarks.response_formats --cards 10000
+    python -m benchmarks.response_formats --url sqlite+aiosqlite:///./bench.db
+
+Runs against DATABASE_URL by default; the scratch rows are deleted at the end.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import msgpack
+from pydantic_core import to_json, to_jsonable_python
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.core.config import settings
+from app.core.database import Base
+from app.core.fields import all_fields, parse_fields, project
+from app.schemas.board import BoardDetailOut, BoardSummaryOut
+from app.services import board_service
+from benchmarks.board_detail import delete_board, seed_board
+
+SPARSE = (
+    "id,title,lists.id,lists.title,lists.rank,"
+    "lists.cards.id,lists.cards.title,lists.cards.rank"
+)
+
+VARIANTS = {
+    "full": all_fields(BoardDetailOut),
+    "summary": all_fields(BoardSummaryOut),
+    "sparse": parse_fields(SPARSE, BoardDetailOut),
+}
+ENCODERS = {
+    "json": (to_json, json.loads),
+    "msgpack": (
+        lambda content: msgpack.packb(to_jsonable_python(content)),
+        msgpack.unpackb,
+    ),
+}
+
+
+async def _run(url: str, lists: int, cards: int, requests: int) -> None:
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_id, board_id = await seed_board(session_factory, lists, cards)
+    try:
+        print(f"{cards:,} cards in {lists} lists, {requests} requests per variant")
+        baseline = None
+        for variant, tree in VARIANTS.items():
+            for encoding, (encode, decode) in ENCODERS.items():
+                server = decode_time = 0.0
+                for n in range(requests + 1):  # the first request warms up
+                    started = time.perf_counter()
+                    async with session_factory() as db:
+                        board = await board_service.get_board_detail(
+                            db, board_id, user_id, fields=tree
+                        )
+                    body = encode(project(board, tree))
+                    encoded = time.perf_counter()
+                    decode(body)
+                    decoded = time.perf_counter()
+                    if n:
+                        server += encoded - started
+                        decode_time += decoded - encoded
+                baseline = baseline or len(body)
+                print(
+                    f"{variant:>8} {encoding:<8}: {len(body):>10,} bytes "
+                    f"({len(body) / baseline:5.0%}) | "
+                    f"server {server / requests * 1000:7.1f} ms | "
+                    f"decode {decode_time / requests * 1000:6.1f} ms"
+                )
+    finally:
+        await delete_board(session_factory, user_id, board_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--lists", type=int, default=10)
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.lists, args.cards, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Insert throughput and index size: UUIDv4 vs UUIDv7 primary keys.
+
+Creates two scratch tables shaped like `cards` (uuid primary key plus an
+indexed `board_id` foreign key column), fills each with the same number of
+rows using one id generator, and reports rows/s per phase and the final
+btree sizes. Boards are drawn from a sliding window of recently created
+boards, as in real traffic, so the `board_id` index sees the same
+locality difference as the primary key.
+
+    cd backend
+    python -m benchmarks.uuid_insert --rows 3000000
+    python -m benchmarks.uuid_insert --url sqlite+aiosqlite:///./bench.db --rows 200000
+
+Runs against DATABASE_URL by default. The scratch tables are dropped at the
+end. Index sizes are only reported on PostgreSQL.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import deque
+
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, Uuid, func, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.ids import uuid7
+
+GENERATORS = {"v4": uuid.uuid4, "v7": uuid7}
+ROWS_PER_BOARD = 200
+ACTIVE_BOARDS = 50
+
+
+def _table(metadata: MetaData, name: str) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", Uuid, primary_key=True),
+        Column("board_id", Uuid, nullable=False),
+        Column("title", String(255), nullable=False),
+        Column("created_at", DateTime(timezone=True), server_default=func.now()),
+        Index(f"ix_{name}_board_id", "board_id"),
+    )
+
+
+def _batches(generate, rows: int, batch_size: int):
+    boards: deque[uuid.UUID] = deque(maxlen=ACTIVE_BOARDS)
+    batch = []
+    for n in range(rows):
+        if n % ROWS_PER_BOARD == 0:
+            boards.append(generate())
+        batch.append(
+            {"id": generate(), "board_id": random.choice(boards), "title": f"Card {n}"}
+        )
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _run(url: str, rows: int, batch_size: int, report_every: int) -> None:
+    engine = create_async_engine(url)
+    metadata = MetaData()
+    tables = {version: _table(metadata, f"bench_uuid_{version}") for version in GENERATORS}
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    try:
+        for version, generate in GENERATORS.items():
+            table = tables[version]
+            inserted = 0
+            started = phase_started = time.perf_counter()
+            for batch in _batches(generate, rows, batch_size):
+                async with engine.begin() as conn:
+                    await conn.execute(table.insert(), batch)
+                inserted += len(batch)
+                if inserted % report_every < batch_size:
+                    now = time.perf_counter()
+                    rate = report_every / (now - phase_started)
+                    print(f"{version}: {inserted:>10,} rows  {rate:>10,.0f} rows/s (last phase)")
+                    phase_started = now
+            elapsed = time.perf_counter() - started
+            print(f"{version}: {rows:,} rows in {elapsed:.1f}s = {rows / elapsed:,.0f} rows/s")
+
+            if engine.dialect.name == "postgresql":
+                async with engine.connect() as conn:
+                    for index in (f"{table.name}_pkey", f"ix_{table.name}_board_id"):
+                        size = await conn.scalar(
+                            text("SELECT pg_size_pretty(pg_relation_size(CAST(:i AS regclass)))"),
+                            {"i": index},
+                        )
+                        print(f"{version}: {index} = {size}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--report-every", type=int, default=500_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.rows, args.batch_size, args.report_every))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Recompute lists.card_count from the cards table.
+
+The counts are maintained incrementally by the card services; this repairs
+any drift (e.g. after manual SQL or a restored backup) with one set-based
+UPDATE per run and prints how many lists were corrected.
+
+    cd backend
+    python -m scripts.repair_card_counts
+    python -m scripts.repair_card_counts --board 018f2c1e-...
+
+Runs against DATABASE_URL by default. Prefer a quiet period: a list whose
+cards change while the UPDATE runs may be left off by one until the next
+run.
+"""
+import argparse
+import asyncio
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.services.list_service import repair_card_counts
+
+
+async def _run(url: str, board_id: uuid.UUID | None) -> None:
+    engine = create_async_engine(url)
+    try:
+        async with AsyncSession(engine) as session:
+            fixed = await repair_card_counts(session, board_id)
+            await session.commit()
+    finally:
+        await engine.dispose()
+    scope = f"board {board_id}" if board_id else "all boards"
+    print(f"{scope}: corrected card_count on {fixed} list(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--board", type=uuid.UUID, default=None, help="only this board")
+    args = parser.parse_args()
+    asyncio.run(_run(args.url, args.board))
+
+
+if __name__ == "__main__":
+    main()
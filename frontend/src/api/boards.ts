@@ -1,9 +1,12 @@
 import client from './client';
-import type { Board, BoardDetail } from '../types';
+import type { Board, BoardDetail, BoardSummary } from '../types';
 
 export const boardsApi = {
     getAll: () => client.get<Board[]>('/boards/'),
     getDetail: (id: string) => client.get<BoardDetail>(`/boards/${id}`),
+    // Titles only; load descriptions per card with cardsApi.get
+    getSummary: (id: string) =>
+        client.get<BoardSummary>(`/boards/${id}`, { params: { mode: 'summary' } }),
     create: (data: { title: string; description?: string }) =>
         client.post<BoardDetail>('/boards/', data),
     update: (id: string, data: { title?: string; description?: string }) =>
@@ -2,11 +2,19 @@ import client from './client';
 import type { Card, MoveCardPayload } from '../types';
 
 export const cardsApi = {
+    get: (cardId: string, boardId: string) =>
+        client.get<Card>(`/cards/${cardId}`, { params: { board_id: boardId } }),
     create: (data: { title: string; list_id: string; board_id: string }) =>
         client.post<Card>('/cards/', data),
-    update: (cardId: string, data: { title?: string; description?: string }) =>
-        client.patch<Card>(`/cards/${cardId}`, data),
-    move: (cardId: string, payload: MoveCardPayload) =>
-        client.post<Card>(`/cards/${cardId}/move`, payload),
-    delete: (cardId: string) => client.delete(`/cards/${cardId}`),
+    // board_id lets the server prune straight to the card's partition
+    update: (cardId: string, data: { title?: string; description?: string }, boardId: string) =>
+        client.patch<Card>(`/cards/${cardId}`, data, { params: { board_id: boardId } }),
+    move: (cardId: string, payload: MoveCardPayload, boardId: string) =>
+        client.post<Card>(`/cards/${cardId}/move`, payload, { params: { board_id: boardId } }),
+    // Cards land in the target list (on any of the user's boards) in this order;
+    // boardIds are the boards the cards are on now
+    moveMany: (cardIds: string[], boardIds: string[], payload: MoveCardPayload) =>
+        client.post<Card[]>('/cards/move', { card_ids: cardIds, board_ids: boardIds, ...payload }),
+    delete: (cardId: string, boardId: string) =>
+        client.delete(`/cards/${cardId}`, { params: { board_id: boardId } }),
 };
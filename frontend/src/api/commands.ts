@@ -0,0 +1,116 @@
+import client from './client';
+import { cardsApi } from './cards';
+import type { Card, CommandAck, MoveCardPayload } from '../types';
+
+type CommandOp = 'card.create' | 'card.update' | 'card.move';
+
+interface PendingCommand {
+    resolve: (card: Card) => void;
+    reject: (error: CommandError) => void;
+}
+
+export class CommandError extends Error {
+    status: number;
+
+    constructor(message: string, status: number) {
+        super(message);
+        this.status = status;
+    }
+}
+
+function commandsUrl(boardId: string, token: string): string {
+    const url = new URL(client.defaults.baseURL || '/api/v1', window.location.href);
+    url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+    url.pathname = `${url.pathname.replace(/\/$/, '')}/boards/${boardId}/commands`;
+    url.search = `?token=${encodeURIComponent(token)}`;
+    return url.toString();
+}
+
+/**
+ * Persistent mutation channel for one board.
+ *
+ * Authenticates once when the socket opens; commands are pipelined with
+ * increasing sequence numbers and resolved when the matching ack arrives.
+ * Falls back to the HTTP endpoints while the socket is not open.
+ */
+export class BoardCommandChannel {
+    private readonly boardId: string;
+    private socket: WebSocket | null = null;
+    private seq = 0;
+    private pending = new Map<number, PendingCommand>();
+
+    constructor(boardId: string) {
+        this.boardId = boardId;
+    }
+
+    connect(): void {
+        const token = localStorage.getItem('token');
+        if (!token) return;
+
+        const socket = new WebSocket(commandsUrl(this.boardId, token));
+        socket.onmessage = (event) => this.handleAck(JSON.parse(event.data) as CommandAck);
+        socket.onclose = () => {
+            if (this.socket === socket) this.socket = null;
+            this.failPending();
+        };
+        this.socket = socket;
+    }
+
+    close(): void {
+        const socket = this.socket;
+        this.socket = null;
+        socket?.close();
+        this.failPending();
+    }
+
+    create(data: { title: string; list_id: string }): Promise<Card> {
+        return this.send('card.create', null, data, () =>
+            cardsApi.create({ ...data, board_id: this.boardId })
+        );
+    }
+
+    update(cardId: string, data: { title?: string; description?: string }): Promise<Card> {
+        return this.send('card.update', cardId, data, () => cardsApi.update(cardId, data, this.boardId));
+    }
+
+    move(cardId: string, payload: MoveCardPayload): Promise<Card> {
+        return this.send('card.move', cardId, payload, () => cardsApi.move(cardId, payload, this.boardId));
+    }
+
+    private send(
+        op: CommandOp,
+        cardId: string | null,
+        data: object,
+        fallback: () => Promise<{ data: Card }>
+    ): Promise<Card> {
+        const socket = this.socket;
+        if (!socket || socket.readyState !== WebSocket.OPEN) {
+            return fallback().then((response) => response.data);
+        }
+
+        const seq = ++this.seq;
+        return new Promise<Card>((resolve, reject) => {
+            this.pending.set(seq, { resolve, reject });
+            socket.send(JSON.stringify({ seq, op, card_id: cardId, data }));
+        });
+    }
+
+    private handleAck(ack: CommandAck): void {
+        const command = this.pending.get(ack.seq);
+        if (!command) return;
+        this.pending.delete(ack.seq);
+
+        if (ack.ok && ack.result) {
+            command.resolve(ack.result);
+        } else {
+            command.reject(new CommandError(ack.detail ?? 'Command failed', ack.status ?? 500));
+        }
+    }
+
+    private failPending(): void {
+        for (const command of this.pending.values()) {
+            command.reject(new CommandError('Connection closed', 0));
+        }
+        this.pending.clear();
+    }
+}
@@ -5,12 +5,15 @@ interface ListCreatePayload {
     title: string;
     board_id: string;
     after_rank?: string | null;
+    wip_limit?: number | null;
 }
 
 export const listsApi = {
     create: (data: ListCreatePayload) =>
         client.post<List>('/lists/', data),
-    update: (listId: string, data: { title?: string }) =>
+    update: (listId: string, data: { title?: string; wip_limit?: number | null }) =>
         client.patch<List>(`/lists/${listId}`, data),
+    move: (listId: string, data: { before_rank: string | null; after_rank: string | null }) =>
+        client.post<List>(`/lists/${listId}/move`, data),
     delete: (listId: string) => client.delete(`/lists/${listId}`),
 };
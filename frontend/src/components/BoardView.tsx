@@ -1,4 +1,4 @@
-import { useEffect, useState, useCallback } from 'react';
+import { useEffect, useRef, useState, useCallback } from 'react';
 import {
     DndContext,
     DragEndEvent,
@@ -20,7 +20,7 @@ import CardItem from './CardItem';
 import BoardSkeleton from './Skeleton';
 import { toast } from './Toast';
 import { boardsApi } from '../api/boards';
-import { cardsApi } from '../api/cards';
+import { BoardCommandChannel } from '../api/commands';
 import { listsApi } from '../api/lists';
 import { useBoardStore } from '../store/boardStore';
 import { lexoRankBetween } from '../utils/lexorank';
@@ -70,6 +70,18 @@ export default function BoardView({ boardId }: BoardViewProps) {
         fetchBoard();
     }, [fetchBoard]);
 
+    // One authenticated socket per board for drag-and-drop mutations
+    const channelRef = useRef<BoardCommandChannel | null>(null);
+    useEffect(() => {
+        const channel = new BoardCommandChannel(boardId);
+        channel.connect();
+        channelRef.current = channel;
+        return () => {
+            channel.close();
+            channelRef.current = null;
+        };
+    }, [boardId]);
+
     const findListByCardId = (cardId: string): string | null => {
         if (!board) return null;
         for (const list of board.lists) {
@@ -155,14 +167,15 @@ export default function BoardView({ boardId }: BoardViewProps) {
             targetIndex
         );
 
-        // API call (async, non-blocking)
+        // Pipelined over the board socket (HTTP fallback), async, non-blocking
+        const channel = channelRef.current ?? new BoardCommandChannel(boardId);
         try {
-            const updated = await cardsApi.move(active.id as string, {
+            const updated = await channel.move(active.id as string, {
                 list_id: destListId,
                 before_rank: beforeRank,
                 after_rank: afterRank,
             });
-            syncCard(updated.data);
+            syncCard(updated);
         } catch {
             // ROLLBACK on failure
             rollbackCard(snapshot);
@@ -49,7 +49,7 @@ export default function ListColumn({ list, boardId, onDeleteList }: ListColumnPr
 
     const handleDeleteCard = async (cardId: string, listId: string) => {
         try {
-            await cardsApi.delete(cardId);
+            await cardsApi.delete(cardId, boardId);
             removeCard(cardId, listId);
         } catch {
             console.error('Failed to delete card');
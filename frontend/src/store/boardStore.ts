@@ -1,11 +1,14 @@
 import { create } from 'zustand';
-import type { BoardDetail, Card } from '../types';
+import type { BoardDetail, Card, List } from '../types';
 
 interface BoardStore {
     board: BoardDetail | null;
     isLoading: boolean;
     error: string | null;
 
+    // Unacknowledged optimistic moves per card id
+    pendingMoves: Record<string, number>;
+
     setBoard: (board: BoardDetail) => void;
     setLoading: (loading: boolean) => void;
     setError: (error: string | null) => void;
@@ -22,7 +25,9 @@ interface BoardStore {
     // Rollback if API fails: restore previous state
     rollbackCard: (previousBoard: BoardDetail) => void;
 
-    // Sync card after API success: update rank from server response
+    // Sync card after API success: update rank from server response.
+    // While later moves of the same card are still in flight, the ack is
+    // ignored so an older server state never overwrites a newer optimistic one.
     syncCard: (updatedCard: Card) => void;
 
     // Add a card to a list
@@ -32,15 +37,16 @@ interface BoardStore {
     removeCard: (cardId: string, listId: string) => void;
 
     // Add a list
-    addList: (list: { id: string; title: string; rank: string; board_id: string; cards: Card[] }) => void;
+    addList: (list: List) => void;
 }
 
 export const useBoardStore = create<BoardStore>((set) => ({
     board: null,
     isLoading: false,
     error: null,
+    pendingMoves: {},
 
-    setBoard: (board) => set({ board, isLoading: false, error: null }),
+    setBoard: (board) => set({ board, isLoading: false, error: null, pendingMoves: {} }),
     setLoading: (isLoading) => set({ isLoading }),
     setError: (error) => set({ error, isLoading: false }),
 
@@ -70,16 +76,29 @@ export const useBoardStore = create<BoardStore>((set) => ({
             // Re-sort by rank
             destList.cards.sort((a, b) => a.rank.localeCompare(b.rank));
 
-            return { board };
+            const pendingMoves = {
+                ...state.pendingMoves,
+                [cardId]: (state.pendingMoves[cardId] ?? 0) + 1,
+            };
+
+            return { board, pendingMoves };
         }),
 
     rollbackCard: (previousBoard) =>
-        set({ board: JSON.parse(JSON.stringify(previousBoard)) }),
+        set({ board: JSON.parse(JSON.stringify(previousBoard)), pendingMoves: {} }),
 
     syncCard: (updatedCard) =>
         set((state) => {
             if (!state.board) return state;
 
+            const remaining = (state.pendingMoves[updatedCard.id] ?? 1) - 1;
+            const pendingMoves = { ...state.pendingMoves };
+            if (remaining > 0) {
+                pendingMoves[updatedCard.id] = remaining;
+                return { pendingMoves };
+            }
+            delete pendingMoves[updatedCard.id];
+
             const board = JSON.parse(JSON.stringify(state.board)) as BoardDetail;
 
             for (const list of board.lists) {
@@ -92,7 +111,7 @@ export const useBoardStore = create<BoardStore>((set) => ({
                 }
             }
 
-            return { board };
+            return { board, pendingMoves };
         }),
 
     addCard: (card) =>
@@ -18,6 +18,8 @@ export interface List {
     title: string;
     rank: string;
     board_id: string;
+    card_count: number;
+    wip_limit: number | null;
     cards: Card[];
 }
 
@@ -33,12 +35,26 @@ export interface BoardDetail extends Board {
     lists: List[];
 }
 
+// Board detail with ?mode=summary: cards come without descriptions
+export interface BoardSummary extends Board {
+    lists: (Omit<List, 'cards'> & { cards: Omit<Card, 'description'>[] })[];
+}
+
 export interface MoveCardPayload {
     list_id: string;
     before_rank: string | null;
     after_rank: string | null;
 }
 
+export interface CommandAck {
+    type: 'ack';
+    seq: number;
+    ok: boolean;
+    result?: Card | null;
+    status?: number | null;
+    detail?: string | null;
+}
+
 export interface Token {
     access_token: string;
     token_type: string;
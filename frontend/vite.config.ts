@@ -16,6 +16,7 @@ export default defineConfig({
             '/api': {
                 target: proxyTarget,
                 changeOrigin: true,
+                ws: true,
             },
         },
     },